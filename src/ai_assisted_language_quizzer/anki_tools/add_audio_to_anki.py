@@ -110,7 +110,19 @@ class AnkiConnector:
             List of note information dictionaries
         """
         return self.invoke("notesInfo", notes=note_ids)
-    
+
+    def notes_mod_time(self, note_ids: List[int]) -> List[Dict]:
+        """
+        Get modification times of notes, without their fields.
+
+        Args:
+            note_ids: List of note IDs
+
+        Returns:
+            List of {"noteId": id, "mod": seconds since epoch} dictionaries
+        """
+        return self.invoke("notesModTime", notes=note_ids)
+
     def update_note_fields(
         self, 
         note_id: int, 
@@ -9,27 +9,65 @@ __version__ = "1.0.0"
 __author__ = "AI Language Quizzer Project"
 
 from . import translator
+from .archive_reader import ArchiveReader, SubtitleSource
+from .compact_lexicon import CompactLexicon
+from .count_min_sketch import CountMinSketch
+from .cue_deduplicator import CueDeduplicator
+from .cue_filter import CueFilter
+from .cue_table import Cue, CueTable
+from .directory_watcher import DirectoryWatcher
+from .dispersion_index import DispersionIndex
 from .english_word_filter import EnglishWordFilter
+from .filter_chain import FilterChain
 from .frequency_analyzer import FrequencyAnalyzer
+from .frequency_index import FrequencyIndex
+from .known_words_index import KnownWordsIndex
 from .lemma_grouper import LemmaGroup, LemmaGrouper
 from .llm_curator import CuratedWord, LLMCurator
+from .numpy_backend import NumpyBackend
+from .parse_cache import ParseCache
+from .pattern_set import PatternSet
 from .pronoun_context import PronounContextHelper
 from .report_generator import ReportGenerator
-from .srt_parser import SRTParser
+from .sentence_builder import Sentence, SentenceBuilder
+from .space_saving import SpaceSaving
+from .srt_parser import FileTokens, SRTParser
+from .vocabulary import Vocabulary
 from .stopword_manager import StopWordManager
 from .word_processor import WordProcessor
 
 __all__ = [
     "SRTParser",
+    "Cue",
+    "CueTable",
+    "FileTokens",
+    "Sentence",
+    "SentenceBuilder",
+    "ArchiveReader",
+    "SubtitleSource",
+    "DirectoryWatcher",
+    "CueDeduplicator",
+    "CueFilter",
     "WordProcessor",
     "StopWordManager",
     "EnglishWordFilter",
+    "CompactLexicon",
+    "FilterChain",
+    "PatternSet",
+    "KnownWordsIndex",
     "FrequencyAnalyzer",
+    "FrequencyIndex",
+    "DispersionIndex",
+    "NumpyBackend",
+    "CountMinSketch",
+    "SpaceSaving",
     "ReportGenerator",
     "LemmaGrouper",
     "LemmaGroup",
     "LLMCurator",
     "CuratedWord",
+    "ParseCache",
+    "Vocabulary",
     "translator",
     "PronounContextHelper",
 ]
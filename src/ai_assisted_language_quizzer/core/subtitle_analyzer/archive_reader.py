@@ -0,0 +1,112 @@
+"""
+Archive Reader Module
+
+Reads subtitle files straight out of .zip, .tar(.gz/.bz2/.xz) and .gz
+archives without extracting them to disk.
+"""
+
+import fnmatch
+import gzip
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Optional
+
+
+@dataclass
+class SubtitleSource:
+    """A subtitle file on disk, or a member read from an archive."""
+    name: str                      # "file.srt" or "archive.zip!member.srt"
+    path: Path                     # the file itself, or the archive it came from
+    data: Optional[bytes] = None   # member contents; None for plain files
+
+
+class ArchiveReader:
+    """Stream subtitle members out of compressed archives."""
+
+    TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+    MEMBER_SEPARATOR = "!"
+
+    def is_archive(self, path: Path) -> bool:
+        """
+        Check whether a path names a supported archive.
+
+        Args:
+            path: File path to check
+
+        Returns:
+            True for .zip, .gz and tar archives
+        """
+        name = path.name.lower()
+        return name.endswith((".zip", ".gz") + self.TAR_SUFFIXES)
+
+    def iter_members(self, archive: Path, pattern: str = "*.srt") -> Iterator[SubtitleSource]:
+        """
+        Yield archive members matching a pattern, one at a time.
+
+        Members are yielded in sorted member-name order and read lazily,
+        so only one member's bytes are in memory at a time.
+
+        Args:
+            archive: Path to the archive
+            pattern: Pattern matched against each member's base name
+
+        Returns:
+            Iterator of SubtitleSource records carrying the member bytes
+        """
+        name = archive.name.lower()
+        if name.endswith(".zip"):
+            yield from self._iter_zip(archive, pattern)
+        elif name.endswith(self.TAR_SUFFIXES):
+            yield from self._iter_tar(archive, pattern)
+        else:
+            yield from self._iter_gzip(archive, pattern)
+
+    def member_name(self, archive: Path, member: str) -> str:
+        """Build the "archive!member" display name used in results and errors."""
+        return f"{archive.name}{self.MEMBER_SEPARATOR}{member}"
+
+    def _matches(self, member: str, pattern: str) -> bool:
+        """Match a member's base name against the file pattern."""
+        return fnmatch.fnmatch(PurePosixPath(member).name, pattern)
+
+    def _iter_zip(self, archive: Path, pattern: str) -> Iterator[SubtitleSource]:
+        """Yield matching members of a zip archive."""
+        with zipfile.ZipFile(archive) as zf:
+            members = sorted(
+                info.filename
+                for info in zf.infolist()
+                if not info.is_dir() and self._matches(info.filename, pattern)
+            )
+            for member in members:
+                yield SubtitleSource(
+                    self.member_name(archive, member), archive, zf.read(member)
+                )
+
+    def _iter_tar(self, archive: Path, pattern: str) -> Iterator[SubtitleSource]:
+        """
+        Yield matching members of a (possibly compressed) tar archive.
+
+        Member headers are indexed first, without keeping any contents;
+        each member is then read when it is yielded. Tarballs stored in
+        name order (the usual case) are read with forward seeks only.
+        """
+        with tarfile.open(archive, "r:*") as tf:
+            members = [
+                info for info in tf.getmembers()
+                if info.isfile() and self._matches(info.name, pattern)
+            ]
+            # Tar members come in storage order; sort them like directory files
+            for info in sorted(members, key=lambda info: info.name):
+                data = tf.extractfile(info).read()
+                yield SubtitleSource(self.member_name(archive, info.name), archive, data)
+
+    def _iter_gzip(self, archive: Path, pattern: str) -> Iterator[SubtitleSource]:
+        """Yield the single file inside a plain .gz archive."""
+        member = archive.name[: -len(".gz")]
+        if not fnmatch.fnmatch(member, pattern):
+            return
+        with gzip.open(archive, "rb") as f:
+            data = f.read()
+        yield SubtitleSource(self.member_name(archive, member), archive, data)
@@ -0,0 +1,237 @@
+"""
+Compact Lexicon Module
+
+Stores a large word list as a minimal acyclic automaton (DAFSA) over UTF-8
+bytes in one flat file. The file is memory-mapped rather than loaded, so
+opening a 100k-word lexicon takes milliseconds and the pages are shared by
+every process that opens it. Membership checks walk one edge per byte.
+
+File layout (little-endian):
+    header      magic, version, node count, edge count, word count, root
+    first_edge  uint32 per node, plus an end sentinel: the node's edge range
+    targets     uint32 per edge: node the edge leads to
+    labels      byte per edge: UTF-8 byte consumed by the edge
+    finals      byte per node: 1 if a word ends at the node
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class CompactLexicon:
+    """Memory-mapped, read-only word set built from a plain text word list."""
+
+    MAGIC = b"LEX\x00"
+    VERSION = 1
+    HEADER = struct.Struct("<4sIIIII")
+
+    # One-byte search needles for mmap.find(), indexed by byte value
+    _NEEDLES = tuple(bytes((value,)) for value in range(256))
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open a lexicon file written by build().
+
+        Args:
+            path: Path to the .lex file
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, node_count, edge_count, word_count, root = self.HEADER.unpack_from(self._mm)
+        if magic != self.MAGIC or version != self.VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a version {self.VERSION} lexicon file: {self.path}")
+
+        self._word_count = word_count
+        self._root = root
+        offset = self.HEADER.size
+        self._first_edge = self._uint32_view(offset, node_count + 1)
+        offset += 4 * (node_count + 1)
+        self._targets = self._uint32_view(offset, edge_count)
+        offset += 4 * edge_count
+        self._labels_offset = offset
+        offset += edge_count
+        self._finals = memoryview(self._mm)[offset:offset + node_count]
+
+    def _uint32_view(self, offset: int, count: int) -> Any:
+        """Zero-copy uint32 view of the mapping (a copy on big-endian hosts)."""
+        view = memoryview(self._mm)[offset:offset + 4 * count].cast("I")
+        if sys.byteorder == "little":
+            return view
+        values = array("I", view)
+        view.release()
+        values.byteswap()
+        return values
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        first_edge = self._first_edge
+        targets = self._targets
+        find = self._mm.find
+        needles = self._NEEDLES
+        labels_offset = self._labels_offset
+        node = self._root
+        mm = self._mm
+        for byte in word.encode("utf-8"):
+            start = first_edge[node]
+            end = first_edge[node + 1]
+            if end - start == 1:
+                # Chains of single-edge nodes are common in suffixes
+                if mm[labels_offset + start] != byte:
+                    return False
+                node = targets[start]
+                continue
+            # Edges of a node are contiguous, so one C-level scan finds the label
+            position = find(needles[byte], labels_offset + start, labels_offset + end)
+            if position < 0:
+                return False
+            node = targets[position - labels_offset]
+        return bool(self._finals[node])
+
+    def __len__(self) -> int:
+        return self._word_count
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield every word in UTF-8 byte order."""
+        stack: List[Tuple[int, bytes]] = [(self._root, b"")]
+        while stack:
+            node, prefix = stack.pop()
+            if self._finals[node]:
+                yield prefix.decode("utf-8")
+            start, end = self._first_edge[node], self._first_edge[node + 1]
+            labels = self._mm[self._labels_offset + start:self._labels_offset + end]
+            for index in range(end - start - 1, -1, -1):
+                stack.append((self._targets[start + index], prefix + labels[index:index + 1]))
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        for view in (self._first_edge, self._targets, self._finals):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mm.close()
+
+    def __enter__(self) -> "CompactLexicon":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def read_word_list(path: Path) -> List[str]:
+        """
+        Read a plain text word list: one word per line, # comments allowed.
+
+        Args:
+            path: Path to the text file
+
+        Returns:
+            Lowercased words in file order
+        """
+        words = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    words.append(line.lower())
+        return words
+
+    @classmethod
+    def build(cls, words: Iterable[str], path: Path) -> int:
+        """
+        Write a lexicon file for a set of words.
+
+        Uses incremental construction over the sorted words, merging
+        equivalent suffixes as it goes, so the automaton is minimal and
+        never held unminimized in memory.
+
+        Args:
+            words: Words to store (duplicates and empty strings are ignored)
+            path: Output .lex file path
+
+        Returns:
+            Number of distinct words stored
+        """
+        keys = sorted({word.encode("utf-8") for word in words if word})
+        register: Dict[Tuple[bool, Tuple[Tuple[int, int], ...]], int] = {}
+        finals = bytearray()
+        node_edges: List[Tuple[Tuple[int, int], ...]] = []
+
+        def freeze(node: List[Any]) -> int:
+            """Replace a finished node with its registered equivalent's id."""
+            key = (node[0], tuple(node[1].items()))
+            node_id = register.get(key)
+            if node_id is None:
+                node_id = register[key] = len(node_edges)
+                node_edges.append(key[1])
+                finals.append(1 if node[0] else 0)
+            return node_id
+
+        def minimize(path_nodes: List[Tuple[List[Any], int, List[Any]]], depth: int) -> None:
+            """Freeze the path below depth, replacing children by node ids."""
+            while len(path_nodes) > depth:
+                parent, label, child = path_nodes.pop()
+                parent[1][label] = freeze(child)
+
+        root: List[Any] = [False, {}]  # [is_final, {label: child node or id}]
+        path_nodes: List[Tuple[List[Any], int, List[Any]]] = []
+        previous = b""
+        for key in keys:
+            common = 0
+            for a, b in zip(key, previous):
+                if a != b:
+                    break
+                common += 1
+            minimize(path_nodes, common)
+            node = path_nodes[-1][2] if path_nodes else root
+            for label in key[common:]:
+                child: List[Any] = [False, {}]
+                node[1][label] = child
+                path_nodes.append((node, label, child))
+                node = child
+            node[0] = True
+            previous = key
+        minimize(path_nodes, 0)
+        root_id = freeze(root)
+
+        cls._write(path, node_edges, finals, len(keys), root_id)
+        return len(keys)
+
+    @classmethod
+    def _write(
+        cls,
+        path: Path,
+        node_edges: List[Tuple[Tuple[int, int], ...]],
+        finals: bytearray,
+        word_count: int,
+        root: int
+    ) -> None:
+        """Serialize frozen nodes into the flat file layout."""
+        first_edge = array("I", [0])
+        targets = array("I")
+        labels = bytearray()
+        for edges in node_edges:
+            for label, target in edges:
+                labels.append(label)
+                targets.append(target)
+            first_edge.append(len(targets))
+        if sys.byteorder != "little":
+            first_edge.byteswap()
+            targets.byteswap()
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(
+                cls.MAGIC, cls.VERSION, len(node_edges), len(targets), word_count, root
+            ))
+            first_edge.tofile(f)
+            targets.tofile(f)
+            f.write(labels)
+            f.write(finals)
@@ -0,0 +1,94 @@
+"""
+Count-Min Sketch Module
+
+Fixed-size table of counters giving an upper-bound estimate of any word's
+count, no matter how many distinct words are added.
+
+Error bound: with width w and depth d, after adding N occurrences an
+estimate exceeds the true count by at most (e / w) * N with probability
+at least 1 - e^-d, and is never below it. Memory is 8 * w * d bytes.
+"""
+
+import math
+import zlib
+from array import array
+from typing import List
+
+
+class CountMinSketch:
+    """Approximate word counts in a fixed width x depth table."""
+
+    # Seed of the second hash; each row's index is h1 + row * h2 (mod width)
+    SECOND_HASH_SEED = 0x9E3779B9
+
+    def __init__(self, width: int = 1 << 20, depth: int = 4) -> None:
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width: Counters per row; error is about 2.7 * N / width
+            depth: Number of rows; failure probability is e^-depth
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("Sketch width and depth must be at least 1")
+        self.width = width
+        self.depth = depth
+        self.total = 0  # occurrences added so far (N)
+        self._table = array("q", bytes(8 * width * depth))
+
+    def _cells(self, word: str) -> List[int]:
+        """Table positions of a word, one per row."""
+        data = word.encode("utf-8")
+        first = zlib.crc32(data)
+        second = zlib.crc32(data, self.SECOND_HASH_SEED) | 1
+        width = self.width
+        return [row * width + (first + row * second) % width for row in range(self.depth)]
+
+    def add(self, word: str, count: int = 1) -> int:
+        """
+        Add occurrences of a word.
+
+        Uses conservative update: only the smallest counters are raised,
+        which keeps the same bound but lowers the typical error.
+
+        Args:
+            word: Word to count
+            count: Occurrences to add (must be positive)
+
+        Returns:
+            The word's new estimate
+        """
+        table = self._table
+        cells = self._cells(word)
+        target = min(table[cell] for cell in cells) + count
+        for cell in cells:
+            if table[cell] < target:
+                table[cell] = target
+        self.total += count
+        return target
+
+    def estimate(self, word: str) -> int:
+        """
+        Estimate a word's count.
+
+        Args:
+            word: Word to look up
+
+        Returns:
+            Upper bound of the word's count
+        """
+        table = self._table
+        return min(table[cell] for cell in self._cells(word))
+
+    def error_bound(self) -> float:
+        """
+        Get the overestimate bound for the occurrences added so far.
+
+        Returns:
+            (e / width) * total; holds with probability 1 - e^-depth
+        """
+        return math.e * self.total / self.width
+
+    def memory_bytes(self) -> int:
+        """Size of the counter table in bytes."""
+        return self._table.itemsize * len(self._table)
@@ -0,0 +1,215 @@
+"""
+Cue Deduplicator Module
+
+Suppresses cues that repeat across many subtitle files of a series
+(theme-song lyrics, "previously on...", credit lines) so they neither
+inflate word counts nor cost tokenization time.
+"""
+
+import hashlib
+import re
+from array import array
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Sequence, Tuple
+
+
+class CueHashTable:
+    """
+    Compact open-addressing table: 64-bit cue hash -> (file count, first file).
+
+    Keys, counts and owners live in flat arrays (16 bytes per slot), which
+    keeps millions of distinct cues far smaller than a dict of ints.
+    Key 0 marks an empty slot, so hashes must be non-zero.
+    """
+
+    MAX_LOAD = 0.75
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            capacity: Initial slot count, rounded up to a power of two
+        """
+        size = 1
+        while size < capacity:
+            size *= 2
+        self._allocate(size)
+        self._size = 0
+
+    def _allocate(self, size: int) -> None:
+        """Replace the storage with zeroed arrays of the given slot count."""
+        self._keys = array("Q", bytes(8 * size))
+        self._counts = array("I", bytes(4 * size))
+        self._owners = array("I", bytes(4 * size))
+        self._mask = size - 1
+
+    def _slot(self, key: int) -> int:
+        """Find the slot holding key, or the empty slot where it belongs."""
+        keys = self._keys
+        mask = self._mask
+        # Cue hashes are uniformly distributed, so the low bits index directly
+        slot = key & mask
+        while True:
+            stored = keys[slot]
+            if stored == key or stored == 0:
+                return slot
+            slot = (slot + 1) & mask
+
+    def add(self, key: int, file_index: int) -> None:
+        """
+        Count one more file containing a cue.
+
+        Args:
+            key: Non-zero cue hash
+            file_index: Index of the file, recorded the first time key is seen
+        """
+        slot = self._slot(key)
+        if self._keys[slot] == 0:
+            self._keys[slot] = key
+            self._owners[slot] = file_index
+            self._size += 1
+        self._counts[slot] += 1
+        if self._size > self.MAX_LOAD * len(self._keys):
+            self._grow()
+
+    def get(self, key: int) -> Tuple[int, int]:
+        """
+        Look up a cue hash.
+
+        Args:
+            key: Non-zero cue hash
+
+        Returns:
+            Tuple of (file count, first file index); (0, 0) if unseen
+        """
+        slot = self._slot(key)
+        return self._counts[slot], self._owners[slot]
+
+    def items(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield (key, file count, first file index) for every stored hash."""
+        for slot, key in enumerate(self._keys):
+            if key:
+                yield key, self._counts[slot], self._owners[slot]
+
+    def _grow(self) -> None:
+        """Double the slot count and re-insert every entry."""
+        entries = list(self.items())
+        self._allocate(2 * len(self._keys))
+        for key, count, owner in entries:
+            slot = self._slot(key)
+            self._keys[slot] = key
+            self._counts[slot] = count
+            self._owners[slot] = owner
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class CueDeduplicator:
+    """Find cues repeated across more than K files and plan their suppression."""
+
+    MODES = ("once", "drop")
+    NORMALIZE_PATTERN = re.compile(r"[\W_]+")
+
+    def __init__(self, max_files: int = 3, mode: str = "once") -> None:
+        """
+        Initialize deduplicator.
+
+        Args:
+            max_files: Cues found in more than this many files are suppressed
+            mode: "once" keeps a suppressed cue in the first file that
+                contains it; "drop" removes it from every file
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown duplicate cue mode '{mode}', expected one of {self.MODES}")
+        self.max_files = max(1, max_files)
+        self.mode = mode
+        self.table = CueHashTable()
+
+    @classmethod
+    def hash_cue(cls, lines: Sequence[str]) -> int:
+        """
+        Hash a cue's normalized text.
+
+        Case, punctuation, markup symbols and spacing are ignored, so the
+        same lyric line matches across differently formatted files.
+
+        Args:
+            lines: Text lines of one cue
+
+        Returns:
+            Non-zero 64-bit hash, or 0 if the cue has no word characters
+        """
+        text = cls.NORMALIZE_PATTERN.sub(" ", " ".join(lines).lower()).strip()
+        if not text:
+            return 0
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    @classmethod
+    def file_hashes(cls, cue_lines: Iterable[Sequence[str]]) -> array:
+        """
+        Hash every cue of one file.
+
+        Args:
+            cue_lines: Text lines of each cue, in file order
+
+        Returns:
+            Array of distinct non-zero cue hashes
+        """
+        seen = set()
+        for lines in cue_lines:
+            seen.add(cls.hash_cue(lines))
+        seen.discard(0)
+        return array("Q", seen)
+
+    def plan(self, file_hashes: Iterable[array]) -> List[FrozenSet[int]]:
+        """
+        Count cues across files and decide which ones each file skips.
+
+        Args:
+            file_hashes: Result of file_hashes() for every file, in the
+                order the files will be tokenized
+
+        Returns:
+            Set of cue hashes to skip for each file, in the same order
+        """
+        file_hashes = list(file_hashes)
+        for file_index, hashes in enumerate(file_hashes):
+            for key in hashes:
+                self.table.add(key, file_index)
+        return [
+            self._skipped(file_index, hashes)
+            for file_index, hashes in enumerate(file_hashes)
+        ]
+
+    def _skipped(self, file_index: int, hashes: array) -> FrozenSet[int]:
+        """Cue hashes a single file should not tokenize."""
+        skipped = []
+        for key in hashes:
+            count, owner = self.table.get(key)
+            if count <= self.max_files:
+                continue
+            if self.mode == "once" and owner == file_index:
+                continue
+            skipped.append(key)
+        return frozenset(skipped)
+
+    def suppressed_count(self) -> int:
+        """Number of distinct cues found in more than max_files files."""
+        return sum(1 for _, count, _ in self.table.items() if count > self.max_files)
+
+    def top_suppressed(self, samples: Dict[int, str], n: int = 10) -> List[Tuple[str, int]]:
+        """
+        List the most widespread suppressed cues.
+
+        Args:
+            samples: Cue hash -> cue text, collected while tokenizing
+            n: Number of cues to return
+
+        Returns:
+            List of (cue text, file count), most files first
+        """
+        ranked = [(text, self.table.get(key)[0]) for key, text in samples.items()]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:n]
@@ -0,0 +1,49 @@
+"""
+Cue Filter Module
+
+Drops unwanted cues (e.g. Amara.org credit lines) while subtitles are
+parsed, so files never need to be cleaned and rewritten on disk first.
+"""
+
+import re
+from typing import List, Optional
+
+
+class CueFilter:
+    """Match cue text against a set of literal patterns in a single regex pass."""
+
+    # Amara.org community credit lines, used when no patterns are configured
+    DEFAULT_PATTERNS = (
+        "Subtítulos realizados por la comunidad de Amara.org",
+        "Subtítulos por la comunidad de Amara.org",
+    )
+
+    def __init__(self, patterns: List[str]) -> None:
+        """
+        Initialize cue filter.
+
+        Args:
+            patterns: Literal text; a cue containing any of them is removed
+        """
+        self.patterns = list(patterns)
+        # One capture group per pattern, so the matched group tells which
+        # pattern hit without testing them one by one
+        alternation = "|".join(f"({re.escape(pattern)})" for pattern in self.patterns)
+        self._regex = re.compile(alternation) if self.patterns else None
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Find the pattern a cue's text contains.
+
+        Args:
+            text: Cue text (lines joined with newlines)
+
+        Returns:
+            The matching pattern, or None if the cue should be kept
+        """
+        if self._regex is None:
+            return None
+        found = self._regex.search(text)
+        if found is None:
+            return None
+        return self.patterns[found.lastindex - 1]
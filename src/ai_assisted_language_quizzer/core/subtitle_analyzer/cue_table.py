@@ -0,0 +1,169 @@
+"""
+Cue Table Module
+
+Column-oriented, array-backed storage for parsed cues. Timings and file
+ids live in flat arrays and all cue text in one UTF-8 buffer, which takes
+a fraction of the memory of per-line Python strings and pickles as a few
+large byte blocks.
+
+The table is opt-in: parse_directory(), parse_table() and tokenize_table()
+use it to hold a whole parsed corpus, while the analyzer's tokenize path
+streams each file's cues and never keeps them.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+@dataclass(slots=True)
+class Cue:
+    """A single subtitle cue with its timing kept as integer milliseconds."""
+    index: int
+    start_ms: int
+    end_ms: int
+    lines: Tuple[str, ...]
+
+
+class CueTable:
+    """Store cues from many files as arrays plus one text buffer."""
+
+    __slots__ = (
+        "file_names",
+        "_file_ids",
+        "_file_starts",
+        "_indexes",
+        "_starts",
+        "_ends",
+        "_text",
+        "_text_offsets",
+    )
+
+    # Largest SRT index number an array("I") column can hold
+    MAX_INDEX = 0xFFFFFFFF
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.file_names: List[str] = []
+        self._file_ids = array("I")        # per cue: index into file_names
+        self._file_starts = array("I", [0])  # per file: first row, plus end sentinel
+        self._indexes = array("I")         # per cue: SRT index number
+        self._starts = array("I")          # per cue: start time (ms)
+        self._ends = array("I")            # per cue: end time (ms)
+        self._text = bytearray()           # all cue text, UTF-8, lines joined by "\n"
+        self._text_offsets = array("Q", [0])  # per cue: text start, plus end sentinel
+
+    def add_file(self, name: str, cues: Iterable[Cue]) -> int:
+        """
+        Append the cues of one file.
+
+        If iterating the cues raises, the rows already appended for this
+        file are removed before the exception propagates.
+
+        Args:
+            name: Source name (e.g. "file.srt" or "archive.zip!member.srt")
+            cues: Cue records in file order
+
+        Returns:
+            File id of the new file
+        """
+        file_id = len(self.file_names)
+        try:
+            for cue in cues:
+                self._file_ids.append(file_id)
+                self._indexes.append(cue.index)
+                self._starts.append(cue.start_ms)
+                self._ends.append(cue.end_ms)
+                self._text += "\n".join(cue.lines).encode("utf-8")
+                self._text_offsets.append(len(self._text))
+        except Exception:
+            self._truncate()
+            raise
+        self.file_names.append(name)
+        self._file_starts.append(len(self._starts))
+        return file_id
+
+    def _truncate(self) -> None:
+        """Drop rows past the last completed file."""
+        end = self._file_starts[-1]
+        del self._file_ids[end:]
+        del self._indexes[end:]
+        del self._starts[end:]
+        del self._ends[end:]
+        del self._text_offsets[end + 1:]
+        del self._text[self._text_offsets[-1]:]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def file_rows(self, file_id: int) -> range:
+        """
+        Rows belonging to one file.
+
+        Args:
+            file_id: Id returned by add_file()
+
+        Returns:
+            Range of row numbers
+        """
+        return range(self._file_starts[file_id], self._file_starts[file_id + 1])
+
+    def file_id(self, row: int) -> int:
+        """File id of a row."""
+        return self._file_ids[row]
+
+    def timing(self, row: int) -> Tuple[int, int]:
+        """(start_ms, end_ms) of a row."""
+        return self._starts[row], self._ends[row]
+
+    def text(self, row: int) -> str:
+        """Decoded text of a row, lines joined by newlines."""
+        return self._text[self._text_offsets[row]:self._text_offsets[row + 1]].decode("utf-8")
+
+    def lines(self, row: int) -> Tuple[str, ...]:
+        """Text lines of a row."""
+        return tuple(self.text(row).split("\n"))
+
+    def cue(self, row: int) -> Cue:
+        """
+        Rebuild the Cue record for a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Cue with the row's index, timing and lines
+        """
+        return Cue(self._indexes[row], self._starts[row], self._ends[row], self.lines(row))
+
+    def iter_cues(self, file_id: int) -> Iterator[Cue]:
+        """
+        Tokenizer view: stream one file's cues as Cue records.
+
+        Args:
+            file_id: Id returned by add_file()
+
+        Returns:
+            Iterator of Cue records in file order
+        """
+        for row in self.file_rows(file_id):
+            yield self.cue(row)
+
+    def file_lines(self, file_id: int) -> List[str]:
+        """All text lines of one file, as parse_file() returns them."""
+        return [line for row in self.file_rows(file_id) for line in self.lines(row)]
+
+    def as_dict(self) -> Dict[str, List[str]]:
+        """Expand into parse_directory()'s {name: lines} form."""
+        return {
+            name: self.file_lines(file_id)
+            for file_id, name in enumerate(self.file_names)
+        }
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and text buffer."""
+        columns = (
+            self._file_ids, self._file_starts, self._indexes,
+            self._starts, self._ends, self._text_offsets,
+        )
+        return sum(len(column) * column.itemsize for column in columns) + len(self._text)
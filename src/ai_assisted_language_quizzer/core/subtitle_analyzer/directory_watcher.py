@@ -0,0 +1,73 @@
+"""
+Directory Watcher Module
+
+Detects new, changed and removed subtitle files by polling an
+mtime/size manifest, so only those files need to be re-parsed.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .srt_parser import SRTParser
+
+
+class DirectoryWatcher:
+    """Poll a subtitles directory (or archive) for changed files."""
+
+    def __init__(self, parser: SRTParser, root: Path, pattern: str = "*.srt") -> None:
+        """
+        Initialize directory watcher.
+
+        Args:
+            parser: Parser used to list subtitle files and archives
+            root: Directory or archive to watch
+            pattern: File pattern to match (default: "*.srt")
+        """
+        self.parser = parser
+        self.root = Path(root)
+        self.pattern = pattern
+        self.manifest: Dict[Path, Tuple[int, int]] = {}
+
+    def scan(self) -> Dict[Path, Tuple[int, int]]:
+        """
+        Take a (size, mtime_ns) snapshot of every watched file.
+
+        Returns:
+            Dictionary mapping file/archive path to (size, mtime_ns)
+        """
+        try:
+            paths = self.parser.find_files(self.root, self.pattern)
+        except (ValueError, OSError):
+            # Directory is currently empty, or was removed or unmounted;
+            # its files are seen as removed until it comes back
+            paths = []
+
+        snapshot = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                # Deleted between listing and stat; seen as removed next poll
+                continue
+            snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def reset(self) -> None:
+        """Record the current state as the baseline for the next poll."""
+        self.manifest = self.scan()
+
+    def poll(self) -> Tuple[List[Path], List[Path]]:
+        """
+        Compare the directory against the manifest and update it.
+
+        Returns:
+            Tuple of (new or changed paths, removed paths), each sorted
+        """
+        current = self.scan()
+        changed = sorted(
+            path for path, signature in current.items()
+            if self.manifest.get(path) != signature
+        )
+        removed = sorted(path for path in self.manifest if path not in current)
+        self.manifest = current
+        return changed, removed
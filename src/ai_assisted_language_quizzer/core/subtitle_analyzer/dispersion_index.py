@@ -0,0 +1,214 @@
+"""
+Dispersion Index Module
+
+Per-file counts of every word in compressed sparse row (CSR) form: the
+files containing word id w are indices[indptr[w]:indptr[w + 1]], with
+their counts at the same positions in data. Document frequency,
+Juilland's D, Gries' DP and TF-IDF are computed from these arrays for
+all words at once, so a word said 200 times in one episode can rank
+below a word said twice in every episode.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class DispersionIndex:
+    """Record per-file word counts and score how evenly words spread across files."""
+
+    # Usage (ranking score) = frequency x D, or frequency x (1 - DP)
+    MEASURES = ("juilland", "gries")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty index.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("frequency.ranking 'dispersion' requires NumPy: pip install numpy")
+        self._pending: List[Tuple[Any, Any]] = []  # (word ids, counts) per file until build()
+        self._file_sizes: List[int] = []
+        self.indptr: Any = None
+        self.indices: Any = None
+        self.data: Any = None
+        self._scores: Dict[str, Any] = {}
+
+    @staticmethod
+    def available() -> bool:
+        """Whether NumPy can be imported."""
+        return np is not None
+
+    @property
+    def file_count(self) -> int:
+        """Number of non-empty files recorded."""
+        return len(self._file_sizes)
+
+    def add_file(self, word_ids: Sequence[int], counts: Iterable[int]) -> None:
+        """
+        Record one file's word counts.
+
+        Files without tokens are skipped: they would count as files in
+        which every word is missing.
+
+        Args:
+            word_ids: Distinct word ids in the file (e.g. Vocabulary.add_counts() result)
+            counts: Count of each word id, in the same order
+        """
+        ids = np.asarray(word_ids, dtype=np.int64)
+        values = np.fromiter(counts, dtype=np.int64, count=len(ids))
+        size = int(values.sum())
+        if size > 0:
+            self._pending.append((ids, values))
+            self._file_sizes.append(size)
+
+    def build(self, vocabulary_size: int) -> None:
+        """
+        Turn the recorded files into CSR arrays, in O(entries + vocabulary).
+
+        Rows are filled by a counting sort: one pass sizes them, a second
+        writes each file's entries to the next free slot of their rows, so
+        every row lists its files in recording order. Call once, after
+        every add_file().
+
+        Args:
+            vocabulary_size: Number of word ids (rows)
+        """
+        documents = np.zeros(vocabulary_size, dtype=np.int64)
+        for ids, _ in self._pending:
+            documents[ids] += 1  # ids are distinct within a file
+        self.indptr = np.zeros(vocabulary_size + 1, dtype=np.int64)
+        np.cumsum(documents, out=self.indptr[1:])
+        self.indices = np.empty(self.indptr[-1], dtype=np.int32)
+        self.data = np.empty(self.indptr[-1], dtype=np.int64)
+        next_slot = self.indptr[:-1].copy()
+        for file_id, (ids, values) in enumerate(self._pending):
+            slots = next_slot[ids]
+            self.indices[slots] = file_id
+            self.data[slots] = values
+            next_slot[ids] += 1
+        self._pending = []
+        self._scores = {}
+
+    def scores(self) -> Dict[str, Any]:
+        """
+        Compute dispersion measures for every word id, vectorized.
+
+        Returns:
+            Dictionary of float arrays indexed by word id: "frequency",
+            "documents" (files containing the word), "juilland_d" (1 = even
+            spread), "gries_dp" (normalized, 0 = even spread) and "tfidf"
+            (highest per-file rate x log(files / documents))
+        """
+        if self._scores:
+            return self._scores
+        documents = np.diff(self.indptr)
+        rows = np.repeat(np.arange(len(documents)), documents)  # word id of each entry
+        counts = self.data.astype(np.float64)
+        sizes = np.asarray(self._file_sizes, dtype=np.float64)
+        frequency = np.bincount(rows, weights=counts, minlength=len(documents))
+        rates = counts / sizes[self.indices] if len(sizes) else counts
+        idf = np.log(max(len(sizes), 1) / np.maximum(documents, 1))
+        self._scores = {
+            "frequency": frequency,
+            "documents": documents.astype(np.float64),
+            "juilland_d": self._juilland(rows, rates, frequency > 0),
+            "gries_dp": self._gries(rows, counts, sizes, frequency),
+            "tfidf": self._max_per_row(rates * idf[rows], documents),
+        }
+        return self._scores
+
+    def _juilland(self, rows: Any, rates: Any, present: Any) -> Any:
+        """Juilland's D over per-file rates, files without the word included as 0."""
+        n = self.file_count
+        if n < 2:
+            return present.astype(np.float64)
+        mean = np.bincount(rows, weights=rates, minlength=len(present)) / n
+        square_mean = np.bincount(rows, weights=rates * rates, minlength=len(present)) / n
+        deviation = np.sqrt(np.maximum(square_mean - mean * mean, 0.0))
+        variation = np.divide(deviation, mean, out=np.zeros_like(mean), where=present)
+        return np.where(present, np.clip(1.0 - variation / np.sqrt(n - 1), 0.0, 1.0), 0.0)
+
+    def _gries(self, rows: Any, counts: Any, sizes: Any, frequency: Any) -> Any:
+        """Gries' DP normalized to [0, 1]; files without the word add their whole share."""
+        present = frequency > 0
+        if self.file_count < 2:
+            return np.where(present, 0.0, 1.0)
+        shares = sizes / sizes.sum()
+        entry_shares = shares[self.indices]
+        observed = counts / np.where(present, frequency, 1.0)[rows]
+        distance = np.bincount(rows, weights=np.abs(observed - entry_shares), minlength=len(frequency))
+        covered = np.bincount(rows, weights=entry_shares, minlength=len(frequency))
+        dp = 0.5 * (distance + 1.0 - covered) / (1.0 - shares.min())
+        return np.where(present, np.clip(dp, 0.0, 1.0), 1.0)
+
+    def _max_per_row(self, values: Any, documents: Any) -> Any:
+        """Largest entry of each non-empty row; 0 for empty rows."""
+        result = np.zeros(len(documents), dtype=np.float64)
+        non_empty = documents > 0
+        if non_empty.any():
+            # Empty rows have no entries, so consecutive non-empty starts delimit rows
+            result[non_empty] = np.maximum.reduceat(values, self.indptr[:-1][non_empty])
+        return result
+
+    def usage(self, measure: str = "juilland") -> Any:
+        """
+        Get the ranking score of every word id.
+
+        Args:
+            measure: "juilland" (frequency x D) or "gries" (frequency x (1 - DP))
+
+        Returns:
+            Float array indexed by word id
+        """
+        if measure not in self.MEASURES:
+            raise ValueError(f"Unknown dispersion measure '{measure}', expected one of {self.MEASURES}")
+        scores = self.scores()
+        if measure == "juilland":
+            return scores["frequency"] * scores["juilland_d"]
+        return scores["frequency"] * (1.0 - scores["gries_dp"])
+
+    def rank(self, word_ids: Sequence[int], measure: str = "juilland", limit: int = -1) -> List[int]:
+        """
+        Order word ids by usage, highest first (ties keep the given order).
+
+        Args:
+            word_ids: Candidate word ids
+            measure: Dispersion measure, see usage()
+            limit: Keep at most this many ids (-1 = all)
+
+        Returns:
+            Word ids in ranking order
+        """
+        ids = np.asarray(word_ids, dtype=np.int64)
+        order = np.argsort(-self.usage(measure)[ids], kind="stable")
+        if limit >= 0:
+            order = order[:limit]
+        return ids[order].tolist()
+
+    def summaries(self, word_ids: Sequence[int], measure: str = "juilland") -> List[Dict[str, float]]:
+        """
+        Get the report columns for some word ids.
+
+        Args:
+            word_ids: Word ids to describe
+            measure: Dispersion measure used for "usage"
+
+        Returns:
+            One dict per id with "documents", "juilland_d", "gries_dp",
+            "tfidf" and "usage"
+        """
+        ids = np.asarray(word_ids, dtype=np.int64)
+        scores = self.scores()
+        columns = {
+            name: scores[name][ids].tolist()
+            for name in ("documents", "juilland_d", "gries_dp", "tfidf")
+        }
+        columns["documents"] = [int(value) for value in columns["documents"]]
+        columns["usage"] = self.usage(measure)[ids].tolist()
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
@@ -7,7 +7,9 @@ bilingual dialog that leaks into subtitle files.
 """
 
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
+
+from .compact_lexicon import CompactLexicon
 
 
 class EnglishWordFilter:
@@ -18,12 +20,16 @@ class EnglishWordFilter:
         Initialize English word filter.
 
         Args:
-            english_words_file: Path to english_words.txt file
+            english_words_file: Path to english_words.txt, or to a .lex file
+                built with build_lexicon.py for large word lists
         """
         self.english_words_file: Path = Path(english_words_file)
         self.english_words: Set[str] = set()
+        self.lexicon: Optional[CompactLexicon] = None
 
-        if self.english_words_file.exists():
+        if self.english_words_file.suffix == ".lex" and self.english_words_file.exists():
+            self.lexicon = CompactLexicon(self.english_words_file)
+        elif self.english_words_file.exists():
             self.load_words()
         else:
             print(f"⚠️  English words file not found: {self.english_words_file}")
@@ -74,7 +80,10 @@ class EnglishWordFilter:
         Returns:
             True if word is a known English word
         """
-        return word.lower() in self.english_words
+        word = word.lower()
+        if self.lexicon is not None:
+            return word in self.lexicon
+        return word in self.english_words
 
     def get_count(self) -> int:
         """
@@ -83,4 +92,6 @@ class EnglishWordFilter:
         Returns:
             Count of English words
         """
+        if self.lexicon is not None:
+            return len(self.lexicon)
         return len(self.english_words)
@@ -0,0 +1,196 @@
+"""
+Filter Chain Module
+
+Combines word exclusion rules (stopwords, English words, ...) into one
+lookup table plus one regex, so each word is checked once instead of once
+per filter.
+"""
+
+from collections import Counter
+from typing import Container, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .pattern_set import PatternSet
+from .vocabulary import Vocabulary
+
+
+class FilterChain:
+    """Drop words listed by any of several exclusion rules in a single pass."""
+
+    def __init__(self, lowercase: bool = False) -> None:
+        """
+        Initialize an empty filter chain.
+
+        Args:
+            lowercase: Lowercase words before lookup; leave False when the
+                words are already lowercased by WordProcessor
+        """
+        self.lowercase = lowercase
+        self.rules: List[str] = []  # rule names, in priority order
+        self.hits: Counter = Counter()  # rule name -> occurrences removed in the last pass
+        self._excluded: Dict[str, int] = {}  # word -> 1 + index of the first rule listing it
+        self._lexicons: List[Tuple[int, Container[str]]] = []  # (rule code, lexicon)
+        self._patterns: List[str] = []
+        self._pattern_codes: List[int] = []  # pattern index -> rule code
+        self._pattern_set: Optional[PatternSet] = None
+        self._vocabulary: Optional[Vocabulary] = None
+        self._verdicts = bytearray()  # per word id: 0 = keep, else 1 + rule index
+
+    def add_rule(
+        self,
+        name: str,
+        words: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        lexicon: Optional[Container[str]] = None
+    ) -> None:
+        """
+        Add an exclusion rule. Earlier rules win when both list a word.
+
+        Words of all rules are merged into one table and checked first,
+        then lexicons, then patterns.
+
+        Args:
+            name: Rule name used as the key in hits (e.g. "stopwords")
+            words: Lowercase words the rule excludes
+            patterns: Regexes excluding every word they match in full
+            lexicon: Large word set checked in place (e.g. a CompactLexicon)
+                instead of being copied into the table
+
+        Raises:
+            ValueError: If a pattern is not a valid regex
+        """
+        self.rules.append(name)
+        code = len(self.rules)
+        for word in words:
+            self._excluded.setdefault(word, code)
+        if lexicon is not None:
+            self._lexicons.append((code, lexicon))
+        patterns = list(patterns)
+        if patterns:
+            self._add_patterns(code, patterns)
+        self._verdicts = bytearray()
+
+    def _add_patterns(self, code: int, patterns: List[str]) -> None:
+        """Recompile every rule's patterns into one PatternSet."""
+        pattern_set = PatternSet(self._patterns + patterns)
+        self._patterns.extend(patterns)
+        self._pattern_codes.extend([code] * len(patterns))
+        self._pattern_set = pattern_set
+
+    def _lookup(self, word: str) -> int:
+        """Rule code for a word: words first, then lexicons, then patterns; 0 = keep."""
+        if self.lowercase:
+            word = word.lower()
+        code = self._excluded.get(word, 0)
+        if code:
+            return code
+        for code, lexicon in self._lexicons:
+            if word in lexicon:
+                return code
+        if self._pattern_set is None:
+            return 0
+        index = self._pattern_set.match(word)
+        return self._pattern_codes[index] if index is not None else 0
+
+    def rule_for(self, word: str) -> Optional[str]:
+        """
+        Get the rule that excludes a word.
+
+        Args:
+            word: Word to check
+
+        Returns:
+            Name of the first rule listing the word, or None to keep it
+        """
+        code = self._lookup(word)
+        return self.rules[code - 1] if code else None
+
+    def filter_words(self, words: Iterable[str]) -> Iterator[str]:
+        """
+        Stream the words no rule excludes, counting removals per rule.
+
+        Verdicts are memoized per distinct word for the duration of the
+        pass, so repeated words are not matched against the patterns again.
+
+        Args:
+            words: Words to filter
+
+        Returns:
+            Iterator of kept words, in input order
+        """
+        self.hits = Counter()
+        rules = self.rules
+        verdicts: Dict[str, int] = {}
+        for word in words:
+            code = verdicts.get(word)
+            if code is None:
+                code = verdicts[word] = self._lookup(word)
+            if code:
+                self.hits[rules[code - 1]] += 1
+            else:
+                yield word
+
+    def filter_counts(self, count_batches: Iterable[Mapping[str, int]]) -> Iterator[Dict[str, int]]:
+        """
+        Stream word counts with excluded words dropped, counting removals.
+
+        Nothing is memoized across batches, so memory does not grow with
+        the number of distinct words seen.
+
+        Args:
+            count_batches: Word counts to filter, e.g. one mapping per file
+
+        Returns:
+            Iterator of kept word counts, one dictionary per batch
+        """
+        self.hits = Counter()
+        rules = self.rules
+        lookup = self._lookup
+        for counts in count_batches:
+            kept: Dict[str, int] = {}
+            for word, count in counts.items():
+                code = lookup(word)
+                if code:
+                    self.hits[rules[code - 1]] += count
+                else:
+                    kept[word] = count
+            yield kept
+
+    def filter_ids(self, totals: Sequence[int], vocabulary: Vocabulary) -> Iterator[int]:
+        """
+        Stream the word ids no rule excludes, counting removed occurrences.
+
+        Verdicts are kept per id and reused for ids seen in earlier passes
+        over the same vocabulary, so only new words are looked up.
+
+        Args:
+            totals: Occurrence counts indexed by word id; ids with a count
+                of zero or less are skipped
+            vocabulary: Vocabulary the ids belong to
+
+        Returns:
+            Iterator of kept ids, in id order
+        """
+        self.hits = Counter()
+        verdicts = self._update_verdicts(vocabulary)
+        removed = [0] * (len(self.rules) + 1)
+        for word_id, count in enumerate(totals):
+            if count <= 0:
+                continue
+            code = verdicts[word_id]
+            if code:
+                removed[code] += count
+            else:
+                yield word_id
+        for name, count in zip(self.rules, removed[1:]):
+            self.hits[name] = count
+
+    def _update_verdicts(self, vocabulary: Vocabulary) -> bytearray:
+        """Extend the per-id verdicts to cover every word in vocabulary."""
+        if vocabulary is not self._vocabulary:
+            self._vocabulary = vocabulary
+            self._verdicts = bytearray()
+        lookup = self._lookup
+        verdicts = self._verdicts
+        for word_id in range(len(verdicts), len(vocabulary)):
+            verdicts.append(lookup(vocabulary.word(word_id)))
+        return verdicts
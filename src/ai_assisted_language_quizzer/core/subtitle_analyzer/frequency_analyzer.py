@@ -4,19 +4,85 @@ Frequency Analyzer Module
 Analyzes word frequencies and provides smart threshold calculations.
 """
 
+import os
+import struct
+import sys
+from array import array
 from collections import Counter
-from typing import List, Dict, Tuple
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, List, Dict, Mapping, Optional, Sequence, Tuple, Union
 import math
 
+from .count_min_sketch import CountMinSketch
+from .frequency_index import FrequencyIndex
+from .numpy_backend import NumpyBackend
+from .space_saving import SpaceSaving
+from .vocabulary import Vocabulary
+
 
 class FrequencyAnalyzer:
     """Analyze word frequencies with smart threshold calculations."""
+
+    # Binary state file: magic, version, unique words, total words,
+    # max overestimate, estimated flag
+    MAGIC = b"FRQ\x00"
+    VERSION = 2
+    HEADER = struct.Struct("<4sIQQQ?")
     
-    def __init__(self):
-        """Initialize frequency analyzer."""
+    BACKENDS = ("python", "numpy")
+    
+    def __init__(self, backend: str = "python"):
+        """
+        Initialize frequency analyzer.
+
+        Args:
+            backend: "python", or "numpy" to count ids and compute
+                statistics with vectorized NumPy operations (same results)
+
+        Raises:
+            ValueError: If backend is unknown
+            ImportError: If backend is "numpy" and NumPy is not installed
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown frequency backend {backend!r}; use one of {self.BACKENDS}")
+        self.backend = backend
+        self._numpy: Optional[NumpyBackend] = NumpyBackend() if backend == "numpy" else None
+        self._values: Any = None  # NumPy backend: frequency values in word_frequencies order
         self.word_frequencies: Counter = Counter()
         self.total_words = 0
         self.unique_words = 0
+        # Set by analyze_approximate(): counts are estimates that exceed the
+        # true count by at most max_overestimate
+        self.estimated = False
+        self.max_overestimate = 0
+        self._index: Optional[FrequencyIndex] = None
+        # Running approximate count between start_approximate() and finish_approximate()
+        self._sketch: Optional[CountMinSketch] = None
+        self._heavy_hitters: Optional[SpaceSaving] = None
+
+    @property
+    def index(self) -> FrequencyIndex:
+        """Histogram index of the current frequencies, built on first use after analyze()."""
+        if self._index is None:
+            histogram = None
+            if self._numpy is not None:
+                histogram = self._numpy.histogram(self._value_array())
+            self._index = FrequencyIndex(self.word_frequencies, histogram)
+        return self._index
+
+    def _value_array(self) -> Any:
+        """NumPy array of the frequency values, built on first use."""
+        if self._values is None:
+            self._values = self._numpy.values_array(
+                self.word_frequencies.values(), len(self.word_frequencies)
+            )
+        return self._values
+
+    def _invalidate(self) -> None:
+        """Drop data derived from word_frequencies after it changes."""
+        self._index = None
+        self._values = None
     
     def analyze(self, words: List[str]) -> Dict[str, int]:
         """
@@ -31,9 +97,282 @@ class FrequencyAnalyzer:
         self.word_frequencies = Counter(words)
         self.total_words = len(words)
         self.unique_words = len(self.word_frequencies)
+        self.estimated = False
+        self._invalidate()
         
         return dict(self.word_frequencies)
-    
+
+    def analyze_counts(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """
+        Analyze word frequencies from precomputed word counts.
+
+        Args:
+            counts: Dictionary mapping words to occurrence counts
+
+        Returns:
+            Dictionary mapping words to their frequencies
+        """
+        self.word_frequencies = Counter(counts)
+        self.total_words = sum(self.word_frequencies.values())
+        self.unique_words = len(self.word_frequencies)
+        self.estimated = False
+        self._invalidate()
+
+        return dict(self.word_frequencies)
+
+    def analyze_ids(
+        self,
+        totals: Sequence[int],
+        ids: Iterable[int],
+        vocabulary: Vocabulary
+    ) -> Dict[str, int]:
+        """
+        Analyze word frequencies from id-indexed counts.
+
+        Words are looked up only for the given ids, so filtered-out
+        entries never become dictionary keys.
+
+        Args:
+            totals: Occurrence counts indexed by word id
+            ids: Ids of the words to analyze, in report order
+            vocabulary: Vocabulary the ids belong to
+
+        Returns:
+            Dictionary mapping words to their frequencies
+        """
+        if self._numpy is not None:
+            id_array, counts = self._numpy.take(totals, ids)
+            self._set_id_counts(id_array.tolist(), counts, vocabulary)
+            return dict(self.word_frequencies)
+
+        self.word_frequencies = Counter(
+            {vocabulary.word(word_id): totals[word_id] for word_id in ids}
+        )
+        self.total_words = sum(self.word_frequencies.values())
+        self.unique_words = len(self.word_frequencies)
+        self.estimated = False
+        self._invalidate()
+
+        return dict(self.word_frequencies)
+
+    def _set_id_counts(self, ids: List[int], counts: Any, vocabulary: Vocabulary) -> None:
+        """Replace the frequencies with NumPy counts of the given ids."""
+        self.word_frequencies = Counter(
+            dict(zip(map(vocabulary.word, ids), counts.tolist()))
+        )
+        self.total_words = int(counts.sum())
+        self.unique_words = len(ids)
+        self.estimated = False
+        self._invalidate()
+        self._values = counts
+
+    def analyze_approximate(
+        self,
+        count_batches: Iterable[Mapping[str, int]],
+        top_k: int = 5000,
+        sketch_width: int = 1 << 20,
+        sketch_depth: int = 4
+    ) -> Dict[str, int]:
+        """
+        Estimate the top_k word frequencies in bounded memory.
+
+        Every word goes into a Count-Min Sketch and a Space-Saving summary
+        of top_k candidates, where a word replacing the smallest candidate
+        starts from its sketch estimate. Only the candidates are kept, each
+        with the smaller of its two estimates. Memory is 8 * sketch_width *
+        sketch_depth bytes plus top_k entries, however many distinct words
+        the batches contain. Estimates are never below the true count and
+        exceed it by at most (e / sketch_width) * total_words with
+        probability 1 - e^-sketch_depth; the worst case among the
+        candidates is recorded in max_overestimate.
+
+        Args:
+            count_batches: Word counts to add, e.g. one mapping per file
+            top_k: Number of candidate words to track
+            sketch_width: Counters per sketch row
+            sketch_depth: Number of sketch rows
+
+        Returns:
+            Dictionary mapping candidate words to estimated frequencies
+        """
+        self.start_approximate(top_k, sketch_width, sketch_depth)
+        for counts in count_batches:
+            self.add_approximate(counts)
+        return self.finish_approximate()
+
+    def start_approximate(
+        self,
+        top_k: int = 5000,
+        sketch_width: int = 1 << 20,
+        sketch_depth: int = 4
+    ) -> None:
+        """
+        Start an approximate count fed batch by batch (see analyze_approximate()).
+
+        Args:
+            top_k: Number of candidate words to track
+            sketch_width: Counters per sketch row
+            sketch_depth: Number of sketch rows
+        """
+        self._sketch = CountMinSketch(sketch_width, sketch_depth)
+        self._heavy_hitters = SpaceSaving(top_k)
+
+    def add_approximate(self, counts: Mapping[str, int]) -> None:
+        """
+        Add one batch of word counts to the count started by start_approximate().
+
+        Args:
+            counts: Word counts to add, e.g. one file's
+        """
+        sketch = self._sketch
+        heavy_hitters = self._heavy_hitters
+        for word, count in counts.items():
+            # The sketch bounds a newcomer's earlier occurrences more
+            # tightly than the evicted candidate's count
+            estimate = sketch.add(word, count)
+            heavy_hitters.add(word, count, prior=estimate - count)
+
+    def is_candidate(self, word: str) -> bool:
+        """Whether a word is currently tracked by the count started by start_approximate()."""
+        return word in self._heavy_hitters.counts
+
+    def finish_approximate(self) -> Dict[str, int]:
+        """
+        Replace the frequencies with the candidates of the count started by start_approximate().
+
+        Returns:
+            Dictionary mapping candidate words to estimated frequencies
+        """
+        sketch = self._sketch
+        heavy_hitters = self._heavy_hitters
+        self.word_frequencies = Counter()
+        self.max_overestimate = 0
+        for word, count, error in heavy_hitters.items():
+            estimate = min(count, sketch.estimate(word))
+            self.word_frequencies[word] = estimate
+            self.max_overestimate = max(self.max_overestimate, estimate - (count - error))
+        self.total_words = heavy_hitters.total
+        self.unique_words = len(self.word_frequencies)
+        self.estimated = True
+        self._sketch = None
+        self._heavy_hitters = None
+        self._invalidate()
+
+        return dict(self.word_frequencies)
+
+    def update(self, words: Union[Iterable[str], Mapping[str, int]]) -> None:
+        """
+        Add words to the current counts instead of replacing them.
+
+        Args:
+            words: Words to count, or a mapping of words to counts
+        """
+        added = Counter(words)
+        self.word_frequencies.update(added)
+        self.total_words += sum(added.values())
+        self.unique_words = len(self.word_frequencies)
+        self._invalidate()
+
+    def merge(self, other: "FrequencyAnalyzer") -> None:
+        """
+        Add another analyzer's counts (e.g. from another worker or show).
+
+        Args:
+            other: Analyzer whose counts are added; it is not modified
+        """
+        self.word_frequencies.update(other.word_frequencies)
+        self.total_words += other.total_words
+        self.unique_words = len(self.word_frequencies)
+        if other.estimated:
+            self.estimated = True
+            self.max_overestimate += other.max_overestimate
+        self._invalidate()
+
+    def subtract(self, shard: "FrequencyAnalyzer") -> None:
+        """
+        Remove counts merged earlier, e.g. of a file that changed.
+
+        Words whose count drops to zero are removed; counts never go
+        below zero, so total_words stays the sum of word_frequencies.
+
+        Args:
+            shard: Analyzer whose counts are taken out; it is not modified
+        """
+        frequencies = self.word_frequencies
+        for word, count in shard.word_frequencies.items():
+            current = frequencies.get(word, 0)
+            if current > count:
+                frequencies[word] = current - count
+                self.total_words -= count
+            elif current:
+                del frequencies[word]
+                self.total_words -= current
+        self.unique_words = len(frequencies)
+        self._invalidate()
+
+    def save(self, path: Path) -> None:
+        """
+        Write the counts to a compact binary file, replacing it atomically.
+
+        Layout: header (magic, version, unique words, total words, max
+        overestimate, estimated flag), the counts as little-endian int64,
+        then the words as NUL-separated UTF-8.
+
+        Args:
+            path: Output file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        counts = array("q", self.word_frequencies.values())
+        if sys.byteorder != "little":
+            counts.byteswap()
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(
+                self.MAGIC, self.VERSION, len(counts), self.total_words,
+                self.max_overestimate, self.estimated,
+            ))
+            counts.tofile(f)
+            f.write("\0".join(self.word_frequencies).encode("utf-8"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "FrequencyAnalyzer":
+        """
+        Read counts written by save().
+
+        Args:
+            path: State file path
+
+        Returns:
+            New analyzer holding the saved counts
+
+        Raises:
+            ValueError: If the file is not a state file of this version
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        # Magic and version come first in every version's header
+        if data[:8] != cls.MAGIC + struct.pack("<I", cls.VERSION) or len(data) < cls.HEADER.size:
+            raise ValueError(f"Not a version {cls.VERSION} frequency file: {path}")
+        _, _, unique_words, total_words, max_overestimate, estimated = cls.HEADER.unpack_from(data)
+        offset = cls.HEADER.size
+        counts = array("q")
+        counts.frombytes(data[offset:offset + 8 * unique_words])
+        if sys.byteorder != "little":
+            counts.byteswap()
+        words = data[offset + 8 * unique_words:].decode("utf-8").split("\0") if unique_words else []
+        if len(words) != unique_words:
+            raise ValueError(f"Truncated frequency file: {path}")
+
+        analyzer = cls()
+        analyzer.word_frequencies = Counter(dict(zip(words, counts)))
+        analyzer.total_words = total_words
+        analyzer.unique_words = unique_words
+        analyzer.estimated = estimated
+        analyzer.max_overestimate = max_overestimate
+        return analyzer
+
     def get_top_n(self, n: int) -> List[Tuple[str, int]]:
         """
         Get top N most frequent words.
@@ -44,7 +383,7 @@ class FrequencyAnalyzer:
         Returns:
             List of (word, frequency) tuples
         """
-        return self.word_frequencies.most_common(n)
+        return self.index.top_n(n)
     
     def filter_by_frequency(
         self, 
@@ -96,16 +435,11 @@ class FrequencyAnalyzer:
         if self.unique_words <= target_words:
             return min_threshold
         
-        # Calculate threshold that would give approximately target_words
-        # Try different thresholds to find the sweet spot
-        for threshold in range(min_threshold, 100):
-            filtered_count = sum(
-                1 for freq in self.word_frequencies.values() 
-                if freq >= threshold
-            )
-            
-            if filtered_count <= target_words:
-                return threshold
+        # Smallest threshold below 100 that gives at most target_words;
+        # word counts per threshold come from the histogram index
+        threshold = self.index.threshold_for_target(target_words, min_threshold, 100)
+        if threshold is not None:
+            return threshold
         
         # If we still have too many words even at threshold 100,
         # use a higher threshold based on percentile
@@ -124,15 +458,9 @@ class FrequencyAnalyzer:
         if self.unique_words == 0:
             return 1
         
-        # Sort frequencies in descending order
-        sorted_freqs = sorted(
-            self.word_frequencies.values(), 
-            reverse=True
-        )
-        
-        # Get the frequency at the target_words position
-        if target_words < len(sorted_freqs):
-            return sorted_freqs[target_words]
+        # Get the frequency at the target_words position in descending order
+        if target_words < self.unique_words:
+            return self.index.value_at_rank(target_words)
         else:
             return 1
     
@@ -143,49 +471,52 @@ class FrequencyAnalyzer:
         Returns:
             Dictionary mapping frequency to count of words with that frequency
         """
-        distribution = Counter(self.word_frequencies.values())
-        return dict(distribution)
+        return dict(self.index.histogram)
     
-    def get_statistics(self) -> Dict[str, any]:
+    def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive statistics about the word frequencies.
         
         Returns:
-            Dictionary with various statistics
+            Dictionary with various statistics; approximate counts add
+            "estimated" and "max_overestimate"
         """
         if not self.word_frequencies:
-            return {
+            stats = {
                 "total_words": 0,
                 "unique_words": 0,
                 "avg_frequency": 0,
                 "max_frequency": 0,
                 "min_frequency": 0
             }
-        
-        frequencies = list(self.word_frequencies.values())
-        
-        return {
-            "total_words": self.total_words,
-            "unique_words": self.unique_words,
-            "avg_frequency": sum(frequencies) / len(frequencies),
-            "max_frequency": max(frequencies),
-            "min_frequency": min(frequencies),
-            "median_frequency": self._get_median(frequencies),
-            "most_common_word": self.word_frequencies.most_common(1)[0]
-        }
-    
-    def _get_median(self, values: List[int]) -> float:
-        """Calculate median of a list of values."""
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        
-        if n == 0:
-            return 0
-        
-        if n % 2 == 0:
-            return (sorted_values[n//2 - 1] + sorted_values[n//2]) / 2
+        elif self._numpy is not None:
+            values = self._value_array()
+            summary = self._numpy.summary(values)
+            stats = {
+                "total_words": self.total_words,
+                "unique_words": self.unique_words,
+                "avg_frequency": int(values.sum()) / self.unique_words,
+                "max_frequency": summary["max"],
+                "min_frequency": summary["min"],
+                "median_frequency": summary["median"],
+                "most_common_word": next(islice(self.word_frequencies.items(), summary["argmax"], None))
+            }
         else:
-            return sorted_values[n//2]
+            index = self.index
+            stats = {
+                "total_words": self.total_words,
+                "unique_words": self.unique_words,
+                "avg_frequency": index.total_words / index.unique_words,
+                "max_frequency": index.max_frequency(),
+                "min_frequency": index.min_frequency(),
+                "median_frequency": index.median(),
+                "most_common_word": self.word_frequencies.most_common(1)[0]
+            }
+        
+        if self.estimated:
+            stats["estimated"] = True
+            stats["max_overestimate"] = self.max_overestimate
+        return stats
     
     def get_word_percentage(self, word: str) -> float:
         """
@@ -216,8 +547,9 @@ class FrequencyAnalyzer:
         Returns:
             List of (word, frequency) tuples
         """
+        if descending:
+            return list(self.index.top_n(self.unique_words))
         return sorted(
             self.word_frequencies.items(),
-            key=lambda x: x[1],
-            reverse=descending
+            key=lambda x: x[1]
         )
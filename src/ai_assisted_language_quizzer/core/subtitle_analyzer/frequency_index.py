@@ -0,0 +1,141 @@
+"""
+Frequency Index Module
+
+Histogram of word frequencies with cumulative counts, built once per
+analysis so threshold, rank and top-N queries do not rescan or
+re-sort every word.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+
+class FrequencyIndex:
+    """Answer threshold, rank and top-N queries over a frequency table."""
+
+    def __init__(
+        self,
+        frequencies: Dict[str, int],
+        histogram: Optional[Dict[int, int]] = None
+    ) -> None:
+        """
+        Build the histogram for a frequency table.
+
+        The table is kept by reference for top-N queries, so it must not
+        change while the index is in use.
+
+        Args:
+            frequencies: Dictionary mapping words to their frequencies
+            histogram: Precomputed {frequency: word count} in ascending
+                frequency order (e.g. from NumpyBackend.histogram())
+        """
+        self._frequencies = frequencies
+        if histogram is None:
+            histogram = dict(sorted(Counter(frequencies.values()).items()))
+        self.histogram: Dict[int, int] = histogram
+        self._values: List[int] = list(self.histogram)  # distinct frequencies, ascending
+        # _at_least[i]: words with frequency >= _values[i]; trailing 0 sentinel
+        self._at_least: List[int] = [0] * (len(self._values) + 1)
+        for i in range(len(self._values) - 1, -1, -1):
+            self._at_least[i] = self._at_least[i + 1] + self.histogram[self._values[i]]
+        self._negated_at_least = [-count for count in self._at_least]  # ascending, for bisect
+        self.unique_words = self._at_least[0]
+        self.total_words = sum(value * count for value, count in self.histogram.items())
+        self._order: Optional[List[Tuple[str, int]]] = None
+
+    def count_at_least(self, threshold: int) -> int:
+        """
+        Count words with frequency >= threshold in O(log n).
+
+        Args:
+            threshold: Minimum frequency (inclusive)
+
+        Returns:
+            Number of words meeting the threshold
+        """
+        return self._at_least[bisect_left(self._values, threshold)]
+
+    def threshold_for_target(
+        self,
+        target_words: int,
+        min_threshold: int = 2,
+        max_threshold: int = 100
+    ) -> Optional[int]:
+        """
+        Find the smallest threshold leaving at most target_words words.
+
+        Args:
+            target_words: Maximum number of words to keep
+            min_threshold: Smallest threshold to consider
+            max_threshold: Thresholds from here on are not considered
+
+        Returns:
+            Threshold in [min_threshold, max_threshold), or None if even
+            max_threshold - 1 leaves more than target_words words
+        """
+        low, high = min_threshold, max_threshold
+        while low < high:
+            middle = (low + high) // 2
+            if self.count_at_least(middle) <= target_words:
+                high = middle
+            else:
+                low = middle + 1
+        return low if low < max_threshold else None
+
+    def value_at_rank(self, rank: int) -> int:
+        """
+        Get the frequency of the word at a position in descending order.
+
+        Args:
+            rank: 0-based position (0 = most frequent word)
+
+        Returns:
+            Frequency at that position
+
+        Raises:
+            IndexError: If rank is outside [0, unique_words)
+        """
+        if not 0 <= rank < self.unique_words:
+            raise IndexError(f"rank {rank} out of range for {self.unique_words} words")
+        # Last distinct value with more than `rank` words at or above it
+        return self._values[bisect_left(self._negated_at_least, -rank) - 1]
+
+    def median(self) -> float:
+        """
+        Get the median frequency.
+
+        Returns:
+            Median (mean of the two middle values for an even count)
+        """
+        n = self.unique_words
+        if n == 0:
+            return 0
+        if n % 2 == 0:
+            return (self.value_at_rank(n // 2 - 1) + self.value_at_rank(n // 2)) / 2
+        return self.value_at_rank(n // 2)
+
+    def max_frequency(self) -> int:
+        """Highest frequency (0 when there are no words)."""
+        return self._values[-1] if self._values else 0
+
+    def min_frequency(self) -> int:
+        """Lowest frequency (0 when there are no words)."""
+        return self._values[0] if self._values else 0
+
+    def top_n(self, n: int) -> List[Tuple[str, int]]:
+        """
+        Get the n most frequent words in O(n) after the first call.
+
+        Ties keep the table's insertion order, as Counter.most_common does.
+
+        Args:
+            n: Number of words to return
+
+        Returns:
+            List of (word, frequency) tuples, highest frequency first
+        """
+        if self._order is None:
+            self._order = sorted(self._frequencies.items(), key=itemgetter(1), reverse=True)
+        return self._order[:max(0, n)]
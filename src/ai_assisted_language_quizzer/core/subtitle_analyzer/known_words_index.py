@@ -0,0 +1,154 @@
+"""
+Known Words Index Module
+
+Persisted index of the words already in Anki decks, so the pipeline can
+skip them before thresholding, curation and translation instead of paying
+for them again. Notes are fetched through AnkiConnect in chunks and only
+new or modified notes are fetched on later refreshes.
+"""
+
+import html
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .word_processor import WordProcessor
+
+
+class KnownWordsIndex:
+    """Words of Anki deck notes, refreshed incrementally by note modification time."""
+
+    VERSION = 1
+
+    # [sound:...] tags, HTML tags and non-breaking spaces in field values
+    MARKUP_PATTERN = re.compile(r"\[sound:[^\]]*\]|<[^>]*>|&nbsp;", re.IGNORECASE)
+
+    def __init__(self, index_file: Path) -> None:
+        """
+        Initialize known words index, loading it from disk if present.
+
+        Raw field text is stored rather than words, so the words always use
+        the current WordProcessor settings without contacting Anki.
+
+        Args:
+            index_file: JSON file the index is persisted to
+        """
+        self.index_file = Path(index_file)
+        # deck name -> {"field": field name, "notes": {note id: [mod time, text]}}
+        self.decks: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load the persisted index; a missing or outdated file starts empty."""
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION:
+            self.decks = data.get("decks", {})
+
+    def save(self) -> None:
+        """Write the index, replacing the file atomically."""
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "decks": self.decks}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_file)
+
+    def refresh(
+        self,
+        connector: Any,
+        deck: str,
+        field: str = "",
+        chunk_size: int = 500
+    ) -> Counter:
+        """
+        Bring one deck up to date with Anki.
+
+        Modification times are fetched for every note in the deck and only
+        notes that are new or changed since the last refresh are fetched
+        with notesInfo. Notes no longer in the deck are dropped.
+
+        Args:
+            connector: AnkiConnector (or any object with find_notes,
+                notes_mod_time and notes_info)
+            deck: Deck name; subdecks are included
+            field: Field holding the word; empty for the first field
+                (the sort field of the default note types)
+            chunk_size: Note ids per AnkiConnect request
+
+        Returns:
+            Counter with "added", "updated", "removed" and "unchanged" notes
+        """
+        entry = self.decks.get(deck)
+        if entry is None or entry.get("field") != field:
+            entry = self.decks[deck] = {"field": field, "notes": {}}
+        notes: Dict[str, List[Any]] = entry["notes"]
+
+        escaped = deck.replace('"', '\\"')
+        note_ids = connector.find_notes(f'deck:"{escaped}"')
+        mod_times: Dict[str, int] = {}
+        for chunk in self._chunks(note_ids, chunk_size):
+            for item in connector.notes_mod_time(chunk):
+                mod_times[str(item["noteId"])] = item["mod"]
+
+        stats: Counter = Counter()
+        stale = [int(note_id) for note_id, mod in mod_times.items()
+                 if notes.get(note_id, (None,))[0] != mod]
+        for chunk in self._chunks(stale, chunk_size):
+            for note in connector.notes_info(chunk):
+                note_id = str(note["noteId"])
+                stats["updated" if note_id in notes else "added"] += 1
+                notes[note_id] = [mod_times[note_id], self._field_text(note, field)]
+
+        for note_id in set(notes) - set(mod_times):
+            del notes[note_id]
+            stats["removed"] += 1
+        stats["unchanged"] = len(mod_times) - len(stale)
+        return stats
+
+    @staticmethod
+    def _chunks(note_ids: List[int], chunk_size: int) -> List[List[int]]:
+        """Split note ids into request-sized chunks."""
+        chunk_size = max(1, chunk_size)
+        return [note_ids[i:i + chunk_size] for i in range(0, len(note_ids), chunk_size)]
+
+    def _field_text(self, note: Dict[str, Any], field: str) -> str:
+        """Plain text of a note's word field, without audio tags or HTML."""
+        fields = note.get("fields", {})
+        if field:
+            value = fields.get(field, {}).get("value", "")
+        else:
+            first = min(fields.values(), key=lambda f: f.get("order", 0), default={})
+            value = first.get("value", "")
+        return html.unescape(self.MARKUP_PATTERN.sub(" ", value)).strip()
+
+    def words(self, word_processor: WordProcessor, decks: Optional[List[str]] = None) -> Set[str]:
+        """
+        Get the known words, tokenized the same way as subtitle text.
+
+        Args:
+            word_processor: Word processor used for the subtitles
+            decks: Decks to include (default: every indexed deck)
+
+        Returns:
+            Set of normalized words
+        """
+        known: Set[str] = set()
+        for deck in decks if decks is not None else list(self.decks):
+            for _, text in self.decks.get(deck, {}).get("notes", {}).values():
+                known.update(word_processor.process_text(text))
+        return known
+
+    def get_count(self) -> int:
+        """
+        Get number of indexed notes.
+
+        Returns:
+            Count of notes across all decks
+        """
+        return sum(len(entry["notes"]) for entry in self.decks.values())
@@ -0,0 +1,115 @@
+"""
+NumPy Backend Module
+
+Vectorized counting and statistics for FrequencyAnalyzer and
+ReportGenerator (frequency.backend: numpy). Results are converted back to
+plain Python ints and floats, so they are identical to the pure-Python
+path. NumPy is optional; the Python backend needs nothing extra.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyBackend:
+    """Count word ids and summarize frequency values with NumPy arrays."""
+
+    def __init__(self) -> None:
+        """
+        Initialize the backend.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("frequency.backend 'numpy' requires NumPy: pip install numpy")
+
+    @staticmethod
+    def available() -> bool:
+        """Whether NumPy can be imported."""
+        return np is not None
+
+    def values_array(self, values: Iterable[int], count: int = -1) -> Any:
+        """
+        Copy frequency values into an int64 array.
+
+        Args:
+            values: Frequencies, e.g. dict values
+            count: Number of values if known (avoids resizing)
+
+        Returns:
+            1-D int64 array
+        """
+        return np.fromiter(values, dtype=np.int64, count=count)
+
+    def take(self, totals: Sequence[int], ids: Iterable[int]) -> Tuple[Any, Any]:
+        """
+        Gather the counts of selected word ids.
+
+        Args:
+            totals: Occurrence counts indexed by word id (e.g. array("q"))
+            ids: Word ids to select, in order
+
+        Returns:
+            (ids, counts) as int64 arrays
+        """
+        id_array = np.fromiter(ids, dtype=np.int64)
+        # array("q") exposes its buffer, so this is a view, not a copy
+        return id_array, np.asarray(totals, dtype=np.int64)[id_array]
+
+    def histogram(self, values: Any) -> Dict[int, int]:
+        """
+        Count words per distinct frequency.
+
+        Args:
+            values: int64 array of frequencies
+
+        Returns:
+            Dictionary mapping frequency to word count, ascending
+        """
+        distinct, counts = np.unique(values, return_counts=True)
+        return dict(zip(distinct.tolist(), counts.tolist()))
+
+    def summary(self, values: Any) -> Dict[str, Any]:
+        """
+        Compute max, min, median and the position of the first maximum.
+
+        Args:
+            values: Non-empty int64 array of frequencies
+
+        Returns:
+            Dictionary with "max", "min", "median" and "argmax"
+        """
+        n = len(values)
+        middle = n // 2
+        if n % 2 == 0:
+            low, high = np.partition(values, (middle - 1, middle))[middle - 1:middle + 1].tolist()
+            median = (low + high) / 2
+        else:
+            median = np.partition(values, middle)[middle].item()
+        argmax = int(values.argmax())
+        return {
+            "max": values[argmax].item(),
+            "min": values.min().item(),
+            "median": median,
+            "argmax": argmax,
+        }
+
+    def bucket_counts(self, values: Any, lower_bounds: List[int]) -> List[int]:
+        """
+        Count values per bucket.
+
+        Args:
+            values: int64 array of frequencies
+            lower_bounds: Ascending lower bound of each bucket; values below
+                the first bound are not counted
+
+        Returns:
+            Number of values in each bucket
+        """
+        positions = np.searchsorted(np.asarray(lower_bounds), values, side="right")
+        return np.bincount(positions, minlength=len(lower_bounds) + 1)[1:].tolist()
@@ -0,0 +1,158 @@
+"""
+Parse Cache Module
+
+On-disk cache of per-file token counts and cue hashes, so unchanged
+subtitle files are never parsed or tokenized twice.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+
+class ParseCache:
+    """Cache tokenized subtitle files keyed by content hash and settings."""
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        settings: Dict[str, Any],
+        rebuild: bool = False
+    ) -> None:
+        """
+        Initialize parse cache.
+
+        Args:
+            cache_dir: Directory holding one JSON entry per cached file
+            settings: Processing settings that affect tokenization
+                (min_word_length, keep_accents, lowercase); changing any
+                of them invalidates every entry
+            rebuild: If True, discard existing entries before use
+        """
+        self.cache_dir = Path(cache_dir)
+        self._settings_key = json.dumps(
+            {"version": self.VERSION, **settings}, sort_keys=True
+        ).encode("utf-8")
+
+        if rebuild and self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, data: bytes, skipped: Iterable[int] = ()) -> str:
+        """
+        Build the cache key for a file's raw contents.
+
+        Args:
+            data: Raw file bytes
+            skipped: Hashes of duplicate cues left out of this file's counts
+
+        Returns:
+            Hex digest combining settings, content and skipped cues
+        """
+        digest = hashlib.sha256(self._settings_key)
+        digest.update(data)
+        skipped = sorted(skipped)
+        if skipped:
+            # Trailing count keeps "data + hashes" unambiguous
+            digest.update(array("Q", skipped).tobytes())
+            digest.update(len(skipped).to_bytes(8, "little"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached entry.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Dictionary with "counts" (Counter), "contexts", "suppressed"
+            (cue hash -> text) and "removed" (Counter of filtered cues per
+            pattern), or None on a miss
+        """
+        entry_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            entry["counts"] = Counter(entry["counts"])
+            entry["contexts"] = dict(entry["contexts"])
+            entry["suppressed"] = {
+                int(cue_hash): text
+                for cue_hash, text in entry.get("suppressed", {}).items()
+            }
+            entry["removed"] = Counter(entry.get("removed", {}))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Unreadable or incomplete entries are misses and get rewritten
+            return None
+        return entry
+
+    def put(
+        self,
+        key: str,
+        counts: Counter,
+        contexts: Dict[str, str],
+        suppressed: Optional[Dict[int, str]] = None,
+        removed: Optional[Counter] = None
+    ) -> None:
+        """
+        Store an entry, replacing the file atomically so concurrent
+        workers never see a partial write.
+
+        Args:
+            key: Key from make_key()
+            counts: Word counts for the file
+            contexts: First line each word appeared in
+            suppressed: Duplicate cues skipped in this file (hash -> text)
+            removed: Cues dropped by the cue filter, per pattern
+        """
+        entry_path = self.cache_dir / f"{key}.json"
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"counts": counts, "contexts": contexts}
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if removed:
+            entry["removed"] = removed
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, entry_path)
+
+    def get_hashes(self, key: str) -> Optional[array]:
+        """
+        Load the cue hashes stored for a file.
+
+        Args:
+            key: Key from make_key() without skipped cues
+
+        Returns:
+            Array of distinct cue hashes, or None on a miss
+        """
+        hashes_path = self.cache_dir / f"{key}.hashes"
+        try:
+            data = hashes_path.read_bytes()
+        except OSError:
+            return None
+        if len(data) % 8:
+            return None
+        hashes = array("Q")
+        hashes.frombytes(data)
+        return hashes
+
+    def put_hashes(self, key: str, hashes: array) -> None:
+        """
+        Store the cue hashes of a file next to its entry.
+
+        Args:
+            key: Key from make_key() without skipped cues
+            hashes: Result of CueDeduplicator.file_hashes()
+        """
+        hashes_path = self.cache_dir / f"{key}.hashes"
+        tmp_path = hashes_path.with_name(f"{key}.{os.getpid()}.hashes.tmp")
+        tmp_path.write_bytes(hashes.tobytes())
+        os.replace(tmp_path, hashes_path)
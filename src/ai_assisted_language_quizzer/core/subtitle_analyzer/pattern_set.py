@@ -0,0 +1,67 @@
+"""
+Pattern Set Module
+
+Full-match a word against many regexes at once. Patterns are combined
+into one alternation, each in its own named outer group, so a word is
+matched once; patterns whose meaning would change inside an alternation
+(backreferences, named groups) are matched on their own.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+class PatternSet:
+    """Find the first of several regexes that matches a whole word."""
+
+    # Numbered or named backreferences; group numbers shift inside an alternation
+    BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Regexes, in priority order
+
+        Raises:
+            ValueError: If a pattern is not a valid regex
+        """
+        self.patterns: List[str] = list(patterns)
+        combined: List[str] = []
+        self._group_index: Dict[str, int] = {}  # outer group name -> pattern index
+        self._separate: List[Tuple[int, Pattern[str]]] = []
+        for index, pattern in enumerate(self.patterns):
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern {pattern!r}: {e}") from e
+            if compiled.groupindex or self.BACKREFERENCE.search(pattern):
+                self._separate.append((index, compiled))
+            else:
+                name = f"p{index}"
+                self._group_index[name] = index
+                combined.append(f"(?P<{name}>{pattern})")
+        self._regex: Optional[Pattern[str]] = re.compile("|".join(combined)) if combined else None
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def match(self, word: str) -> Optional[int]:
+        """
+        Find the first pattern matching all of a word.
+
+        Args:
+            word: Word to match
+
+        Returns:
+            Index of the first matching pattern, or None
+        """
+        found = self._regex.fullmatch(word) if self._regex is not None else None
+        index = self._group_index[found.lastgroup] if found else None
+        for separate_index, compiled in self._separate:
+            if index is not None and separate_index > index:
+                break
+            if compiled.fullmatch(word):
+                return separate_index
+        return index
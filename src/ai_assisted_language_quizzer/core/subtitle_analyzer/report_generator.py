@@ -5,32 +5,53 @@ Generates various output formats for word frequency analysis results.
 """
 
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Optional, Any, TextIO
 from datetime import datetime
 import csv
 
 from .lemma_grouper import LemmaGroup
+from .numpy_backend import NumpyBackend
 
 
 class ReportGenerator:
     """Generate reports in multiple formats from frequency analysis."""
+
+    # Frequency distribution buckets: (label, lowest frequency in bucket)
+    DISTRIBUTION_BUCKETS = (
+        ("1 time", 1),
+        ("2-5 times", 2),
+        ("6-10 times", 6),
+        ("11-20 times", 11),
+        ("21-50 times", 21),
+        ("51-100 times", 51),
+        ("100+ times", 101),
+    )
+
+    # Extra CSV columns when ranking by dispersion (DispersionIndex.summaries())
+    DISPERSION_COLUMNS = ("documents", "juilland_d", "gries_dp", "tfidf", "usage")
     
-    def __init__(self, output_directory: Path):
+    def __init__(self, output_directory: Path, backend: str = "python"):
         """
         Initialize report generator.
         
         Args:
             output_directory: Directory to save reports
+            backend: "python", or "numpy" to bucket the frequency
+                distribution with vectorized operations
         """
         self.output_dir = Path(output_directory)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._numpy: Optional[NumpyBackend] = NumpyBackend() if backend == "numpy" else None
     
     def generate_csv_report(
         self,
         frequencies: Dict[str, int],
         total_words: int,
         output_file: str = "word_frequency_report.csv",
-        top_n: Optional[int] = None
+        top_n: Optional[int] = None,
+        estimated: bool = False,
+        dispersion: Optional[Dict[str, Dict[str, float]]] = None
     ) -> Path:
         """
         Generate CSV report with word frequencies.
@@ -40,29 +61,33 @@ class ReportGenerator:
             total_words: Total number of words analyzed
             output_file: Output filename
             top_n: If specified, only include top N words
+            estimated: If True, the frequency column is headed
+                "frequency_estimate" (approximate counting mode)
+            dispersion: Per-word DispersionIndex.summaries() rows; if given,
+                words are ordered by usage and the measures are added
+                as columns
             
         Returns:
             Path to generated CSV file
         """
         filepath = self.output_dir / output_file
         
-        # Sort by frequency (descending)
-        sorted_words = sorted(
-            frequencies.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        sorted_words = self._ranked_items(frequencies, dispersion)
         
         if top_n:
             sorted_words = sorted_words[:top_n]
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(['word', 'frequency', 'percentage'])
+            header = ['word', 'frequency_estimate' if estimated else 'frequency', 'percentage']
+            writer.writerow(header + list(self.DISPERSION_COLUMNS) if dispersion else header)
             
             for word, freq in sorted_words:
                 percentage = (freq / total_words * 100) if total_words > 0 else 0
-                writer.writerow([word, freq, f"{percentage:.2f}%"])
+                row = [word, freq, f"{percentage:.2f}%"]
+                if dispersion:
+                    row += self._dispersion_cells(dispersion.get(word))
+                writer.writerow(row)
         
         return filepath
     
@@ -71,7 +96,9 @@ class ReportGenerator:
         frequencies: Dict[str, int],
         output_file: str = "anki_import_words.txt",
         top_n: Optional[int] = None,
-        include_frequency: bool = False
+        include_frequency: bool = False,
+        estimated: bool = False,
+        dispersion: Optional[Dict[str, Dict[str, float]]] = None
     ) -> Path:
         """
         Generate simple word list for Anki import.
@@ -81,18 +108,16 @@ class ReportGenerator:
             output_file: Output filename
             top_n: If specified, only include top N words
             include_frequency: If True, add frequency as comment
+            estimated: If True, frequency comments are marked with "~"
+            dispersion: Per-word dispersion rows; if given, words are
+                ordered by usage instead of frequency
             
         Returns:
             Path to generated word list file
         """
         filepath = self.output_dir / output_file
         
-        # Sort by frequency (descending)
-        sorted_words = sorted(
-            frequencies.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        sorted_words = self._ranked_items(frequencies, dispersion)
         
         if top_n:
             sorted_words = sorted_words[:top_n]
@@ -100,7 +125,7 @@ class ReportGenerator:
         with open(filepath, 'w', encoding='utf-8') as f:
             for word, freq in sorted_words:
                 if include_frequency:
-                    f.write(f"{word}\t# frequency: {freq}\n")
+                    f.write(f"{word}\t# frequency: {'~' if estimated else ''}{freq}\n")
                 else:
                     f.write(f"{word}\n")
         
@@ -109,10 +134,11 @@ class ReportGenerator:
     def generate_markdown_summary(
         self,
         frequencies: Dict[str, int],
-        statistics: Dict[str, any],
+        statistics: Dict[str, Any],
         sources: List[str],
         output_file: str = "word_frequency_summary.md",
-        top_n: int = None
+        top_n: int = None,
+        dispersion: Optional[Dict[str, Dict[str, float]]] = None
     ) -> Path:
         """
         Generate human-readable markdown summary report.
@@ -123,18 +149,15 @@ class ReportGenerator:
             sources: List of source files analyzed
             output_file: Output filename
             top_n: Number of top words to include (None = all words)
+            dispersion: Per-word dispersion rows; if given, words are
+                ordered by usage and file count, D and DP are shown
             
         Returns:
             Path to generated markdown file
         """
         filepath = self.output_dir / output_file
         
-        # Sort by frequency (descending)
-        sorted_words = sorted(
-            frequencies.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        sorted_words = self._ranked_items(frequencies, dispersion)
         
         # If top_n is None, show all words; otherwise limit to top_n
         if top_n is None:
@@ -145,29 +168,16 @@ class ReportGenerator:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write("# Word Frequency Analysis Report\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            self._write_notices(f, statistics, dispersion)
             
-            # Statistics section
-            f.write("## 📊 Statistics\n\n")
-            f.write(f"- **Total words analyzed:** {statistics.get('total_words', 0):,}\n")
-            f.write(f"- **Unique words:** {statistics.get('unique_words', 0):,}\n")
-            f.write(f"- **Average frequency:** {statistics.get('avg_frequency', 0):.2f}\n")
-            f.write(f"- **Most common word:** {statistics.get('most_common_word', ('N/A', 0))[0]} "
-                   f"({statistics.get('most_common_word', ('N/A', 0))[1]} occurrences)\n")
-            f.write(f"- **Max frequency:** {statistics.get('max_frequency', 0)}\n")
-            f.write(f"- **Median frequency:** {statistics.get('median_frequency', 0):.1f}\n\n")
+            self._write_statistics(f, statistics)
             
             # Top words section
             if top_n is None:
                 f.write(f"## 📝 All Words Meeting Frequency Threshold ({len(top_words)} words)\n\n")
             else:
                 f.write(f"## 🔝 Top {min(top_n, len(top_words))} Most Frequent Words\n\n")
-            f.write("| Rank | Word | Frequency | Percentage |\n")
-            f.write("|------|------|-----------|------------|\n")
-            
-            total_words = statistics.get('total_words', 1)
-            for i, (word, freq) in enumerate(top_words, 1):
-                percentage = (freq / total_words * 100) if total_words > 0 else 0
-                f.write(f"| {i} | {word} | {freq:,} | {percentage:.2f}% |\n")
+            self._write_word_table(f, top_words, statistics, dispersion)
             
             # Sources section
             f.write(f"\n## 📁 Source Files ({len(sources)})\n\n")
@@ -184,6 +194,61 @@ class ReportGenerator:
         
         return filepath
 
+    def _write_notices(
+        self,
+        f: TextIO,
+        statistics: Dict[str, Any],
+        dispersion: Optional[Dict[str, Dict[str, float]]]
+    ) -> None:
+        """Write the approximate counting and dispersion ranking notes, when they apply."""
+        if statistics.get('estimated', False):
+            f.write("> **Approximate counting:** frequencies marked ~ are estimates, never "
+                    "below the true count and at most "
+                    f"{statistics.get('max_overestimate', 0):,} above it. Unique words "
+                    "counts only the tracked candidates.\n\n")
+        if dispersion:
+            f.write("> **Ranked by dispersion:** usage = frequency weighted by how evenly "
+                    "a word is spread across files (Juilland's D: 1 = even; Gries' DP: "
+                    "0 = even), so words heard in every episode come first.\n\n")
+
+    def _write_statistics(self, f: TextIO, statistics: Dict[str, Any]) -> None:
+        """Write the statistics section."""
+        mark = "~" if statistics.get('estimated', False) else ""
+        f.write("## 📊 Statistics\n\n")
+        f.write(f"- **Total words analyzed:** {statistics.get('total_words', 0):,}\n")
+        f.write(f"- **Unique words:** {statistics.get('unique_words', 0):,}\n")
+        f.write(f"- **Average frequency:** {statistics.get('avg_frequency', 0):.2f}\n")
+        f.write(f"- **Most common word:** {statistics.get('most_common_word', ('N/A', 0))[0]} "
+                f"({mark}{statistics.get('most_common_word', ('N/A', 0))[1]} occurrences)\n")
+        f.write(f"- **Max frequency:** {statistics.get('max_frequency', 0)}\n")
+        f.write(f"- **Median frequency:** {statistics.get('median_frequency', 0):.1f}\n\n")
+
+    def _write_word_table(
+        self,
+        f: TextIO,
+        top_words: List[Tuple[str, int]],
+        statistics: Dict[str, Any],
+        dispersion: Optional[Dict[str, Dict[str, float]]]
+    ) -> None:
+        """Write the ranked word table, with Files, D and DP columns when ranking by dispersion."""
+        if dispersion:
+            f.write("| Rank | Word | Frequency | Percentage | Files | D | DP |\n")
+            f.write("|------|------|-----------|------------|-------|---|----|\n")
+        else:
+            f.write("| Rank | Word | Frequency | Percentage |\n")
+            f.write("|------|------|-----------|------------|\n")
+
+        mark = "~" if statistics.get('estimated', False) else ""
+        total_words = statistics.get('total_words', 1)
+        for i, (word, freq) in enumerate(top_words, 1):
+            percentage = (freq / total_words * 100) if total_words > 0 else 0
+            f.write(f"| {i} | {word} | {mark}{freq:,} | {percentage:.2f}% |")
+            if dispersion:
+                row = dispersion.get(word)
+                f.write(f" {row['documents']} | {row['juilland_d']:.2f} | {row['gries_dp']:.2f} |"
+                        if row else " | | |")
+            f.write("\n")
+
     def generate_lemma_markdown_summary(
         self,
         lemma_groups: Dict[str, LemmaGroup],
@@ -220,6 +285,9 @@ class ReportGenerator:
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write("# Word Frequency Analysis Report (Lemma-Grouped)\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            if statistics.get('estimated', False):
+                f.write("> **Approximate counting:** frequencies are estimates, at most "
+                        f"{statistics.get('max_overestimate', 0):,} above the true count.\n\n")
 
             f.write("## 📊 Statistics\n\n")
             f.write(f"- **Total surface forms analyzed:** {statistics.get('total_words', 0):,}\n")
@@ -244,6 +312,42 @@ class ReportGenerator:
 
         return filepath
 
+    def _ranked_items(
+        self,
+        frequencies: Dict[str, int],
+        dispersion: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Order words for a report.
+
+        Args:
+            frequencies: Word frequency dictionary
+            dispersion: Per-word dispersion rows; words without one rank last
+
+        Returns:
+            (word, frequency) tuples by descending usage if dispersion is
+            given, else by descending frequency
+        """
+        if dispersion:
+            return sorted(
+                frequencies.items(),
+                key=lambda x: dispersion[x[0]]['usage'] if x[0] in dispersion else -1.0,
+                reverse=True
+            )
+        return sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
+
+    def _dispersion_cells(self, row: Optional[Dict[str, float]]) -> List[str]:
+        """Format a dispersion row as CSV cells (blank if missing)."""
+        if row is None:
+            return [''] * len(self.DISPERSION_COLUMNS)
+        return [
+            str(row['documents']),
+            f"{row['juilland_d']:.4f}",
+            f"{row['gries_dp']:.4f}",
+            f"{row['tfidf']:.6f}",
+            f"{row['usage']:.2f}",
+        ]
+
     def _calculate_distribution(
         self, 
         frequencies: Dict[str, int]
@@ -257,40 +361,31 @@ class ReportGenerator:
         Returns:
             Dictionary mapping bucket labels to counts
         """
-        distribution = {
-            "1 time": 0,
-            "2-5 times": 0,
-            "6-10 times": 0,
-            "11-20 times": 0,
-            "21-50 times": 0,
-            "51-100 times": 0,
-            "100+ times": 0
-        }
-        
+        if self._numpy is not None:
+            values = self._numpy.values_array(frequencies.values(), len(frequencies))
+            counts = self._numpy.bucket_counts(
+                values, [lowest for _, lowest in self.DISTRIBUTION_BUCKETS]
+            )
+            return {label: count for (label, _), count in zip(self.DISTRIBUTION_BUCKETS, counts)}
+
+        labels = [label for label, _ in self.DISTRIBUTION_BUCKETS]
+        lower_bounds = [lowest for _, lowest in self.DISTRIBUTION_BUCKETS]
+        distribution = dict.fromkeys(labels, 0)
         for freq in frequencies.values():
-            if freq == 1:
-                distribution["1 time"] += 1
-            elif freq <= 5:
-                distribution["2-5 times"] += 1
-            elif freq <= 10:
-                distribution["6-10 times"] += 1
-            elif freq <= 20:
-                distribution["11-20 times"] += 1
-            elif freq <= 50:
-                distribution["21-50 times"] += 1
-            elif freq <= 100:
-                distribution["51-100 times"] += 1
-            else:
-                distribution["100+ times"] += 1
+            # Last bucket whose lower bound is <= freq
+            position = bisect_right(lower_bounds, freq) - 1
+            if position >= 0:
+                distribution[labels[position]] += 1
         
         return distribution
     
     def generate_all_reports(
         self,
         frequencies: Dict[str, int],
-        statistics: Dict[str, any],
+        statistics: Dict[str, Any],
         sources: List[str],
-        top_n: int = 500
+        top_n: int = 500,
+        dispersion: Optional[Dict[str, Dict[str, float]]] = None
     ) -> Dict[str, Path]:
         """
         Generate all report formats at once.
@@ -300,6 +395,7 @@ class ReportGenerator:
             statistics: Analysis statistics
             sources: List of source files
             top_n: Number of words for final lists
+            dispersion: Per-word dispersion rows (ranking: dispersion)
             
         Returns:
             Dictionary mapping report type to file path
@@ -310,13 +406,17 @@ class ReportGenerator:
         reports['csv'] = self.generate_csv_report(
             frequencies,
             statistics.get('total_words', 0),
-            top_n=top_n
+            top_n=top_n,
+            estimated=statistics.get('estimated', False),
+            dispersion=dispersion
         )
         
         # Anki word list
         reports['anki'] = self.generate_anki_wordlist(
             frequencies,
-            top_n=top_n
+            top_n=top_n,
+            estimated=statistics.get('estimated', False),
+            dispersion=dispersion
         )
         
         # Markdown summary - show all words by default
@@ -324,7 +424,8 @@ class ReportGenerator:
             frequencies,
             statistics,
             sources,
-            top_n=None  # Show all words that meet threshold
+            top_n=None,  # Show all words that meet threshold
+            dispersion=dispersion
         )
         
         return reports
@@ -0,0 +1,103 @@
+"""
+Sentence Builder Module
+
+Rebuilds sentences that subtitle files split across cues, so context
+lookups (pronoun helper, DeepL) see whole sentences instead of fragments.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Tuple
+
+
+@dataclass(slots=True)
+class Sentence:
+    """A sentence rebuilt from consecutive cue lines."""
+    lines: Tuple[str, ...]
+    cue_start: int  # position of the first cue in the file's cue stream
+    cue_end: int    # position after the last cue (exclusive)
+
+    @property
+    def text(self) -> str:
+        """Sentence text with its lines joined by spaces."""
+        return " ".join(self.lines)
+
+
+class SentenceBuilder:
+    """Join continuation cues into sentences in a single streaming pass."""
+
+    # Sentence-final punctuation, optionally followed by closing quotes,
+    # brackets or formatting tags
+    TERMINAL_PATTERN = re.compile(r'[.!?…]["\'»”’)\]]*(?:</\w+>)*$')
+
+    # Formatting tags (<i>, <font color="...">) that may open a line
+    TAG_PATTERN = re.compile(r"<[^>]*>")
+
+    # A line opening with a dash is a new speaker
+    DIALOGUE_DASHES = ("-", "–", "—")
+
+    def __init__(self, max_gap_ms: int = 1500, max_cues: int = 4) -> None:
+        """
+        Initialize sentence builder.
+
+        Args:
+            max_gap_ms: Cues further apart than this never join
+            max_cues: Maximum number of cues one sentence may span
+        """
+        self.max_gap_ms = max_gap_ms
+        self.max_cues = max(1, max_cues)
+
+    def iter_sentences(self, cues: Iterable[Any]) -> Iterator[Sentence]:
+        """
+        Group a file's cues into sentences.
+
+        Only the sentence being built is held in memory, so this can wrap
+        the parser's cue stream directly.
+
+        Args:
+            cues: Cue records in file order (anything with start_ms,
+                end_ms and lines)
+
+        Returns:
+            Iterator of Sentence records covering every cue line in order
+        """
+        lines: List[str] = []
+        cue_start = 0
+        previous_end_ms = 0
+        position = -1
+
+        for position, cue in enumerate(cues):
+            for line_number, line in enumerate(cue.lines):
+                new_cue = line_number == 0
+                if lines:
+                    gap_ms = cue.start_ms - previous_end_ms if new_cue else 0
+                    too_long = new_cue and position - cue_start >= self.max_cues
+                    if too_long or not self._continues(lines[-1], line, gap_ms):
+                        yield Sentence(
+                            tuple(lines), cue_start, position if new_cue else position + 1
+                        )
+                        lines = []
+                        cue_start = position
+                lines.append(line)
+            previous_end_ms = cue.end_ms
+
+        if lines:
+            yield Sentence(tuple(lines), cue_start, position + 1)
+
+    def _continues(self, previous: str, line: str, gap_ms: int) -> bool:
+        """Decide whether line carries on the sentence ending with previous."""
+        if gap_ms > self.max_gap_ms:
+            return False
+        if line.startswith(self.DIALOGUE_DASHES):
+            return False
+        if not self.TERMINAL_PATTERN.search(previous):
+            return True
+        # "Sr. Gómez" or "...y luego": punctuation, but the sentence goes on
+        return self._starts_lowercase(line)
+
+    def _starts_lowercase(self, line: str) -> bool:
+        """Check whether the first letter of a line, ignoring tags, is lowercase."""
+        for char in self.TAG_PATTERN.sub("", line):
+            if char.isalpha():
+                return char.islower()
+        return False
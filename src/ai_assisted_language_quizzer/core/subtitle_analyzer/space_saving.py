@@ -0,0 +1,105 @@
+"""
+Space-Saving Module
+
+Heavy-hitters summary that tracks at most K candidate words. When a new
+word arrives and all K slots are taken, the word with the smallest count
+is replaced and the new word inherits that count as its possible error.
+
+Error bound: after N occurrences every tracked count exceeds the true
+count by at most its recorded error, which is at most N / K, and every
+word occurring more than N / K times is guaranteed to be tracked.
+
+When a newcomer's earlier count can be bounded more tightly (add() with
+prior), it inherits that bound instead: counts stay upper bounds, but the
+N / K guarantees then rest on the accuracy of the priors.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class SpaceSaving:
+    """Track the top K words of a stream in O(K) memory."""
+
+    def __init__(self, capacity: int = 5000) -> None:
+        """
+        Initialize an empty summary.
+
+        Args:
+            capacity: Maximum number of tracked words (K)
+        """
+        if capacity < 1:
+            raise ValueError("Space-Saving capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}  # word -> count inherited on insertion
+        # Min-heap with one (count, word) entry per tracked word. Counts only
+        # grow, so entries are refreshed lazily when they reach the top.
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, word: str, count: int = 1, prior: Optional[int] = None) -> None:
+        """
+        Add occurrences of a word.
+
+        Args:
+            word: Word to count
+            count: Occurrences to add (must be positive)
+            prior: Upper bound of the word's count before this call, e.g.
+                from a Count-Min Sketch. An evicting newcomer inherits it
+                instead of the evicted count, which is usually far larger
+                than the newcomer's real history. Pass it for every call or
+                for none: mixing the two can undercount.
+        """
+        self.total += count
+        counts = self.counts
+        current = counts.get(word)
+        if current is not None:
+            counts[word] = current + count
+            return
+        if len(counts) < self.capacity:
+            counts[word] = count
+            self.errors[word] = 0
+        else:
+            floor, evicted = self._pop_min()
+            del counts[evicted], self.errors[evicted]
+            if prior is not None:
+                floor = prior
+            counts[word] = floor + count
+            self.errors[word] = floor
+        heapq.heappush(self._heap, (counts[word], word))
+
+    def _pop_min(self) -> Tuple[int, str]:
+        """Remove and return the tracked word with the smallest count."""
+        heap = self._heap
+        counts = self.counts
+        while True:
+            value, word = heap[0]
+            current = counts[word]
+            if current == value:
+                return heapq.heappop(heap)
+            heapq.heapreplace(heap, (current, word))
+
+    def items(self) -> List[Tuple[str, int, int]]:
+        """
+        Get the tracked words.
+
+        Returns:
+            List of (word, count, error) tuples, highest count first; the
+            true count lies in [count - error, count]
+        """
+        errors = self.errors
+        return sorted(
+            ((word, count, errors[word]) for word, count in self.counts.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def error_bound(self) -> float:
+        """
+        Get the worst-case overestimate for the occurrences added so far.
+
+        Returns:
+            total / capacity
+        """
+        return self.total / self.capacity
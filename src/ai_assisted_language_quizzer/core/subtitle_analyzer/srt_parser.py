@@ -4,9 +4,36 @@ SRT Parser Module
 Handles parsing of SubRip (.srt) subtitle files and extracting text content.
 """
 
+import codecs
+import io
+import itertools
+import json
 import re
+from array import array
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from .archive_reader import ArchiveReader, SubtitleSource
+from .cue_deduplicator import CueDeduplicator
+from .cue_filter import CueFilter
+from .cue_table import Cue, CueTable
+from .parse_cache import ParseCache
+from .sentence_builder import SentenceBuilder
+from .word_processor import WordProcessor
+
+
+@dataclass
+class FileTokens:
+    """Token counts for one subtitle file, as returned by tokenize workers."""
+    name: str
+    counts: Counter = field(default_factory=Counter)
+    contexts: Dict[str, str] = field(default_factory=dict)  # word -> first line
+    error: Optional[str] = None
+    cached: bool = False  # True when loaded from a ParseCache
+    suppressed: Dict[int, str] = field(default_factory=dict)  # cue hash -> skipped cue text
 
 
 class SRTParser:
@@ -14,13 +41,54 @@ class SRTParser:
     
     # Regex pattern for timestamp lines (e.g., "00:00:05,000 --> 00:00:09,720")
     TIMESTAMP_PATTERN = re.compile(
-        r'^\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}'
+        r'^(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})'
     )
     
-    def __init__(self):
-        """Initialize SRT parser."""
+    # Byte-order marks checked before any sniffing
+    BOMS = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    
+    # Bytes 0x80-0x9F are punctuation (curly quotes, dashes) in cp1252 but
+    # unused control codes in latin-1, so their presence points to cp1252
+    C1_BYTES_PATTERN = re.compile(rb'[\x80-\x9f]')
+    
+    # Bytes that cp1252 leaves undefined; if present the file is not cp1252
+    CP1252_UNDEFINED_PATTERN = re.compile(rb'[\x81\x8d\x8f\x90\x9d]')
+    
+    def __init__(
+        self,
+        encoding_manifest: Optional[Path] = None,
+        cue_filter: Optional[CueFilter] = None,
+        sentence_builder: Optional[SentenceBuilder] = None
+    ):
+        """
+        Initialize SRT parser.
+        
+        Args:
+            encoding_manifest: Optional JSON file caching the detected
+                encoding per file, so unchanged files are decoded directly
+            cue_filter: Optional filter; matching cues (e.g. Amara.org
+                credits) are dropped while parsing
+            sentence_builder: Optional builder; when set, word contexts
+                are whole sentences rebuilt across cues instead of lines
+        """
         self.files_processed = []
         self.parse_errors = []
+        self.cue_filter = cue_filter
+        self.sentence_builder = sentence_builder
+        self.cues_removed: Counter = Counter()  # pattern -> cues dropped
+        self.encoding_manifest = (
+            Path(encoding_manifest) if encoding_manifest else None
+        )
+        self._encodings: Dict[str, Dict[str, Any]] = {}
+        self._manifest_dirty = False
+        self.archive_reader = ArchiveReader()
+        
+        if self.encoding_manifest and self.encoding_manifest.exists():
+            self.load_encoding_manifest()
     
     def is_timestamp_line(self, line: str) -> bool:
         """Check if a line is a timestamp."""
@@ -30,109 +98,684 @@ class SRTParser:
         """Check if a line is a subtitle index number."""
         return line.strip().isdigit()
     
-    def parse_file(self, filepath: Path) -> List[str]:
+    def parse_timestamp_line(self, line: str) -> Optional[Tuple[int, int]]:
         """
-        Parse a single SRT file and extract subtitle text.
+        Parse a timestamp line into integer milliseconds.
+        
+        Args:
+            line: Candidate timestamp line
+            
+        Returns:
+            Tuple of (start_ms, end_ms), or None if the line is not a timestamp
+        """
+        match = self.TIMESTAMP_PATTERN.match(line)
+        if not match:
+            return None
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups())
+        start_ms = ((h1 * 60 + m1) * 60 + s1) * 1000 + ms1
+        end_ms = ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2
+        return start_ms, end_ms
+    
+    def iter_cues(self, filepath: Path) -> Iterator[Cue]:
+        """
+        Lazily iterate over the cues of a single SRT file.
+        
+        Cues are produced line by line, so only the current cue is held
+        in memory. Text lines that appear before the first timestamp are
+        yielded as a cue with zero timing.
         
         Args:
             filepath: Path to the .srt file
             
         Returns:
-            List of subtitle text lines
+            Iterator of Cue records in file order
             
         Raises:
             FileNotFoundError: If file doesn't exist
-            UnicodeDecodeError: If file encoding is not supported
         """
+        filepath = Path(filepath)
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
+        return self._iter_cue_records(str(filepath), self._iter_lines(filepath))
+    
+    def iter_source_cues(self, source: SubtitleSource) -> Iterator[Cue]:
+        """
+        Lazily iterate over the cues of a file or in-memory archive member.
         
-        text_lines = []
+        Args:
+            source: Subtitle source from iter_sources()
+            
+        Returns:
+            Iterator of Cue records in file order
+        """
+        if source.data is None:
+            return self.iter_cues(source.path)
+        _, text = self.detect_encoding(source.data)
+        return self._iter_cue_records(
+            source.name, io.StringIO(text, newline=None)
+        )
+    
+    def detect_encoding(self, data: bytes) -> Tuple[str, str]:
+        """
+        Detect the encoding of an in-memory subtitle file and decode it.
+        
+        Checks for a byte-order mark first, then for valid UTF-8, and
+        finally chooses between cp1252 and latin-1 by looking for bytes in
+        the 0x80-0x9F range.
+        
+        Args:
+            data: Raw file contents
+            
+        Returns:
+            Tuple of (encoding name, decoded text)
+        """
+        for bom, encoding in self.BOMS:
+            if data.startswith(bom):
+                return encoding, data.decode(encoding)
         
         try:
-            # Try UTF-8 first, fallback to latin-1
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-            content = None
-            
-            for encoding in encodings:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        content = f.readlines()
-                    break
-                except UnicodeDecodeError:
-                    continue
+            return 'utf-8', data.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+        if (self.C1_BYTES_PATTERN.search(data)
+                and not self.CP1252_UNDEFINED_PATTERN.search(data)):
+            return 'cp1252', data.decode('cp1252')
+        return 'latin-1', data.decode('latin-1')
+    
+    def _iter_lines(self, filepath: Path) -> Iterator[str]:
+        """
+        Yield decoded lines of a file.
+        
+        Files with a still-valid manifest entry are streamed with the cached
+        encoding. Otherwise the bytes are read once and sniffed in memory.
+        """
+        key = str(filepath.resolve())
+        stat = filepath.stat()
+        cached = self._encodings.get(key)
+        
+        if (cached
+                and cached["size"] == stat.st_size
+                and cached["mtime_ns"] == stat.st_mtime_ns):
+            with open(filepath, 'r', encoding=cached["encoding"]) as f:
+                yield from f
+            return
+        
+        encoding, text = self.detect_encoding(filepath.read_bytes())
+        self._encodings[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "encoding": encoding,
+        }
+        self._manifest_dirty = True
+        yield from io.StringIO(text, newline=None)
+    
+    def load_encoding_manifest(self) -> None:
+        """Load cached per-file encodings from the manifest file."""
+        try:
+            with open(self.encoding_manifest, 'r', encoding='utf-8') as f:
+                self._encodings = json.load(f).get("files", {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable encoding manifest: {e}")
+            self._encodings = {}
+    
+    def save_encoding_manifest(self) -> None:
+        """Write detected encodings to the manifest file if any changed."""
+        if not self.encoding_manifest or not self._manifest_dirty:
+            return
+        
+        self.encoding_manifest.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.encoding_manifest, 'w', encoding='utf-8') as f:
+            json.dump({"version": 1, "files": self._encodings}, f, indent=1)
+        self._manifest_dirty = False
+    
+    def _iter_cue_records(
+        self,
+        label: str,
+        lines: Iterable[str]
+    ) -> Iterator[Cue]:
+        """Group stripped lines into Cue records."""
+        index, start_ms, end_ms = 0, 0, 0
+        pending_index: Optional[int] = None
+        text_lines: List[str] = []
+        
+        for line in lines:
+            line = line.strip()
             
-            if content is None:
-                raise UnicodeDecodeError(
-                    "Unable to decode file with supported encodings"
-                )
+            # Skip empty lines
+            if not line:
+                continue
             
-            for line in content:
-                line = line.strip()
-                
-                # Skip empty lines
-                if not line:
-                    continue
-                
-                # Skip index numbers
-                if self.is_index_line(line):
-                    continue
-                
-                # Skip timestamp lines
-                if self.is_timestamp_line(line):
-                    continue
-                
+            # Index numbers are remembered for the following timestamp; an
+            # index too large for CueTable is malformed and ignored, so the
+            # cue is numbered after the previous one
+            if line.isdecimal():
+                number = int(line)
+                if number <= CueTable.MAX_INDEX:
+                    pending_index = number
+                continue
+            
+            timing = self.parse_timestamp_line(line)
+            if timing is None:
                 # This is subtitle text
                 text_lines.append(line)
+                continue
             
-            self.files_processed.append(str(filepath))
+            if text_lines:
+                if self._keep_cue(text_lines):
+                    yield Cue(index, start_ms, end_ms, tuple(text_lines))
+                text_lines = []
+            index = pending_index if pending_index is not None else index + 1
+            pending_index = None
+            start_ms, end_ms = timing
+        
+        if text_lines and self._keep_cue(text_lines):
+            yield Cue(index, start_ms, end_ms, tuple(text_lines))
+        
+        self.files_processed.append(label)
+    
+    def _keep_cue(self, text_lines: List[str]) -> bool:
+        """Check a cue against the cue filter, counting removals per pattern."""
+        if self.cue_filter is None:
+            return True
+        pattern = self.cue_filter.match("\n".join(text_lines))
+        if pattern is None:
+            return True
+        self.cues_removed[pattern] += 1
+        return False
+    
+    def parse_file(self, filepath: Path) -> List[str]:
+        """
+        Parse a single SRT file and extract subtitle text.
+        
+        Args:
+            filepath: Path to the .srt file
             
+        Returns:
+            List of subtitle text lines
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        try:
+            return [
+                line
+                for cue in self.iter_cues(filepath)
+                for line in cue.lines
+            ]
         except Exception as e:
             error_msg = f"Error parsing {filepath}: {str(e)}"
             self.parse_errors.append(error_msg)
             raise
-        
-        return text_lines
     
-    def parse_directory(
-        self, 
-        dirpath: Path, 
-        pattern: str = "*.srt"
-    ) -> Dict[str, List[str]]:
+    def find_files(self, dirpath: Path, pattern: str = "*.srt") -> List[Path]:
         """
-        Parse all SRT files in a directory.
+        List the subtitle files and archives in a directory in sorted order.
         
         Args:
-            dirpath: Path to directory containing .srt files
+            dirpath: Directory containing .srt files and/or archives, or a
+                single archive (.zip, .tar, .tar.gz, .gz)
             pattern: File pattern to match (default: "*.srt")
             
         Returns:
-            Dictionary mapping filename to list of subtitle text lines
+            Sorted list of matching file and archive paths
         """
         if not dirpath.exists():
             raise FileNotFoundError(f"Directory not found: {dirpath}")
         
+        if dirpath.is_file() and self.archive_reader.is_archive(dirpath):
+            return [dirpath]
+        
         if not dirpath.is_dir():
-            raise ValueError(f"Path is not a directory: {dirpath}")
+            raise ValueError(f"Path is not a directory or archive: {dirpath}")
         
-        results = {}
-        srt_files = sorted(dirpath.glob(pattern))
+        archives = {
+            path for path in dirpath.iterdir()
+            if path.is_file() and self.archive_reader.is_archive(path)
+        }
+        srt_files = sorted(set(dirpath.glob(pattern)) | archives)
         
         if not srt_files:
             raise ValueError(f"No files matching '{pattern}' found in {dirpath}")
         
-        for srt_file in srt_files:
+        return srt_files
+    
+    def iter_sources(
+        self,
+        dirpath: Path,
+        pattern: str = "*.srt",
+        quiet: bool = False
+    ) -> Iterator[SubtitleSource]:
+        """
+        Iterate over subtitle files and archive members without extracting.
+        
+        Archive members are named "archive!member"; an unreadable archive
+        is recorded in parse_errors and skipped.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            pattern: File pattern to match (default: "*.srt")
+            quiet: Skip unreadable archives without reporting them, for
+                passes that iterate the sources a second time
+            
+        Returns:
+            Iterator of SubtitleSource records in sorted order
+        """
+        for path in self.find_files(dirpath, pattern):
+            if not self.archive_reader.is_archive(path):
+                yield SubtitleSource(path.name, path)
+                continue
             try:
-                text_lines = self.parse_file(srt_file)
-                results[srt_file.name] = text_lines
+                yield from self.archive_reader.iter_members(path, pattern)
+            except Exception as e:
+                if quiet:
+                    continue
+                error_msg = f"Failed to read archive {path.name}: {str(e)}"
+                self.parse_errors.append(error_msg)
+                print(f"⚠️  {error_msg}")
+    
+    def iter_directory(
+        self,
+        dirpath: Path,
+        pattern: str = "*.srt"
+    ) -> Iterator[Tuple[str, Iterator[Cue]]]:
+        """
+        Lazily iterate over the cues of every SRT file in a directory.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            pattern: File pattern to match (default: "*.srt")
+            
+        Returns:
+            Iterator of (source name, cue iterator) pairs in sorted order
+        """
+        for source in self.iter_sources(dirpath, pattern):
+            yield source.name, self.iter_source_cues(source)
+    
+    def parse_directory(
+        self, 
+        dirpath: Path, 
+        pattern: str = "*.srt"
+    ) -> Dict[str, List[str]]:
+        """
+        Parse all SRT files in a directory.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            pattern: File pattern to match (default: "*.srt")
+            
+        Returns:
+            Dictionary mapping source name to list of subtitle text lines
+        """
+        return self.parse_table(dirpath, pattern).as_dict()
+    
+    def parse_table(self, dirpath: Path, pattern: str = "*.srt") -> CueTable:
+        """
+        Parse all SRT files in a directory into a compact CueTable.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            pattern: File pattern to match (default: "*.srt")
+            
+        Returns:
+            CueTable with one file per parsed source, in sorted order
+        """
+        table = CueTable()
+        
+        for filename, cues in self.iter_directory(dirpath, pattern):
+            try:
+                table.add_file(filename, cues)
             except Exception as e:
                 # Log error but continue processing other files
-                error_msg = f"Failed to parse {srt_file.name}: {str(e)}"
+                error_msg = f"Failed to parse {filename}: {str(e)}"
                 self.parse_errors.append(error_msg)
                 print(f"⚠️  {error_msg}")
         
+        self.save_encoding_manifest()
+        return table
+    
+    def tokenize_table(
+        self,
+        table: CueTable,
+        word_processor: WordProcessor
+    ) -> Dict[str, FileTokens]:
+        """
+        Tokenize every file of a CueTable without re-reading it from disk.
+        
+        Args:
+            table: Table from parse_table()
+            word_processor: Processor used to tokenize each text line
+            
+        Returns:
+            Dictionary mapping source name to FileTokens (see tokenize_file())
+        """
+        results = {}
+        for file_id, name in enumerate(table.file_names):
+            file_tokens = FileTokens(name=name)
+            self._count_cues(table.iter_cues(file_id), word_processor, file_tokens)
+            results[name] = file_tokens
         return results
     
+    def tokenize_file(
+        self,
+        filepath: Path,
+        word_processor: WordProcessor,
+        cache: Optional[ParseCache] = None
+    ) -> FileTokens:
+        """
+        Parse and tokenize a single SRT file into per-file word counts.
+        
+        Args:
+            filepath: Path to the .srt file
+            word_processor: Processor used to tokenize each text line
+            cache: Optional parse cache consulted before tokenizing
+            
+        Returns:
+            FileTokens with word counts and the first line each word
+            appeared in; parse failures are reported in its error field
+        """
+        filepath = Path(filepath)
+        source = SubtitleSource(filepath.name, filepath)
+        return self.tokenize_source(source, word_processor, cache)
+    
+    def tokenize_source(
+        self,
+        source: SubtitleSource,
+        word_processor: WordProcessor,
+        cache: Optional[ParseCache] = None,
+        skip: FrozenSet[int] = frozenset()
+    ) -> FileTokens:
+        """
+        Parse and tokenize a subtitle file or archive member.
+        
+        Args:
+            source: Subtitle source from iter_sources()
+            word_processor: Processor used to tokenize each text line
+            cache: Optional parse cache consulted before tokenizing
+            skip: Hashes of duplicate cues to leave out (see CueDeduplicator)
+            
+        Returns:
+            FileTokens named after the source (see tokenize_file())
+        """
+        file_tokens = FileTokens(name=source.name)
+        
+        try:
+            if cache is None:
+                cues = self.iter_source_cues(source)
+                self._count_cues(cues, word_processor, file_tokens, skip)
+            else:
+                self._tokenize_with_cache(
+                    source, word_processor, cache, file_tokens, skip
+                )
+        except Exception as e:
+            file_tokens.error = f"Failed to parse {source.name}: {str(e)}"
+        
+        return file_tokens
+    
+    def _count_cues(
+        self,
+        cues: Iterable[Cue],
+        word_processor: WordProcessor,
+        file_tokens: FileTokens,
+        skip: FrozenSet[int] = frozenset()
+    ) -> None:
+        """Tokenize cue text into the counts and contexts of file_tokens."""
+        if skip:
+            cues = self._skip_cues(cues, skip, file_tokens)
+        
+        # (context, lines) passages: each line is its own context, or with a
+        # sentence builder the rebuilt sentence is the context of its lines
+        if self.sentence_builder is None:
+            passages = ((line, (line,)) for cue in cues for line in cue.lines)
+        else:
+            passages = (
+                (sentence.text, sentence.lines)
+                for sentence in self.sentence_builder.iter_sentences(cues)
+            )
+        
+        counts = file_tokens.counts
+        contexts = file_tokens.contexts
+        for context, lines in passages:
+            for line in lines:
+                words = word_processor.process_text(line)
+                counts.update(words)
+                for word in words:
+                    if word not in contexts:
+                        contexts[word] = context
+    
+    def _skip_cues(
+        self,
+        cues: Iterable[Cue],
+        skip: FrozenSet[int],
+        file_tokens: FileTokens
+    ) -> Iterator[Cue]:
+        """Leave out duplicate cues, recording their text in file_tokens."""
+        for cue in cues:
+            cue_hash = CueDeduplicator.hash_cue(cue.lines)
+            if cue_hash in skip:
+                file_tokens.suppressed.setdefault(cue_hash, " / ".join(cue.lines))
+                continue
+            yield cue
+    
+    def _tokenize_with_cache(
+        self,
+        source: SubtitleSource,
+        word_processor: WordProcessor,
+        cache: ParseCache,
+        file_tokens: FileTokens,
+        skip: FrozenSet[int] = frozenset()
+    ) -> None:
+        """Fill file_tokens from the cache, tokenizing and storing on a miss."""
+        if source.data is None:
+            source = SubtitleSource(
+                source.name, source.path, source.path.read_bytes()
+            )
+        key = cache.make_key(source.data, skip)
+        entry = cache.get(key)
+        
+        if entry is not None:
+            file_tokens.counts = entry["counts"]
+            file_tokens.contexts = entry["contexts"]
+            file_tokens.suppressed = entry["suppressed"]
+            file_tokens.cached = True
+            self.cues_removed.update(entry["removed"])
+            self.files_processed.append(source.name)
+            return
+        
+        # The bytes are already in memory, so decode them directly
+        removed_before = self.cues_removed.copy()
+        cues = self.iter_source_cues(source)
+        self._count_cues(cues, word_processor, file_tokens, skip)
+        cache.put(
+            key,
+            file_tokens.counts,
+            file_tokens.contexts,
+            file_tokens.suppressed,
+            self.cues_removed - removed_before,
+        )
+    
+    def hash_source(
+        self,
+        source: SubtitleSource,
+        cache: Optional[ParseCache] = None
+    ) -> array:
+        """
+        Hash the cues of one source for duplicate cue detection.
+        
+        Args:
+            source: Subtitle source from iter_sources()
+            cache: Optional parse cache; unchanged files are not re-parsed
+            
+        Returns:
+            Array of distinct cue hashes; empty if the source cannot be read
+            (the error is reported when the source is tokenized)
+        """
+        processed = len(self.files_processed)
+        removed_before = self.cues_removed.copy()
+        try:
+            if cache is None:
+                return self._hash_cues(source)
+            if source.data is None:
+                source = SubtitleSource(
+                    source.name, source.path, source.path.read_bytes()
+                )
+            key = cache.make_key(source.data)
+            hashes = cache.get_hashes(key)
+            if hashes is None:
+                hashes = self._hash_cues(source)
+                cache.put_hashes(key, hashes)
+            return hashes
+        except Exception:
+            return array("Q")
+        finally:
+            # Only the tokenize pass counts as processing the file
+            del self.files_processed[processed:]
+            self.cues_removed = removed_before
+    
+    def _hash_cues(self, source: SubtitleSource) -> array:
+        """Parse one source and hash its cues."""
+        cues = self.iter_source_cues(source)
+        return CueDeduplicator.file_hashes(cue.lines for cue in cues)
+    
+    def tokenize_directory(
+        self,
+        dirpath: Path,
+        word_processor: WordProcessor,
+        pattern: str = "*.srt",
+        workers: int = 1,
+        cache: Optional[ParseCache] = None,
+        deduplicator: Optional[CueDeduplicator] = None
+    ) -> Dict[str, FileTokens]:
+        """
+        Parse and tokenize all SRT files in a directory or archive.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            word_processor: Processor used to tokenize each text line
+            pattern: File pattern to match (default: "*.srt")
+            workers: Number of worker processes (1 = parse in-process)
+            cache: Optional parse cache; unchanged files are loaded from it
+            deduplicator: Optional duplicate cue suppression
+            
+        Returns:
+            Dictionary mapping source name to FileTokens, in sorted order
+            (see iter_tokenized())
+        """
+        return {
+            file_tokens.name: file_tokens
+            for file_tokens in self.iter_tokenized(
+                dirpath, word_processor, pattern, workers, cache, deduplicator
+            )
+        }
+    
+    def iter_tokenized(
+        self,
+        dirpath: Path,
+        word_processor: WordProcessor,
+        pattern: str = "*.srt",
+        workers: int = 1,
+        cache: Optional[ParseCache] = None,
+        deduplicator: Optional[CueDeduplicator] = None
+    ) -> Iterator[FileTokens]:
+        """
+        Parse and tokenize all SRT files, yielding each file as it is done.
+        
+        With workers > 1 the files are spread over a process pool. Workers
+        return per-file counts rather than text lines, and results are
+        yielded in sorted source order so output is deterministic. With a
+        deduplicator, a hashing pass over every file runs first so cues
+        repeated across many files are skipped while tokenizing; both
+        passes read the sources lazily, one file at a time. Files that
+        fail to parse are reported and skipped.
+        
+        Args:
+            dirpath: Directory or archive path (see find_files())
+            word_processor: Processor used to tokenize each text line
+            pattern: File pattern to match (default: "*.srt")
+            workers: Number of worker processes (1 = parse in-process)
+            cache: Optional parse cache; unchanged files are loaded from it
+            deduplicator: Optional duplicate cue suppression
+            
+        Returns:
+            Iterator of FileTokens, in sorted source order
+        """
+        skips = itertools.repeat(frozenset())
+        
+        if workers > 1:
+            window = 4 * workers
+            with self._create_pool(workers, word_processor, cache) as executor:
+                if deduplicator is not None:
+                    hashed = _map_bounded(
+                        executor, _hash_in_worker, window,
+                        self.iter_sources(dirpath, pattern, quiet=True),
+                    )
+                    skips = deduplicator.plan(hashed)
+                outcomes = _map_bounded(
+                    executor, _tokenize_in_worker, window,
+                    self.iter_sources(dirpath, pattern), skips,
+                )
+                yield from self._collect_tokenized(outcomes, word_processor)
+        else:
+            if deduplicator is not None:
+                skips = deduplicator.plan(
+                    self.hash_source(source, cache)
+                    for source in self.iter_sources(dirpath, pattern, quiet=True)
+                )
+            sources = self.iter_sources(dirpath, pattern)
+            outcomes = (
+                (
+                    self.tokenize_source(source, word_processor, cache, skip),
+                    [],
+                    Counter(),
+                    None,
+                    Counter(),
+                )
+                for source, skip in zip(sources, skips)
+            )
+            yield from self._collect_tokenized(outcomes, word_processor)
+        
+        self.save_encoding_manifest()
+    
+    def _create_pool(
+        self,
+        workers: int,
+        word_processor: WordProcessor,
+        cache: Optional[ParseCache]
+    ) -> ProcessPoolExecutor:
+        """Start tokenize workers that share this parser's settings."""
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_tokenize_worker,
+            initargs=(
+                self._encodings,
+                word_processor,
+                cache,
+                self.cue_filter,
+                self.sentence_builder,
+            ),
+        )
+    
+    def _collect_tokenized(
+        self,
+        outcomes: Iterable[Tuple[FileTokens, List[str], Counter, Optional[Tuple[str, Dict[str, Any]]], Counter]],
+        word_processor: WordProcessor
+    ) -> Iterator[FileTokens]:
+        """Yield tokenize outcomes, folding worker bookkeeping into self."""
+        for file_tokens, processed, removed, encoding_update, cache_stats in outcomes:
+            self.files_processed.extend(processed)
+            word_processor.merge_cache_stats(cache_stats)
+            self.cues_removed.update(removed)
+            if encoding_update is not None:
+                key, entry = encoding_update
+                self._encodings[key] = entry
+                self._manifest_dirty = True
+            if file_tokens.error:
+                # Log error but continue processing other files
+                self.parse_errors.append(file_tokens.error)
+                print(f"⚠️  {file_tokens.error}")
+                continue
+            yield file_tokens
+    
     def get_all_text(self, parsed_data: Dict[str, List[str]]) -> str:
         """
         Combine all subtitle text from parsed data into single string.
@@ -157,5 +800,88 @@ class SRTParser:
         """
         return {
             "files_processed": len(self.files_processed),
-            "parse_errors": len(self.parse_errors)
+            "parse_errors": len(self.parse_errors),
+            "cues_removed": sum(self.cues_removed.values())
         }
+
+
+# Per-process state for tokenize_directory() pool workers
+_worker_parser: Optional[SRTParser] = None
+_worker_processor: Optional[WordProcessor] = None
+_worker_cache: Optional[ParseCache] = None
+
+
+def _init_tokenize_worker(
+    encodings: Dict[str, Dict[str, Any]],
+    word_processor: WordProcessor,
+    cache: Optional[ParseCache],
+    cue_filter: Optional[CueFilter],
+    sentence_builder: Optional[SentenceBuilder]
+) -> None:
+    """Create the parser, word processor and cache used by this worker."""
+    global _worker_parser, _worker_processor, _worker_cache
+    _worker_parser = SRTParser(
+        cue_filter=cue_filter, sentence_builder=sentence_builder
+    )
+    _worker_parser._encodings = encodings
+    _worker_processor = word_processor
+    _worker_cache = cache
+
+
+def _map_bounded(
+    executor: ProcessPoolExecutor,
+    fn: Callable[..., Any],
+    window: int,
+    *iterables: Iterable[Any]
+) -> Iterator[Any]:
+    """
+    Like executor.map(), but keep at most window tasks in flight.
+    
+    executor.map() submits every item up front, which would hold every
+    archive member's bytes in memory at once.
+    """
+    pending: Deque[Future] = deque()
+    for args in zip(*iterables):
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _hash_in_worker(source: SubtitleSource) -> array:
+    """Hash the cues of one source in a worker process."""
+    return _worker_parser.hash_source(source, _worker_cache)
+
+
+def _tokenize_in_worker(
+    source: SubtitleSource,
+    skip: FrozenSet[int] = frozenset()
+) -> Tuple[FileTokens, List[str], Counter, Optional[Tuple[str, Dict[str, Any]]], Counter]:
+    """
+    Tokenize one source in a worker process.
+    
+    Returns the FileTokens plus the worker-side bookkeeping (processed
+    labels, filtered cue counts, any newly detected encoding and word
+    processor cache counts) for the parent to merge.
+    """
+    parser = _worker_parser
+    parser._manifest_dirty = False
+    parser.files_processed = []
+    parser.cues_removed = Counter()
+    stats_before = _worker_processor.cache_stats()
+    file_tokens = parser.tokenize_source(
+        source, _worker_processor, _worker_cache, skip
+    )
+    cache_stats = _worker_processor.cache_stats() - stats_before
+    encoding_update = None
+    if parser._manifest_dirty and source.data is None:
+        key = str(source.path.resolve())
+        encoding_update = (key, parser._encodings[key])
+    return (
+        file_tokens,
+        parser.files_processed,
+        parser.cues_removed,
+        encoding_update,
+        cache_stats,
+    )
@@ -5,21 +5,33 @@ Handles loading, managing, and filtering stopwords (common words to ignore).
 """
 
 from pathlib import Path
-from typing import Set, List
+from typing import Iterable, List, Optional, Set
+
+from .pattern_set import PatternSet
 
 
 class StopWordManager:
     """Manage stopwords for frequency analysis filtering."""
     
-    def __init__(self, stopwords_file: Path):
+    def __init__(self, stopwords_file: Path, patterns: Optional[Iterable[str]] = None):
         """
         Initialize stopword manager.
         
         Args:
             stopwords_file: Path to stopwords text file
+            patterns: Regexes for stopword variants (e.g. laughter "jajaja");
+                a word is a stopword if a pattern matches all of it.
+                None matches words from the stopwords file only
+
+        Raises:
+            ValueError: If a pattern is not a valid regex
         """
         self.stopwords_file = Path(stopwords_file)
         self.stopwords: Set[str] = set()
+        self.patterns: List[str] = list(patterns or [])
+        
+        # Patterns matched together, so a word is matched once
+        self._pattern_set = PatternSet(self.patterns)
         
         if self.stopwords_file.exists():
             self.load_stopwords()
@@ -137,7 +149,20 @@ class StopWordManager:
         Returns:
             True if word is a stopword
         """
-        return word.lower() in self.stopwords
+        word = word.lower()
+        return word in self.stopwords or self.matches_pattern(word)
+    
+    def matches_pattern(self, word: str) -> bool:
+        """
+        Check if a (lowercase) word matches one of the stopword patterns.
+        
+        Args:
+            word: Word to check
+            
+        Returns:
+            True if a pattern matches the whole word
+        """
+        return self._pattern_set.match(word) is not None
     
     def filter_words(self, words: List[str]) -> List[str]:
         """
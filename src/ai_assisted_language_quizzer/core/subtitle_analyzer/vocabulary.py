@@ -0,0 +1,71 @@
+"""
+Vocabulary Module
+
+Interns normalized words to dense integer ids, so merging, filtering and
+counting work on int arrays instead of string-keyed dicts.
+"""
+
+from array import array
+from typing import Dict, List, Mapping, Optional
+
+
+class Vocabulary:
+    """Map words to dense ids (0, 1, 2, ...) in first-seen order."""
+
+    def __init__(self) -> None:
+        """Initialize an empty vocabulary."""
+        self._ids: Dict[str, int] = {}
+        self._words: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._ids
+
+    def intern(self, word: str) -> int:
+        """
+        Get a word's id, assigning the next free id to new words.
+
+        Args:
+            word: Normalized word
+
+        Returns:
+            Dense integer id
+        """
+        word_id = self._ids.get(word)
+        if word_id is None:
+            word_id = len(self._words)
+            self._ids[word] = word_id
+            self._words.append(word)
+        return word_id
+
+    def get(self, word: str) -> Optional[int]:
+        """Get a word's id without interning it; None if unknown."""
+        return self._ids.get(word)
+
+    def word(self, word_id: int) -> str:
+        """Get the word for an id."""
+        return self._words[word_id]
+
+    def add_counts(self, totals: array, counts: Mapping[str, int], sign: int = 1) -> array:
+        """
+        Add word counts into an id-indexed totals array.
+
+        New words are interned and totals is zero-extended to cover them.
+
+        Args:
+            totals: Signed array (e.g. array('q')) indexed by word id
+            counts: Word -> count for one file
+            sign: 1 to add, -1 to subtract
+
+        Returns:
+            array('I') of the words' ids, in the order of counts
+        """
+        ids = array("I", map(self.intern, counts))
+        missing = len(self._words) - len(totals)
+        if missing > 0:
+            totals.frombytes(bytes(missing * totals.itemsize))
+        for word_id, count in zip(ids, counts.values()):
+            totals[word_id] += sign * count
+        return ids
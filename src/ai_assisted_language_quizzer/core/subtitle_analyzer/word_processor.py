@@ -5,18 +5,68 @@ Handles text cleaning, normalization, and tokenization.
 """
 
 import re
+import string
 import unicodedata
-from typing import List, Set
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 
 class WordProcessor:
     """Clean, normalize, and tokenize text for word frequency analysis."""
     
+    # Words: runs of word characters, hyphens and apostrophes
+    TOKEN_PATTERN = re.compile(r'\b[\w\-\']+\b')
+    
+    # Leading/trailing punctuation stripped by normalize_word()
+    EDGE_PUNCTUATION_PATTERN = re.compile(r'^[^\w]+|[^\w]+$')
+    
+    # Tokenizer profiles: the letters of each language besides a-z. A
+    # processed word must contain at least one letter of its profile;
+    # languages without a profile accept any alphabetic character.
+    LANGUAGE_LETTERS = {
+        "es": "áéíóúñü",
+        "de": "äöüß",
+        "it": "àèéìíîòóù",
+    }
+    
+    # Fused fast path: a run of [\w'-] trimmed to start and end on a word
+    # character, which is exactly what TOKEN_PATTERN + EDGE_PUNCTUATION_PATTERN
+    # produce token by token
+    FUSED_TOKEN_PATTERN = re.compile(r"\w(?:[\w'-]*\w)?")
+    
+    # Characters whose lowercase form depends on more than the character:
+    # "İ" becomes "i" + combining dot and "Σ" becomes "ς" at the end of a
+    # word. Lines containing them are lowercased word by word instead.
+    UNSAFE_LOWERCASE_PATTERN = re.compile('[\u0130\u03a3]')
+    
+    # Accent stripping for Latin-1 Supplement and Latin Extended-A (the
+    # letters of Spanish, German, Italian, French, ...): each character maps
+    # to what the NFD path leaves of it, e.g. "á" -> "a", "ñ" -> "n"
+    ACCENT_TABLE = {
+        ord(char): stripped
+        for char, stripped in (
+            (char, ''.join(
+                mark for mark in unicodedata.normalize('NFD', char)
+                if unicodedata.category(mark) != 'Mn'
+            ))
+            for char in map(chr, range(0xC0, 0x180))
+        )
+        if stripped != char
+    }
+    
+    # Text with characters beyond ACCENT_TABLE's range (including already
+    # decomposed accents) goes through the NFD path
+    ACCENT_FALLBACK_PATTERN = re.compile('[^\x00-\u017f]')
+    
     def __init__(
         self,
         min_word_length: int = 2,
         keep_accents: bool = True,
-        lowercase: bool = True
+        lowercase: bool = True,
+        word_cache_size: int = 0,
+        line_cache_size: int = 0,
+        language: str = "es"
     ):
         """
         Initialize word processor.
@@ -25,10 +75,90 @@ class WordProcessor:
             min_word_length: Minimum length for a word to be considered
             keep_accents: Whether to keep accented characters (á, é, etc.)
             lowercase: Whether to convert all text to lowercase
+            word_cache_size: Normalized words kept in an LRU cache (0 = off)
+            line_cache_size: Processed lines kept in an LRU cache (0 = off)
+            language: Language code selecting the letter profile (e.g. "es",
+                "DE", "pt-BR"); see LANGUAGE_LETTERS
         """
         self.min_word_length = min_word_length
         self.keep_accents = keep_accents
         self.lowercase = lowercase
+        self.language = language.split("-")[0].lower()
+        
+        # Letters of the profile as a set for the fused path and as a
+        # precompiled class for the stepwise path; None without a profile
+        self.letters: Optional[FrozenSet[str]] = None
+        self._letter_pattern: Optional[re.Pattern] = None
+        accents = self.LANGUAGE_LETTERS.get(self.language)
+        if accents is not None:
+            accents += accents.upper()
+            self.letters = frozenset(string.ascii_letters + accents)
+            self._letter_pattern = re.compile(f"[a-zA-Z{accents}]")
+        self.word_cache_size = word_cache_size
+        self.line_cache_size = line_cache_size
+        self._create_caches()
+        
+        # With accents kept a token's length is final once matched, so the
+        # fused pattern can skip too-short tokens instead of building them
+        self._fused_pattern = self.FUSED_TOKEN_PATTERN
+        if keep_accents and min_word_length >= 2:
+            self._fused_pattern = re.compile(
+                rf"\w[\w'-]{{{min_word_length - 2},}}\w"
+            )
+    
+    def _create_caches(self) -> None:
+        """Wrap the word and line steps in LRU caches of the configured sizes."""
+        self._normalize_cache: Optional[Callable[[str], str]] = None
+        self._accent_cache: Optional[Callable[[str], str]] = None
+        self._line_cache: Optional[Callable[[str], Tuple[str, ...]]] = None
+        self._merged_cache_stats: Counter = Counter()
+        if self.word_cache_size > 0:
+            self._normalize_cache = lru_cache(self.word_cache_size)(self._normalize_word)
+            self._accent_cache = lru_cache(self.word_cache_size)(self._remove_accents)
+        if self.line_cache_size > 0:
+            self._line_cache = lru_cache(self.line_cache_size)(self._process_line)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle settings only; caches are rebuilt empty (e.g. in workers)."""
+        state = self.__dict__.copy()
+        for name in ("_normalize_cache", "_accent_cache", "_line_cache", "_merged_cache_stats"):
+            del state[name]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore settings and start with empty caches."""
+        self.__dict__.update(state)
+        self._create_caches()
+    
+    def cache_stats(self) -> Counter:
+        """
+        Get hit and miss counts of the word and line caches.
+        
+        Includes counts merged from other processes with merge_cache_stats().
+        
+        Returns:
+            Counter with word_hits, word_misses, line_hits and line_misses
+        """
+        stats = self._merged_cache_stats.copy()
+        for name, cache in (
+            ("word", self._normalize_cache),
+            ("word", self._accent_cache),
+            ("line", self._line_cache),
+        ):
+            if cache is not None:
+                info = cache.cache_info()
+                stats[f"{name}_hits"] += info.hits
+                stats[f"{name}_misses"] += info.misses
+        return stats
+    
+    def merge_cache_stats(self, stats: Counter) -> None:
+        """
+        Add cache counts from another processor (e.g. a pool worker).
+        
+        Args:
+            stats: Counter as returned by cache_stats()
+        """
+        self._merged_cache_stats.update(stats)
     
     def normalize_word(self, word: str) -> str:
         """
@@ -40,6 +170,12 @@ class WordProcessor:
         Returns:
             Normalized word
         """
+        if self._normalize_cache is not None:
+            return self._normalize_cache(word)
+        return self._normalize_word(word)
+    
+    def _normalize_word(self, word: str) -> str:
+        """Uncached normalize_word()."""
         # Remove leading/trailing whitespace
         word = word.strip()
         
@@ -49,7 +185,7 @@ class WordProcessor:
         
         # Remove common punctuation except internal apostrophes/hyphens
         # This preserves words like "l'amour" or "bien-être"
-        word = re.sub(r'^[^\w]+|[^\w]+$', '', word, flags=re.UNICODE)
+        word = self.EDGE_PUNCTUATION_PATTERN.sub('', word)
         
         # Remove accents if configured
         if not self.keep_accents:
@@ -61,6 +197,28 @@ class WordProcessor:
         """
         Remove accent marks from text.
         
+        ASCII text is returned as is and Latin text is mapped through
+        ACCENT_TABLE; anything else falls back to _remove_accents_nfd().
+        
+        Args:
+            text: Text with potential accents
+            
+        Returns:
+            Text without accents
+        """
+        if text.isascii():
+            return text
+        if self.ACCENT_FALLBACK_PATTERN.search(text):
+            return self._remove_accents_nfd(text)
+        return text.translate(self.ACCENT_TABLE)
+    
+    def _remove_accents_nfd(self, text: str) -> str:
+        """
+        Remove accent marks via Unicode decomposition.
+        
+        Reference implementation of _remove_accents(), used for text
+        outside ACCENT_TABLE's range and for benchmarking.
+        
         Args:
             text: Text with potential accents
             
@@ -88,13 +246,64 @@ class WordProcessor:
         """
         # Split on whitespace and basic punctuation
         # This regex keeps letters, numbers, and common word characters
-        words = re.findall(r'\b[\w\-\']+\b', text, flags=re.UNICODE)
+        words = self.TOKEN_PATTERN.findall(text)
         return words
     
     def process_text(self, text: str) -> List[str]:
         """
         Tokenize and normalize text in one step.
         
+        Uses a single precompiled pattern over the (lowercased) line that
+        yields already-trimmed tokens; the result is identical to
+        process_text_stepwise(). With a line cache, repeated lines
+        ("¿Qué?", "Vamos.") are looked up instead of processed again.
+        
+        Args:
+            text: Text to process
+            
+        Returns:
+            List of normalized words meeting minimum length requirement
+        """
+        if self._line_cache is not None:
+            return list(self._line_cache(text))
+        return self._process_fused(text)
+    
+    def _process_line(self, text: str) -> Tuple[str, ...]:
+        """Immutable process_text() result for the line cache."""
+        return tuple(self._process_fused(text))
+    
+    def _process_fused(self, text: str) -> List[str]:
+        """Uncached process_text()."""
+        if self.lowercase:
+            if not text.isascii() and self.UNSAFE_LOWERCASE_PATTERN.search(text):
+                return self.process_text_stepwise(text)
+            text = text.lower()
+        
+        tokens = self._fused_pattern.findall(text)
+        if not self.keep_accents:
+            remove_accents = self._accent_cache or self._remove_accents
+            tokens = [remove_accents(token) for token in tokens]
+        
+        min_length = self.min_word_length
+        letters = self.letters
+        if letters is None:
+            return [
+                token for token in tokens
+                if len(token) >= min_length
+                and (token.isalpha() or any(char.isalpha() for char in token))
+            ]
+        return [
+            token for token in tokens
+            if len(token) >= min_length and not letters.isdisjoint(token)
+        ]
+    
+    def process_text_stepwise(self, text: str) -> List[str]:
+        """
+        Tokenize, then normalize and check each word separately.
+        
+        Reference implementation of process_text(), kept for the rare
+        lines the fused path cannot handle and for benchmarking.
+        
         Args:
             text: Text to process
             
@@ -112,11 +321,17 @@ class WordProcessor:
             # Apply filters
             if len(normalized) >= self.min_word_length:
                 # Additional check: must contain at least one letter
-                if re.search(r'[a-záéíóúñüA-ZÁÉÍÓÚÑÜ]', normalized):
+                if self._has_letter(normalized):
                     processed_words.append(normalized)
         
         return processed_words
     
+    def _has_letter(self, word: str) -> bool:
+        """Check whether a word contains a letter of the language profile."""
+        if self._letter_pattern is None:
+            return any(char.isalpha() for char in word)
+        return self._letter_pattern.search(word) is not None
+    
     def process_lines(self, lines: List[str]) -> List[str]:
         """
         Process multiple lines of text.
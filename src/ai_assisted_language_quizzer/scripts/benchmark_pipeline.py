@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+
+Micro-benchmarks for the subtitle analyzer's hot paths. Each benchmark
+times the current implementation against the reference one on a real
+subtitle corpus and checks that both produce identical results.
+
+Usage:
+    python benchmark_pipeline.py
+    python benchmark_pipeline.py --subtitles-dir ../subtitles --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import yaml
+
+# Add core modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from subtitle_analyzer import (
+    CueTable,
+    FrequencyAnalyzer,
+    NumpyBackend,
+    ReportGenerator,
+    SRTParser,
+    Vocabulary,
+    WordProcessor,
+)
+
+
+class PipelineBenchmark:
+    """Time pipeline stages on a subtitle corpus."""
+
+    def __init__(self, subtitles_dir: Path, pattern: str = "*.srt", repeat: int = 3):
+        """
+        Load the corpus once for all benchmarks.
+
+        Args:
+            subtitles_dir: Directory or archive with subtitle files
+            pattern: File pattern to match (default: "*.srt")
+            repeat: Timing runs per benchmark; the fastest run is reported
+        """
+        self.repeat = repeat
+        self.parser = SRTParser()
+        self.table: CueTable = self.parser.parse_table(subtitles_dir, pattern)
+        self.lines: List[str] = [
+            line
+            for file_id in range(len(self.table.file_names))
+            for line in self.table.file_lines(file_id)
+        ]
+        print(
+            f"Corpus: {len(self.table.file_names)} files, "
+            f"{len(self.table)} cues, {len(self.lines)} lines\n"
+        )
+
+    def _time(self, func: Callable[[], Any]) -> float:
+        """Best wall-clock time of func over self.repeat runs."""
+        best = float("inf")
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def _report(self, name: str, reference_s: float, current_s: float, same: bool) -> None:
+        """Print one benchmark result line."""
+        speedup = reference_s / current_s if current_s else float("inf")
+        status = "identical" if same else "MISMATCH"
+        print(
+            f"{name:<28} reference {reference_s * 1000:8.1f} ms   "
+            f"current {current_s * 1000:8.1f} ms   {speedup:5.2f}x   {status}"
+        )
+
+    def bench_tokenizer(self) -> bool:
+        """
+        Fused WordProcessor.process_text() vs the stepwise reference path.
+
+        Returns:
+            True if both paths produce the same words for every line
+        """
+        word_processor = WordProcessor()
+        lines = self.lines
+
+        def stepwise() -> List[List[str]]:
+            return [word_processor.process_text_stepwise(line) for line in lines]
+
+        def fused() -> List[List[str]]:
+            return [word_processor.process_text(line) for line in lines]
+
+        same = stepwise() == fused()
+        self._report("process_text", self._time(stepwise), self._time(fused), same)
+        return same
+
+    def bench_step2(self) -> bool:
+        """
+        Step 2 (tokenize and count every file) with each tokenizer path.
+
+        Returns:
+            True if word counts, count order and contexts match
+        """
+        fused_processor = WordProcessor()
+        stepwise_processor = WordProcessor()
+        # Route this instance's tokenizing through the reference path
+        stepwise_processor.process_text = stepwise_processor.process_text_stepwise
+
+        def run(word_processor: WordProcessor) -> Dict[str, Any]:
+            return self.parser.tokenize_table(self.table, word_processor)
+
+        reference, current = run(stepwise_processor), run(fused_processor)
+        same = all(
+            list(reference[name].counts.items()) == list(current[name].counts.items())
+            and reference[name].contexts == current[name].contexts
+            for name in reference
+        )
+        self._report(
+            "step 2 tokenize + count",
+            self._time(lambda: run(stepwise_processor)),
+            self._time(lambda: run(fused_processor)),
+            same,
+        )
+        return same
+
+    def bench_accents(self) -> bool:
+        """
+        Translate-table accent stripping vs the NFD reference path.
+        
+        Returns:
+            True if both strip every corpus word the same way
+        """
+        word_processor = WordProcessor(keep_accents=False)
+        words = [word for line in self.lines for word in WordProcessor().process_text(line)]
+
+        def nfd() -> List[str]:
+            return [word_processor._remove_accents_nfd(word) for word in words]
+
+        def table() -> List[str]:
+            return [word_processor._remove_accents(word) for word in words]
+
+        same = nfd() == table()
+        self._report("accent stripping", self._time(nfd), self._time(table), same)
+        return same
+
+    def bench_token_cache(self) -> bool:
+        """
+        process_text() with and without the line and word LRU caches.
+        
+        Each timing run starts from empty caches, so hits only come from
+        lines and words repeated within the corpus.
+        
+        Returns:
+            True if both produce the same words for every line
+        """
+        lines = self.lines
+        cache_sizes = {"word_cache_size": 65536, "line_cache_size": 65536}
+
+        def run(word_processor: WordProcessor) -> List[List[str]]:
+            return [word_processor.process_text(line) for line in lines]
+
+        def uncached() -> List[List[str]]:
+            return run(WordProcessor())
+
+        def cached() -> List[List[str]]:
+            return run(WordProcessor(**cache_sizes))
+
+        probe = WordProcessor(**cache_sizes)
+        same = uncached() == run(probe)
+        self._report("process_text line cache", self._time(uncached), self._time(cached), same)
+        stats = probe.cache_stats()
+        lookups = stats["line_hits"] + stats["line_misses"]
+        print(f"{'':<28} line cache hit rate {stats['line_hits'] / max(lookups, 1):.1%}")
+        return same
+
+    def bench_frequency_backend(self, sizes: Tuple[int, ...] = (100, 1000, 10000, 100000, 1000000)) -> bool:
+        """
+        Step 3-4 counting and statistics on the python vs numpy backend.
+
+        Runs on synthetic Zipf-like counts of growing vocabulary size (the
+        corpus is too small to show the crossover): analyze_ids(), the
+        statistics, the frequency distribution and the report buckets.
+
+        Args:
+            sizes: Vocabulary sizes to time
+
+        Returns:
+            True if both backends produce identical results at every size
+        """
+        if not NumpyBackend.available():
+            print(f"{'frequency backend':<28} skipped: numpy not installed")
+            return True
+        rng = random.Random(0)
+        same_everywhere = True
+        crossover = None
+        # ReportGenerator creates its output directory; keep it out of the tree
+        with tempfile.TemporaryDirectory() as report_dir:
+            for size in sizes:
+                vocabulary = Vocabulary()
+                for word_id in range(size):
+                    vocabulary.intern(f"w{word_id}")
+                totals = array("q", (int(rng.paretovariate(0.8)) for _ in range(size)))
+                ids = list(range(size))
+
+                def run(backend: str) -> Tuple[Any, ...]:
+                    analyzer = FrequencyAnalyzer(backend=backend)
+                    frequencies = analyzer.analyze_ids(totals, iter(ids), vocabulary)
+                    buckets = ReportGenerator(Path(report_dir), backend)._calculate_distribution(frequencies)
+                    return (
+                        analyzer.get_statistics(),
+                        analyzer.get_frequency_distribution(),
+                        buckets,
+                        analyzer.calculate_smart_threshold(500),
+                    )
+
+                same = run("python") == run("numpy")
+                python_s, numpy_s = self._time(lambda: run("python")), self._time(lambda: run("numpy"))
+                self._report(f"frequency stats n={size:,}", python_s, numpy_s, same)
+                if crossover is None and numpy_s < python_s:
+                    crossover = size
+                same_everywhere = same_everywhere and same
+        print(f"{'':<28} numpy backend faster from n={crossover:,}" if crossover
+              else f"{'':<28} numpy backend not faster at these sizes")
+        return same_everywhere
+
+    def run_all(self) -> bool:
+        """
+        Run every benchmark.
+
+        Returns:
+            True if all benchmarks produced identical results
+        """
+        results = [
+            self.bench_tokenizer(),
+            self.bench_step2(),
+            self.bench_accents(),
+            self.bench_token_cache(),
+            self.bench_frequency_backend(),
+        ]
+        return all(results)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark subtitle analyzer pipeline stages",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Benchmark on the configured subtitles directory
+  python benchmark_pipeline.py
+
+  # Benchmark on another corpus with more timing runs
+  python benchmark_pipeline.py --subtitles-dir /path/to/subtitles --repeat 5
+        """,
+    )
+
+    parser.add_argument(
+        "--config", "-c", type=Path, help="Path to configuration file (YAML)"
+    )
+
+    parser.add_argument(
+        "--subtitles-dir",
+        "-s",
+        type=Path,
+        help="Directory or archive with subtitle files (overrides config)",
+    )
+
+    parser.add_argument(
+        "--repeat", "-r", type=int, default=3, help="Timing runs per benchmark (default: 3)"
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+
+    language_root = Path(__file__).parent.parent
+    config_path = args.config or language_root / "core" / "subtitle_analyzer" / "config.yaml"
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+
+    subtitles_dir = args.subtitles_dir
+    if subtitles_dir is None:
+        subtitles_dir = Path(config["paths"]["subtitles_directory"])
+        if not subtitles_dir.is_absolute():
+            subtitles_dir = language_root / subtitles_dir
+
+    pattern = config.get("advanced", {}).get("file_pattern", "*.srt")
+    benchmark = PipelineBenchmark(subtitles_dir, pattern, args.repeat)
+    return 0 if benchmark.run_all() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
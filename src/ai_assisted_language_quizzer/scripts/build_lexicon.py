@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Build Lexicon
+
+Compile plain text word lists (one word per line, # comments allowed) into
+a compact, memory-mapped .lex file for the English word filter.
+
+Usage:
+    python build_lexicon.py english_words_100k.txt
+    python build_lexicon.py list1.txt list2.txt --output ../data/output/lexicons/english.lex
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import yaml
+
+# Add core modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+
+from subtitle_analyzer import CompactLexicon
+
+# Config paths are relative to the language root (parent of scripts/)
+LANGUAGE_ROOT = Path(__file__).parent.parent
+DEFAULT_CONFIG = LANGUAGE_ROOT / "core" / "subtitle_analyzer" / "config.yaml"
+
+
+class LexiconBuilder:
+    """Merge word lists and write them as one CompactLexicon file."""
+
+    def __init__(self, input_files: List[Path], output_file: Path):
+        """
+        Initialize lexicon builder.
+
+        Args:
+            input_files: Plain text word lists to merge
+            output_file: Path of the .lex file to write
+        """
+        self.input_files = input_files
+        self.output_file = output_file
+
+    def build(self) -> int:
+        """
+        Read every input list, build the lexicon and verify it.
+
+        Returns:
+            Number of distinct words written
+        """
+        start = time.perf_counter()
+        words = set()
+        for input_file in self.input_files:
+            file_words = CompactLexicon.read_word_list(input_file)
+            print(f"  {input_file}: {len(file_words)} words")
+            words.update(file_words)
+
+        count = CompactLexicon.build(words, self.output_file)
+        elapsed = time.perf_counter() - start
+
+        with CompactLexicon(self.output_file) as lexicon:
+            missing = sum(1 for word in words if word not in lexicon)
+        if missing:
+            raise RuntimeError(f"{missing} words missing from {self.output_file}")
+
+        size_kb = self.output_file.stat().st_size / 1024
+        print(f"✓ Wrote {count} words to {self.output_file} ({size_kb:.1f} KB, {elapsed:.2f}s)")
+        return count
+
+
+def default_output_dir(config_path: Path) -> Path:
+    """
+    Resolve the default lexicon directory the way the analyzer resolves paths.
+
+    Args:
+        config_path: Analyzer config whose paths.output_directory is used
+
+    Returns:
+        <paths.output_directory>/lexicons, relative paths taken from the
+        language root
+    """
+    output_directory = "./data/output"
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        output_directory = config.get("paths", {}).get("output_directory", output_directory)
+    output_dir = Path(output_directory)
+    if not output_dir.is_absolute():
+        output_dir = LANGUAGE_ROOT / output_dir
+    return output_dir / "lexicons"
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build a memory-mapped lexicon (.lex) from plain text word lists",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build <paths.output_directory>/lexicons/english_words_100k.lex
+  python build_lexicon.py english_words_100k.txt
+
+  # Merge several lists into one lexicon
+  python build_lexicon.py list1.txt list2.txt --output english.lex
+
+Then set english_filter.words_file in config.yaml to the .lex file
+(e.g. ./data/output/lexicons/english_words_100k.lex with the default paths).
+        """,
+    )
+
+    parser.add_argument(
+        "inputs", type=Path, nargs="+", help="Plain text word lists (one word per line)"
+    )
+
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help=(
+            "Output .lex file (default: <paths.output_directory>/lexicons/"
+            "<first input name>.lex)"
+        ),
+    )
+
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=Path,
+        default=DEFAULT_CONFIG,
+        help="Analyzer config whose paths.output_directory sets the default output",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+
+    for input_file in args.inputs:
+        if not input_file.exists():
+            print(f"❌ Word list not found: {input_file}")
+            return 1
+
+    output_file = args.output or default_output_dir(args.config) / f"{args.inputs[0].stem}.lex"
+    print(f"Building lexicon from {len(args.inputs)} word list(s)...")
+    LexiconBuilder(args.inputs, output_file).build()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
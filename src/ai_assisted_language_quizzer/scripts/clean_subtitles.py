@@ -5,18 +5,36 @@ Clean subtitle files by removing Amara.org credits and renumbering entries.
 import os
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import yaml
+
+from ai_assisted_language_quizzer.core.subtitle_analyzer import CueFilter
 
 
 class SubtitleCleaner:
     """Handles cleaning and renumbering of SRT subtitle files."""
     
-    def __init__(self, subtitles_dir: str):
+    def __init__(self, subtitles_dir: str, patterns: Optional[List[str]] = None):
         self.subtitles_dir = Path(subtitles_dir)
-        self.amara_patterns = [
-            "Subtítulos realizados por la comunidad de Amara.org",
-            "Subtítulos por la comunidad de Amara.org"
-        ]
+        self.amara_patterns = list(
+            patterns if patterns is not None else CueFilter.DEFAULT_PATTERNS
+        )
+        self.cue_filter = CueFilter(self.amara_patterns)
+    
+    @staticmethod
+    def load_patterns(config_path: Path) -> Optional[List[str]]:
+        """
+        Read cue_filter.patterns from the subtitle analyzer config.
+        
+        Returns:
+            Pattern list, or None if the config or section is missing
+        """
+        if not config_path.exists():
+            return None
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+        return config.get("cue_filter", {}).get("patterns")
         
     def parse_srt_file(self, filepath: Path) -> List[Tuple[str, str, str]]:
         """
@@ -48,7 +66,7 @@ class SubtitleCleaner:
     
     def should_remove_entry(self, text: str) -> bool:
         """Check if an entry should be removed."""
-        return any(pattern in text for pattern in self.amara_patterns)
+        return self.cue_filter.match(text) is not None
     
     def clean_and_renumber(
         self, 
@@ -146,7 +164,9 @@ def main():
         print(f"Error: Subtitles directory not found: {subtitles_dir}")
         return
     
-    cleaner = SubtitleCleaner(str(subtitles_dir))
+    config_path = script_dir.parent / "core" / "subtitle_analyzer" / "config.yaml"
+    patterns = SubtitleCleaner.load_patterns(config_path)
+    cleaner = SubtitleCleaner(str(subtitles_dir), patterns)
     cleaner.process_all_files()
 
 
@@ -13,28 +13,47 @@ Usage:
 """
 
 import argparse
+import copy
 import os
 import sys
+import time
 import traceback
+from array import array
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
-# Add core modules to path
+# Add core modules and anki_tools to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+sys.path.insert(1, str(Path(__file__).parent.parent))
 
 from subtitle_analyzer import (
+    CueDeduplicator,
+    CueFilter,
+    DirectoryWatcher,
+    DispersionIndex,
     EnglishWordFilter,
+    FileTokens,
+    FilterChain,
     FrequencyAnalyzer,
+    FrequencyIndex,
+    KnownWordsIndex,
     LemmaGroup,
     LemmaGrouper,
+    NumpyBackend,
+    ParseCache,
     ReportGenerator,
+    SentenceBuilder,
     SRTParser,
     StopWordManager,
+    SubtitleSource,
+    Vocabulary,
     WordProcessor,
 )
+from anki_tools.add_audio_to_anki import AnkiConnector
 from subtitle_analyzer.llm_curator import CuratedWord, LLMCurator
 from subtitle_analyzer.translator import (
     get_api_usage,
@@ -46,6 +65,109 @@ from subtitle_analyzer.translator import (
 load_dotenv()
 
 
+# Where subtitles come from and how they are read and tokenized
+DEFAULT_INPUT_CONFIG = {
+    "paths": {
+        "subtitles_directory": "../subtitles",
+        "output_directory": "./data/output",
+        "stopwords_file": "./core/subtitle_analyzer/stopwords_spanish.txt",
+    },
+    "processing": {
+        "min_word_length": 2,
+        "keep_accents": True,
+        "lowercase": True,
+    },
+    "token_cache": {"line_cache_size": 65536, "word_cache_size": 65536},
+    "cue_filter": {
+        "enabled": True,
+        "patterns": list(CueFilter.DEFAULT_PATTERNS),
+    },
+    "sentences": {"enabled": True, "max_gap_ms": 1500, "max_cues": 4},
+    "parse_cache": {"enabled": True, "rebuild": False},
+    "duplicate_cues": {
+        "enabled": False,
+        "max_files": 3,
+        "mode": "once",
+        "report_top": 10,
+    },
+    "watch": {"interval_seconds": 30},
+    "advanced": {
+        "file_pattern": "*.srt",
+        "cache_encodings": True,
+        "jobs": 1,
+        "verbose": True,
+    },
+}
+
+# Which words are excluded before counting
+DEFAULT_FILTER_CONFIG = {
+    "stopwords": {"patterns": []},
+    "english_filter": {
+        "enabled": True,
+        "words_file": "./core/subtitle_analyzer/english_words.txt",
+    },
+    "known_words": {
+        "enabled": False,
+        "decks": ["Spanish"],
+        "field": "",
+        "chunk_size": 500,
+        "anki_url": "http://localhost:8765",
+    },
+}
+
+# How words are counted, thresholded and ranked
+DEFAULT_COUNTING_CONFIG = {
+    "frequency": {
+        "threshold_mode": "auto",
+        "min_frequency": 3,
+        "target_words": 500,
+        "max_results": 1000,
+        "backend": "python",
+        "ranking": "frequency",
+        "dispersion_measure": "juilland",
+    },
+    "approximate_counting": {
+        "enabled": False,
+        "top_k": 5000,
+        "sketch_width": 1048576,
+        "sketch_depth": 4,
+    },
+    "saved_counts": {"save_file": "", "merge_files": []},
+    "lemmatization": {
+        "enabled": False,
+        "language_model": "es_core_news_sm",
+        "representative_strategy": "highest_frequency",
+    },
+}
+
+# Curation, reports and translation
+DEFAULT_OUTPUT_CONFIG = {
+    "llm_curation": {
+        "enabled": False,
+        "provider": "minimax",
+        "model": "minimax-m2.5",
+        "api_url": "https://api.minimaxi.chat/v1/text/chatcompletion_v2",
+        "api_key_env": "MINIMAX_API_KEY",
+        "batch_size": 40,
+        "learner_level": "A2-B1",
+    },
+    "output": {
+        "generate_csv": True,
+        "generate_markdown": True,
+        "generate_anki_list": True,
+        "markdown_top_n": 50,
+        "anki_include_frequency": True,
+    },
+    "translation": {
+        "enabled": False,
+        "source_lang": "ES",
+        "target_lang": "EN-US",
+        "output_filename": "translated_words.txt",
+    },
+}
+
+
+
 class SubtitleFrequencyAnalyzer:
     """Main application class for subtitle frequency analysis."""
 
@@ -57,11 +179,12 @@ class SubtitleFrequencyAnalyzer:
             config_path: Path to YAML configuration file
         """
         self.config = self._load_config(config_path)
-        self.parser = SRTParser()
+        self.parser = None
         self.word_processor = None
         self.stopword_manager = None
         self.english_word_filter = None
-        self.frequency_analyzer = FrequencyAnalyzer()
+        self.filter_chain = None
+        self.frequency_analyzer = None
         self.report_generator = None
 
         self._initialize_components()
@@ -93,135 +216,393 @@ class SubtitleFrequencyAnalyzer:
 
     def _get_default_config(self) -> Dict:
         """Get default configuration."""
-        return {
-            "paths": {
-                "subtitles_directory": "../subtitles",
-                "output_directory": "./data/output",
-                "stopwords_file": "./core/subtitle_analyzer/stopwords_spanish.txt",
-            },
-            "processing": {
-                "min_word_length": 2,
-                "keep_accents": True,
-                "lowercase": True,
-            },
-            "frequency": {
-                "threshold_mode": "auto",
-                "min_frequency": 3,
-                "target_words": 500,
-                "max_results": 1000,
-            },
-            "lemmatization": {
-                "enabled": False,
-                "language_model": "es_core_news_sm",
-                "representative_strategy": "highest_frequency",
-            },
-            "llm_curation": {
-                "enabled": False,
-                "provider": "minimax",
-                "model": "minimax-m2.5",
-                "api_url": "https://api.minimaxi.chat/v1/text/chatcompletion_v2",
-                "api_key_env": "MINIMAX_API_KEY",
-                "batch_size": 40,
-                "learner_level": "A2-B1",
-            },
-            "output": {
-                "generate_csv": True,
-                "generate_markdown": True,
-                "generate_anki_list": True,
-                "markdown_top_n": 50,
-                "anki_include_frequency": True,
-            },
-            "advanced": {"file_pattern": "*.srt", "verbose": True},
-            "english_filter": {
-                "enabled": True,
-                "words_file": "./core/subtitle_analyzer/english_words.txt",
-            },
-        }
+        return copy.deepcopy({
+            **DEFAULT_INPUT_CONFIG,
+            **DEFAULT_FILTER_CONFIG,
+            **DEFAULT_COUNTING_CONFIG,
+            **DEFAULT_OUTPUT_CONFIG,
+        })
 
     def _initialize_components(self):
         """Initialize processing components from config."""
-        # Resolve paths relative to language root (parent of scripts/)
-        language_root = Path(__file__).parent.parent
+        self.word_processor = self._create_word_processor()
 
-        # Word processor
-        proc_config = self.config.get("processing", {})
-        self.word_processor = WordProcessor(
-            min_word_length=proc_config.get("min_word_length", 2),
-            keep_accents=proc_config.get("keep_accents", True),
-            lowercase=proc_config.get("lowercase", True),
-        )
+        # Stopwords and English words, checked in one lookup per word
+        self._create_word_filters()
+        self.filter_chain = self._create_filter_chain()
 
-        # Stopword manager
-        stopwords_file = Path(self.config["paths"]["stopwords_file"])
-        if not stopwords_file.is_absolute():
-            stopwords_file = language_root / stopwords_file
-        self.stopword_manager = StopWordManager(stopwords_file)
+        self._create_frequency_components()
+        self.parser = self._create_parser()
+        self.lemma_grouper = self._create_lemma_grouper()
 
-        # English word filter
+        self._curated_words: List[CuratedWord] = []
+        self._sentence_context: Dict[str, str] = {}
+
+        # Per-file results and merged counts, kept for incremental (--watch) updates
+        self._subtitles_dir: Optional[Path] = None
+        self._parse_cache: Optional[ParseCache] = None
+        self._parsed_data: Dict[str, FileTokens] = {}
+
+        # Merged counts indexed by word id, plus per-file counts for
+        # frequency.ranking: dispersion
+        self.vocabulary = Vocabulary()
+        self._totals = array("q")
+        self.dispersion_index: Optional[DispersionIndex] = None
+        self._removed_words: Counter = Counter()  # filter rule -> occurrences removed
+        self._extracted_words = 0  # approximate_counting: tokens counted while parsing
+
+    def _language_path(self, path: str) -> Path:
+        """Resolve a config path relative to language root (parent of scripts/)."""
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = Path(__file__).parent.parent / resolved
+        return resolved
+
+    def _create_word_filters(self) -> None:
+        """Create the stopword manager and the English word filter (optional)."""
+        self.stopword_manager = StopWordManager(
+            self._language_path(self.config["paths"]["stopwords_file"]),
+            self.config.get("stopwords", {}).get("patterns", []),
+        )
         english_filter_config = self.config.get("english_filter", {})
         if english_filter_config.get("enabled", True):
-            english_words_file = Path(
-                english_filter_config.get(
-                    "words_file", "./core/subtitle_analyzer/english_words.txt"
+            self.english_word_filter = EnglishWordFilter(
+                self._language_path(
+                    english_filter_config.get(
+                        "words_file", "./core/subtitle_analyzer/english_words.txt"
+                    )
                 )
             )
-            if not english_words_file.is_absolute():
-                english_words_file = language_root / english_words_file
-            self.english_word_filter = EnglishWordFilter(english_words_file)
-
-        # Report generator
-        output_dir = Path(self.config["paths"]["output_directory"])
-        if not output_dir.is_absolute():
-            output_dir = language_root / output_dir
-        self.report_generator = ReportGenerator(output_dir)
-
-        # Lemma grouper (optional -- requires spaCy model)
-        self.lemma_grouper = None
+
+    def _create_frequency_components(self) -> None:
+        """Create the frequency analyzer and report generator on the configured backend."""
+        backend = self.config.get("frequency", {}).get("backend", "python")
+        if backend == "numpy" and not NumpyBackend.available():
+            print("⚠️  frequency.backend 'numpy' needs numpy installed; using python")
+            backend = "python"
+        self.frequency_analyzer = FrequencyAnalyzer(backend=backend)
+        self.report_generator = ReportGenerator(
+            self._language_path(self.config["paths"]["output_directory"]), backend=backend
+        )
+
+    def _create_parser(self) -> SRTParser:
+        """Create the SRT parser with its optional encoding cache, cue filter and sentence builder."""
+        encoding_manifest = None
+        if self.config.get("advanced", {}).get("cache_encodings", True):
+            encoding_manifest = self.report_generator.output_dir / ".cache" / "encodings.json"
+        cue_filter = None
+        cue_filter_config = self.config.get("cue_filter", {})
+        if cue_filter_config.get("enabled", True):
+            cue_filter = CueFilter(
+                cue_filter_config.get("patterns", CueFilter.DEFAULT_PATTERNS)
+            )
+        sentence_builder = None
+        sentence_config = self.config.get("sentences", {})
+        if sentence_config.get("enabled", True):
+            sentence_builder = SentenceBuilder(
+                max_gap_ms=sentence_config.get("max_gap_ms", 1500),
+                max_cues=sentence_config.get("max_cues", 4),
+            )
+        return SRTParser(
+            encoding_manifest=encoding_manifest,
+            cue_filter=cue_filter,
+            sentence_builder=sentence_builder,
+        )
+
+    def _create_lemma_grouper(self) -> Optional[LemmaGrouper]:
+        """Create the lemma grouper (optional -- requires spaCy model)."""
         lemma_config = self.config.get("lemmatization", {})
-        if lemma_config.get("enabled", False):
-            try:
-                self.lemma_grouper = LemmaGrouper(
-                    language_model=lemma_config.get("language_model", "es_core_news_sm")
+        if not lemma_config.get("enabled", False):
+            return None
+        try:
+            return LemmaGrouper(
+                language_model=lemma_config.get("language_model", "es_core_news_sm")
+            )
+        except OSError as e:
+            print(f"LemmaGrouper disabled: {e}")
+            return None
+
+    def _create_word_processor(self) -> WordProcessor:
+        """Create the word processor, using the subtitle language's letter profile."""
+        proc_config = self.config.get("processing", {})
+        token_cache_config = self.config.get("token_cache", {})
+        return WordProcessor(
+            min_word_length=proc_config.get("min_word_length", 2),
+            keep_accents=proc_config.get("keep_accents", True),
+            lowercase=proc_config.get("lowercase", True),
+            word_cache_size=token_cache_config.get("word_cache_size", 65536),
+            line_cache_size=token_cache_config.get("line_cache_size", 65536),
+            language=self.config.get("translation", {}).get("source_lang", "ES"),
+        )
+
+    def _create_filter_chain(self) -> FilterChain:
+        """Combine the stopword and English word exclusions into one filter."""
+        lowercase = self.config.get("processing", {}).get("lowercase", True)
+        filter_chain = FilterChain(lowercase=not lowercase)
+        filter_chain.add_rule(
+            "stopwords",
+            self.stopword_manager.get_stopwords(),
+            self.stopword_manager.patterns,
+        )
+        if self.english_word_filter:
+            filter_chain.add_rule(
+                "english",
+                self.english_word_filter.english_words,
+                lexicon=self.english_word_filter.lexicon,
+            )
+        return filter_chain
+
+    def _load_known_words(self) -> None:
+        """Refresh the Anki known-words index and exclude its words (optional)."""
+        known_config = self.config.get("known_words", {})
+        if not known_config.get("enabled", False):
+            return
+        index = KnownWordsIndex(
+            self.report_generator.output_dir / ".cache" / "known_words.json"
+        )
+        decks = known_config.get("decks", [])
+        connector = AnkiConnector(known_config.get("anki_url", "http://localhost:8765"))
+        try:
+            for deck in decks:
+                stats = index.refresh(
+                    connector,
+                    deck,
+                    field=known_config.get("field", ""),
+                    chunk_size=known_config.get("chunk_size", 500),
                 )
-            except OSError as e:
-                print(f"LemmaGrouper disabled: {e}")
-                self.lemma_grouper = None
+                print(
+                    f"  Anki deck '{deck}': {stats['added']} new, {stats['updated']} changed,"
+                    f" {stats['removed']} removed, {stats['unchanged']} unchanged notes"
+                )
+            index.save()
+        except Exception as e:
+            print(f"⚠️  Using saved known words index: {e}")
+
+        known = index.words(self.word_processor, decks)
+        self.filter_chain.add_rule("known", known)
+        print(f"✓ {len(known)} known words from {index.get_count()} Anki notes")
+
+    def _apply_saved_counts(self) -> None:
+        """Save this run's filtered counts and merge counts saved by other runs (optional)."""
+        saved_config = self.config.get("saved_counts", {})
+        output_dir = self.report_generator.output_dir
+        save_file = saved_config.get("save_file", "")
+        if save_file:
+            self.frequency_analyzer.save(output_dir / save_file)
+            print(f"  Saved counts to {output_dir / save_file}")
+
+        for merge_file in saved_config.get("merge_files", []):
+            saved = FrequencyAnalyzer.load(output_dir / merge_file)
+            shard = FrequencyAnalyzer()
+            shard.analyze_counts({
+                word: count
+                for word, count in saved.word_frequencies.items()
+                if self.filter_chain.rule_for(word) is None
+            })
+            shard.estimated = saved.estimated
+            shard.max_overestimate = saved.max_overestimate
+            self.frequency_analyzer.merge(shard)
+            print(
+                f"  Merged {shard.total_words} words ({shard.unique_words} unique)"
+                f" from {output_dir / merge_file}"
+            )
 
-        self._curated_words: List[CuratedWord] = []
-        self._sentence_context: Dict[str, str] = {}
+    def _create_parse_cache(self) -> Optional[ParseCache]:
+        """Create the token cache under <output_directory>/.cache if enabled."""
+        cache_config = self.config.get("parse_cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        proc_config = self.config.get("processing", {})
+        cue_filter = self.parser.cue_filter
+        sentence_builder = self.parser.sentence_builder
+        settings = {
+            "min_word_length": proc_config.get("min_word_length", 2),
+            "keep_accents": proc_config.get("keep_accents", True),
+            "lowercase": proc_config.get("lowercase", True),
+            "language": self.word_processor.language,
+            "cue_filter": cue_filter.patterns if cue_filter else [],
+            "sentences": (
+                [sentence_builder.max_gap_ms, sentence_builder.max_cues]
+                if sentence_builder
+                else None
+            ),
+        }
+        return ParseCache(
+            self.report_generator.output_dir / ".cache" / "tokens",
+            settings,
+            rebuild=cache_config.get("rebuild", False),
+        )
 
-    def _parse_subtitles(self, subtitles_dir: Path) -> Dict[str, List[str]]:
-        """Step 1: Parse subtitle files."""
-        file_pattern = self.config.get("advanced", {}).get("file_pattern", "*.srt")
-        return self.parser.parse_directory(subtitles_dir, file_pattern)
+    def _parse_subtitles(self, subtitles_dir: Path) -> Dict[str, FileTokens]:
+        """Steps 1+2: Parse and tokenize subtitle files, optionally in parallel."""
+        advanced_config = self.config.get("advanced", {})
+        file_pattern = advanced_config.get("file_pattern", "*.srt")
+        jobs = advanced_config.get("jobs", 1) or os.cpu_count() or 1
+        if self._parse_cache is None:
+            self._parse_cache = self._create_parse_cache()
+        cache = self._parse_cache
+        deduplicator = self._create_deduplicator()
+        self.parser.cues_removed = Counter()
+        stats_before = self.word_processor.cache_stats()
+        tokenized = self.parser.iter_tokenized(
+            subtitles_dir,
+            self.word_processor,
+            file_pattern,
+            workers=jobs,
+            cache=cache,
+            deduplicator=deduplicator,
+        )
+        if self._approximate_counting():
+            tokenized = self._count_approximately(tokenized)
+        parsed_data = {file_tokens.name: file_tokens for file_tokens in tokenized}
+        if cache is not None:
+            hits = sum(1 for file_tokens in parsed_data.values() if file_tokens.cached)
+            print(f"  Parse cache: {hits} hits, {len(parsed_data) - hits} misses")
+        if self.parser.cue_filter is not None:
+            self._report_removed_cues()
+        if deduplicator is not None:
+            self._report_duplicate_cues(deduplicator, parsed_data)
+        if advanced_config.get("verbose", True):
+            self._report_token_cache(self.word_processor.cache_stats() - stats_before)
+        return parsed_data
+
+    def _count_approximately(self, tokenized: Iterable[FileTokens]) -> Iterator[FileTokens]:
+        """
+        Step 3 (approximate_counting): count each file as soon as it is tokenized.
 
-    def _process_and_filter(
-        self, parsed_data: Dict[str, List[str]]
-    ) -> Tuple[List[str], List[str]]:
-        """Steps 2+3: Process words, build sentence context, filter stopwords.
+        Each file's filtered counts go into the sketch and its counts are
+        dropped, so memory does not grow with the files' vocabularies.
+        Contexts are kept only for words that are candidates at the time.
+
+        Args:
+            tokenized: FileTokens in source order (SRTParser.iter_tokenized())
 
         Returns:
-            Tuple of (all_words_before_filter, filtered_words_after_filter)
+            Iterator of the same FileTokens, without counts and contexts
         """
-        all_words = []
-        for filename, lines in parsed_data.items():
-            for line in lines:
-                words = self.word_processor.process_text(line)
-                for word in words:
-                    if word not in self._sentence_context:
-                        self._sentence_context[word] = line
-                all_words.extend(words)
-        filtered_words = self.stopword_manager.filter_words(all_words)
-        if self.english_word_filter:
-            before_count = len(filtered_words)
-            filtered_words = self.english_word_filter.filter_words(filtered_words)
-            after_count = len(filtered_words)
-            if self.config.get("advanced", {}).get("verbose", True):
+        approx_config = self.config.get("approximate_counting", {})
+        top_k = approx_config.get("top_k", 5000)
+        analyzer = self.frequency_analyzer
+        analyzer.start_approximate(
+            top_k,
+            sketch_width=approx_config.get("sketch_width", 1048576),
+            sketch_depth=approx_config.get("sketch_depth", 4),
+        )
+        self._extracted_words = 0
+        self._removed_words = Counter()
+        self._sentence_context = {}
+        for file_tokens in tokenized:
+            self._extracted_words += sum(file_tokens.counts.values())
+            for kept in self.filter_chain.filter_counts([file_tokens.counts]):
+                analyzer.add_approximate(kept)
+            self._removed_words.update(self.filter_chain.hits)
+            self._keep_candidate_contexts(file_tokens.contexts, 2 * top_k)
+            file_tokens.counts = Counter()
+            file_tokens.contexts = {}
+            yield file_tokens
+        analyzer.finish_approximate()
+        self._sentence_context = {
+            word: line for word, line in self._sentence_context.items()
+            if word in analyzer.word_frequencies
+        }
+
+    def _keep_candidate_contexts(self, contexts: Dict[str, str], limit: int) -> None:
+        """Add contexts of current candidates, dropping evicted words' contexts past limit."""
+        analyzer = self.frequency_analyzer
+        for word, line in contexts.items():
+            if word not in self._sentence_context and analyzer.is_candidate(word):
+                self._sentence_context[word] = line
+        if len(self._sentence_context) > limit:
+            self._sentence_context = {
+                word: line for word, line in self._sentence_context.items()
+                if analyzer.is_candidate(word)
+            }
+
+    def _report_token_cache(self, stats: Counter) -> None:
+        """Print hit rates of the word processor's line and word caches."""
+        for name in ("line", "word"):
+            hits, misses = stats[f"{name}_hits"], stats[f"{name}_misses"]
+            if hits + misses:
                 print(
-                    f"  English filter: removed {before_count - after_count}"
-                    f" English words, {after_count} remaining"
+                    f"  {name.capitalize()} cache: {hits / (hits + misses):.1%} hits"
+                    f" ({hits} of {hits + misses} lookups)"
                 )
-        return all_words, filtered_words
+
+    def _report_removed_cues(self) -> None:
+        """Print how many cues the cue filter dropped, per pattern."""
+        stats = self.parser.get_statistics()
+        print(f"  Cue filter: removed {stats['cues_removed']} cues")
+        for pattern, count in self.parser.cues_removed.most_common():
+            print(f"    {count:>5}  {pattern}")
+
+    def _create_deduplicator(self) -> Optional[CueDeduplicator]:
+        """Create duplicate cue suppression if enabled in config."""
+        dedup_config = self.config.get("duplicate_cues", {})
+        if not dedup_config.get("enabled", False):
+            return None
+        return CueDeduplicator(
+            max_files=dedup_config.get("max_files", 3),
+            mode=dedup_config.get("mode", "once"),
+        )
+
+    def _report_duplicate_cues(
+        self, deduplicator: CueDeduplicator, parsed_data: Dict[str, FileTokens]
+    ) -> None:
+        """Print how many repeated cues were suppressed and the most common ones."""
+        samples: Dict[int, str] = {}
+        for file_tokens in parsed_data.values():
+            for cue_hash, text in file_tokens.suppressed.items():
+                samples.setdefault(cue_hash, text)
+
+        print(
+            f"  Duplicate cues: {deduplicator.suppressed_count()} cues found in more"
+            f" than {deduplicator.max_files} files suppressed (mode: {deduplicator.mode})"
+        )
+        top_n = self.config.get("duplicate_cues", {}).get("report_top", 10)
+        for text, files in deduplicator.top_suppressed(samples, top_n):
+            print(f"    {files:>5} files  {text[:60]}")
+
+    def _merge_file_tokens(self, parsed_data: Dict[str, FileTokens]) -> None:
+        """Step 2: Merge per-file counts by word id, plus each word's first context."""
+        self.vocabulary = Vocabulary()
+        self._totals = array("q")
+        dispersion_index = DispersionIndex() if self._dispersion_ranking() else None
+        self.dispersion_index = None
+        if self._approximate_counting():
+            return  # counted, and contexts kept, while parsing
+        for file_tokens in parsed_data.values():
+            ids = self.vocabulary.add_counts(self._totals, file_tokens.counts)
+            if dispersion_index is not None:
+                dispersion_index.add_file(ids, file_tokens.counts.values())
+        self._collect_contexts(parsed_data)
+        if dispersion_index is not None:
+            dispersion_index.build(len(self.vocabulary))
+        self.dispersion_index = dispersion_index
+
+    def _collect_contexts(self, parsed_data: Dict[str, FileTokens]) -> None:
+        """Keep each word's context line from the first file, in name order, that has it."""
+        self._sentence_context = {}
+        for name in sorted(parsed_data):
+            for word, line in parsed_data[name].contexts.items():
+                self._sentence_context.setdefault(word, line)
+
+    def _dispersion_ranking(self) -> bool:
+        """Whether frequency.ranking is "dispersion" and this run can support it."""
+        if self.config.get("frequency", {}).get("ranking", "frequency") != "dispersion":
+            return False
+        unsupported = None
+        if not DispersionIndex.available():
+            unsupported = "needs numpy installed"
+        elif self._approximate_counting():
+            unsupported = "needs exact counts (approximate_counting is enabled)"
+        elif self.lemma_grouper:
+            unsupported = "does not apply to lemma groups"
+        elif self.config.get("saved_counts", {}).get("merge_files"):
+            unsupported = "has no per-file counts for merged saved counts"
+        if unsupported:
+            print(f"⚠️  frequency.ranking 'dispersion' {unsupported}; ranking by frequency")
+            return False
+        return True
 
     def _apply_lemmatization(self) -> Tuple[Dict[str, LemmaGroup], Dict[str, int]]:
         """Step 4a: Group words by lemma if enabled. Returns (groups, filtered_frequencies)."""
@@ -254,17 +635,17 @@ class SubtitleFrequencyAnalyzer:
                 threshold = min_freq_val
             else:
                 target_words = freq_config.get("target_words", 500)
-                sorted_items = sorted(
-                    filtered_frequencies.items(), key=lambda x: x[1], reverse=True
-                )
+                lemma_index = FrequencyIndex(filtered_frequencies)
                 threshold = (
-                    sorted_items[target_words - 1][1]
-                    if target_words < len(sorted_items)
+                    lemma_index.value_at_rank(max(target_words - 1, 0))
+                    if target_words < lemma_index.unique_words
                     else 1
                 )
             filtered_frequencies = {
                 k: v for k, v in filtered_frequencies.items() if v >= threshold
             }
+        elif self.dispersion_index is not None:
+            filtered_frequencies, threshold = self._rank_by_dispersion()
         else:
             if freq_config.get("threshold_mode") == "auto":
                 target_words = freq_config.get("target_words", 500)
@@ -273,18 +654,59 @@ class SubtitleFrequencyAnalyzer:
                 )
             else:
                 threshold = freq_config.get("min_frequency", 3)
-            filtered_frequencies = self.frequency_analyzer.filter_by_frequency(
-                min_frequency=threshold
-            )
             max_results = freq_config.get("max_results", 1000)
-            if len(filtered_frequencies) > max_results:
-                sorted_freqs = sorted(
-                    filtered_frequencies.items(), key=lambda x: x[1], reverse=True
+            index = self.frequency_analyzer.index
+            if index.count_at_least(threshold) > max_results:
+                filtered_frequencies = dict(index.top_n(max_results))
+            else:
+                filtered_frequencies = self.frequency_analyzer.filter_by_frequency(
+                    min_frequency=threshold
                 )
-                filtered_frequencies = dict(sorted_freqs[:max_results])
 
         return filtered_frequencies, threshold
 
+    def _rank_by_dispersion(self) -> Tuple[Dict[str, int], int]:
+        """
+        Step 5 (ranking: dispersion): keep the words used most evenly across files.
+
+        Words meeting the threshold (min_frequency in manual mode, 2 in
+        auto mode) are ordered by usage, i.e. frequency weighted by
+        dispersion, and cut to max_results (auto mode: target_words), so
+        the cut itself favors evenly spread words.
+
+        Returns:
+            (frequencies of the kept words in ranking order, threshold)
+        """
+        freq_config = self.config.get("frequency", {})
+        measure = freq_config.get("dispersion_measure", "juilland")
+        limit = freq_config.get("max_results", 1000)
+        if freq_config.get("threshold_mode") == "manual":
+            threshold = freq_config.get("min_frequency", 3)
+        else:
+            threshold = 2
+            limit = min(limit, freq_config.get("target_words", 500))
+        candidates = self.frequency_analyzer.filter_by_frequency(min_frequency=threshold)
+        ranked_ids = self.dispersion_index.rank(
+            [self.vocabulary.get(word) for word in candidates], measure=measure, limit=limit
+        )
+        print(
+            f"  Ranked {len(candidates)} words by dispersion ({measure})"
+            f" across {self.dispersion_index.file_count} files"
+        )
+        ranked = [self.vocabulary.word(word_id) for word_id in ranked_ids]
+        return {word: candidates[word] for word in ranked}, threshold
+
+    def _dispersion_rows(self, words: List[str]) -> Optional[Dict[str, Dict[str, float]]]:
+        """Dispersion report columns of the given words (None unless ranking by dispersion)."""
+        if self.dispersion_index is None:
+            return None
+        known = [word for word in words if self.vocabulary.get(word) is not None]
+        rows = self.dispersion_index.summaries(
+            [self.vocabulary.get(word) for word in known],
+            measure=self.config.get("frequency", {}).get("dispersion_measure", "juilland"),
+        )
+        return dict(zip(known, rows))
+
     def _apply_curation(
         self, filtered_frequencies: Dict[str, int], lemma_groups: Dict[str, LemmaGroup]
     ) -> Dict[str, int]:
@@ -331,7 +753,11 @@ class SubtitleFrequencyAnalyzer:
     ) -> Dict[str, Path]:
         """Step 6: Generate all reports."""
         reports = self.report_generator.generate_all_reports(
-            filtered_frequencies, stats, source_files, top_n=len(filtered_frequencies)
+            filtered_frequencies,
+            stats,
+            source_files,
+            top_n=len(filtered_frequencies),
+            dispersion=self._dispersion_rows(list(filtered_frequencies)),
         )
         if lemma_groups:
             reports["lemma_markdown"] = (
@@ -341,6 +767,15 @@ class SubtitleFrequencyAnalyzer:
             )
         return reports
 
+    def _resolve_subtitles_dir(self, subtitles_dir: Optional[Path]) -> Path:
+        """Resolve the subtitles directory relative to language_root."""
+        language_root = Path(__file__).parent.parent
+        if subtitles_dir is None:
+            subtitles_dir = Path(self.config["paths"]["subtitles_directory"])
+            if not subtitles_dir.is_absolute():
+                subtitles_dir = language_root / subtitles_dir
+        return Path(subtitles_dir)
+
     def analyze(self, subtitles_dir: Path = None) -> Dict:
         """
         Run the complete analysis pipeline.
@@ -355,45 +790,101 @@ class SubtitleFrequencyAnalyzer:
         print("SUBTITLE WORD FREQUENCY ANALYZER")
         print("=" * 70)
 
-        # Resolve subtitles directory relative to language_root
-        language_root = Path(__file__).parent.parent
-        if subtitles_dir is None:
-            subtitles_dir = Path(self.config["paths"]["subtitles_directory"])
-            if not subtitles_dir.is_absolute():
-                subtitles_dir = language_root / subtitles_dir
-        subtitles_dir = Path(subtitles_dir)
+        subtitles_dir = self._subtitles_dir = self._resolve_subtitles_dir(subtitles_dir)
 
         print(f"\n📁 Subtitles directory: {subtitles_dir}")
         print(f"📝 Stopwords file: {self.stopword_manager.stopwords_file}")
         print(f"💾 Output directory: {self.report_generator.output_dir}\n")
 
+        # Filters must be complete before approximate counting, which
+        # counts each file while parsing
+        self._load_known_words()
+
         # Step 1
         print("Step 1: Parsing subtitle files...")
         try:
-            parsed_data = self._parse_subtitles(subtitles_dir)
-            print(f"✓ Parsed {len(parsed_data)} files")
+            self._parsed_data = self._parse_subtitles(subtitles_dir)
+            print(f"✓ Parsed {len(self._parsed_data)} files")
         except Exception as e:
             print(f"❌ Error parsing files: {e}")
             return None
 
-        # Steps 2+3
+        # Step 2
         print("\nStep 2: Processing words...")
-        all_words, filtered_words = self._process_and_filter(parsed_data)
-        print(f"✓ Extracted {len(all_words)} total words")
+        self._merge_file_tokens(self._parsed_data)
+        results = self._run_analysis(list(self._parsed_data.keys()))
+
+        print("\n" + "=" * 70)
+        print("ANALYSIS COMPLETE!")
+        print("=" * 70)
+
+        return results
+
+    def _approximate_counting(self) -> bool:
+        """Whether approximate_counting is enabled."""
+        return self.config.get("approximate_counting", {}).get("enabled", False)
+
+    def _count_filtered_words(self) -> None:
+        """Step 3: Count the words no filter rule excludes."""
+        # One pass over the word ids; verdicts are kept per id, so on
+        # watch updates only newly seen words are looked up
+        self.frequency_analyzer.analyze_ids(
+            self._totals,
+            self.filter_chain.filter_ids(self._totals, self.vocabulary),
+            self.vocabulary,
+        )
+
+    def _filter_words(self, recount: bool = True) -> None:
+        """
+        Step 3: Drop stopwords and other excluded words while counting, then merge saved counts.
+
+        Args:
+            recount: Count every file again; False when watch mode has
+                already updated the counts of the changed files
+        """
+        approximate = self._approximate_counting()
+        extracted = self._extracted_words if approximate else sum(self._totals)
+        print(f"✓ Extracted {extracted} total words")
         print(f"  Stopwords loaded: {self.stopword_manager.get_count()}")
 
         print("\nStep 3: Filtering stopwords...")
-        print(f"✓ Filtered stopwords, {len(filtered_words)} words remaining")
+        # Approximate counts are taken while parsing (_count_approximately())
+        if recount and not approximate:
+            self._count_filtered_words()
+            self._removed_words = self.filter_chain.hits.copy()
+        removed = self._removed_words
+        remaining = self.frequency_analyzer.total_words
+        if self.english_word_filter and self.config.get("advanced", {}).get("verbose", True):
+            print(
+                f"  English filter: removed {removed['english']}"
+                f" English words, {remaining} remaining"
+            )
+        if "known" in self.filter_chain.rules:
+            print(f"  Known words: removed {removed['known']} words already in Anki")
+        print(
+            f"✓ Filtered {removed['stopwords']} stopwords, {remaining} words remaining"
+        )
+        self._apply_saved_counts()
 
-        # Step 4
+    def _analyze_frequencies(self) -> Dict[str, Any]:
+        """Step 4: Compute statistics over the counted words."""
         print("\nStep 4: Analyzing word frequencies...")
-        self.frequency_analyzer.analyze(filtered_words)
         stats = self.frequency_analyzer.get_statistics()
-        print(f"✓ Found {stats['unique_words']} unique words")
+        if stats.get("estimated"):
+            print(
+                f"✓ Tracking {stats['unique_words']} candidate words"
+                f" (approximate counts, at most +{stats['max_overestimate']})"
+            )
+        else:
+            print(f"✓ Found {stats['unique_words']} unique words")
+        return stats
+
+    def _run_analysis(self, source_files: List[str], recount: bool = True) -> Dict:
+        """Steps 3-6: Filter, count, threshold and report on the merged counts."""
+        self._filter_words(recount)
+        stats = self._analyze_frequencies()
 
         # Step 4a
-        lemma_groups: Dict[str, LemmaGroup] = {}
-        filtered_frequencies: Dict[str, int] = {}
         lemma_groups, filtered_frequencies = self._apply_lemmatization()
         if lemma_groups:
             print(f"\nStep 4a: Grouped into {len(lemma_groups)} lemma groups")
@@ -412,16 +903,11 @@ class SubtitleFrequencyAnalyzer:
 
         # Step 6
         print("\nStep 6: Generating reports...")
-        source_files = list(parsed_data.keys())
         reports = self._generate_reports(
             filtered_frequencies, stats, source_files, lemma_groups
         )
         print(f"✓ Generated {len(reports)} reports")
 
-        print("\n" + "=" * 70)
-        print("ANALYSIS COMPLETE!")
-        print("=" * 70)
-
         return {
             "frequencies": filtered_frequencies,
             "statistics": stats,
@@ -429,6 +915,128 @@ class SubtitleFrequencyAnalyzer:
             "threshold": threshold,
         }
 
+    def watch(self, interval: float) -> None:
+        """
+        Poll the subtitles directory and update reports incrementally.
+
+        Must be called after analyze(). Only new or changed files are
+        parsed; their counts are merged into the existing totals and the
+        reports are regenerated. Stops on Ctrl+C.
+
+        Args:
+            interval: Seconds between directory polls
+        """
+        file_pattern = self.config.get("advanced", {}).get("file_pattern", "*.srt")
+        watcher = DirectoryWatcher(self.parser, self._subtitles_dir, file_pattern)
+        watcher.reset()
+        print(f"\n👀 Watching {self._subtitles_dir} every {interval:g}s (Ctrl+C to stop)")
+
+        try:
+            while True:
+                time.sleep(interval)
+                changed, removed = watcher.poll()
+                if changed or removed:
+                    self._apply_file_changes(changed, removed)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+
+    def _apply_file_changes(self, changed: List[Path], removed: List[Path]) -> None:
+        """Re-parse changed files, merge their counts and regenerate reports."""
+        print(f"\n🔄 {len(changed)} new/changed, {len(removed)} removed file(s)")
+
+        if (
+            self.config.get("duplicate_cues", {}).get("enabled", False)
+            or self._approximate_counting()
+            or self.dispersion_index is not None
+        ):
+            # Which cues repeat depends on every file, approximate counts
+            # cannot be subtracted and dispersion rows are built once, so go
+            # over the whole directory again; unchanged files still come
+            # from the parse cache
+            self._parsed_data = self._parse_subtitles(self._subtitles_dir)
+            self._merge_file_tokens(self._parsed_data)
+            self._run_analysis(list(self._parsed_data.keys()))
+            print(f"✓ Reports updated ({len(self._parsed_data)} files)")
+            return
+
+        old_counts, new_counts = self._reparse_files(changed, removed)
+        # Contexts of removed and changed files go with them
+        self._collect_contexts(self._parsed_data)
+        # Merged saved counts are not kept apart from this run's counts,
+        # so count every file again when there are any
+        recount = bool(self.config.get("saved_counts", {}).get("merge_files"))
+        if not recount:
+            self._update_filtered_counts(old_counts, new_counts)
+        self._run_analysis(sorted(self._parsed_data), recount=recount)
+        print(f"✓ Reports updated ({len(self._parsed_data)} files)")
+
+    def _reparse_files(
+        self, changed: List[Path], removed: List[Path]
+    ) -> Tuple[List[Counter], List[Counter]]:
+        """
+        Replace the parsed data and id totals of changed and removed files.
+
+        Returns:
+            (old word counts taken out, new word counts added), one Counter per file
+        """
+        old_counts: List[Counter] = []
+        for path in removed + changed:
+            for name in self._source_names(path):
+                counts = self._parsed_data.pop(name).counts
+                self.vocabulary.add_counts(self._totals, counts, sign=-1)
+                old_counts.append(counts)
+
+        new_counts: List[Counter] = []
+        for path in changed:
+            for name, file_tokens in self._tokenize_path(path).items():
+                print(f"  Parsed {name}")
+                self._parsed_data[name] = file_tokens
+                self.vocabulary.add_counts(self._totals, file_tokens.counts)
+                new_counts.append(file_tokens.counts)
+        return old_counts, new_counts
+
+    def _update_filtered_counts(self, old_counts: List[Counter], new_counts: List[Counter]) -> None:
+        """Move the filtered counts of changed files from their old to their new version."""
+        added, added_removed = self._filter_file_counts(new_counts)
+        taken_out, taken_out_removed = self._filter_file_counts(old_counts)
+        self._removed_words.update(added_removed)
+        self._removed_words.subtract(taken_out_removed)
+        shard = FrequencyAnalyzer()
+        shard.analyze_counts(taken_out)
+        # Adding first keeps words present in both versions in their place
+        self.frequency_analyzer.update(added)
+        self.frequency_analyzer.subtract(shard)
+
+    def _filter_file_counts(self, count_batches: List[Counter]) -> Tuple[Counter, Counter]:
+        """Sum the counts of some files the filters keep. Returns (kept counts, removed per rule)."""
+        kept: Counter = Counter()
+        for counts in self.filter_chain.filter_counts(count_batches):
+            kept.update(counts)
+        return kept, self.filter_chain.hits
+
+    def _source_names(self, path: Path) -> List[str]:
+        """Names of parsed sources that came from a file or archive path."""
+        member_prefix = path.name + "!"
+        return [
+            name for name in self._parsed_data
+            if name == path.name or name.startswith(member_prefix)
+        ]
+
+    def _tokenize_path(self, path: Path) -> Dict[str, FileTokens]:
+        """Tokenize one subtitle file or every member of one archive."""
+        file_pattern = self.config.get("advanced", {}).get("file_pattern", "*.srt")
+        if self.parser.archive_reader.is_archive(path):
+            return self.parser.tokenize_directory(
+                path, self.word_processor, file_pattern, cache=self._parse_cache
+            )
+        file_tokens = self.parser.tokenize_source(
+            SubtitleSource(path.name, path), self.word_processor, self._parse_cache
+        )
+        if file_tokens.error:
+            print(f"⚠️  {file_tokens.error}")
+            return {}
+        return {path.name: file_tokens}
+
     def add_stopwords(self, words: List[str]) -> None:
         """Add words to stopword list."""
         count = self.stopword_manager.add_stopwords(words)
@@ -567,12 +1175,7 @@ class SubtitleFrequencyAnalyzer:
             return None
 
 
-def parse_arguments():
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Analyze word frequencies in subtitle files",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+USAGE_EXAMPLES = """
 Examples:
   # Run with default configuration
   python subtitle_word_frequency.py
@@ -583,6 +1186,9 @@ Examples:
   # Override subtitles directory
   python subtitle_word_frequency.py --subtitles-dir /path/to/subtitles
 
+  # Read a zipped season pack directly (no extraction needed)
+  python subtitle_word_frequency.py --subtitles-dir /path/to/season1.zip
+
   # Add stopwords
   python subtitle_word_frequency.py --add-stopwords "hola,adiós,gracias"
 
@@ -592,14 +1198,73 @@ Examples:
   # Use manual threshold
   python subtitle_word_frequency.py --min-freq 5
 
+  # Parse and tokenize with 8 worker processes
+  python subtitle_word_frequency.py --jobs 8
+
+  # Drop theme-song and credit cues that appear in more than 5 episodes
+  python subtitle_word_frequency.py --dedup-cues --dedup-max-files 5
+
+  # Keep running and refresh reports whenever a new episode is added
+  python subtitle_word_frequency.py --watch --watch-interval 10
+
+  # Skip words that already have notes in an Anki deck (Anki must be running)
+  python subtitle_word_frequency.py --known-deck "Spanish::Vocab"
+
+  # Rank words heard in every episode above words repeated in just one
+  python subtitle_word_frequency.py --ranking dispersion
+
+  # Count each show once, then report on both without reparsing
+  python subtitle_word_frequency.py -s ../subtitles/show1 --save-counts show1.freq
+  python subtitle_word_frequency.py -s ../subtitles/show2 --merge-counts show1.freq
+
   # Analyze and translate in one command
   python subtitle_word_frequency.py --translate
 
   # Translate to German
   python subtitle_word_frequency.py --translate --target-lang DE
-        """,
+"""
+
+# Config overrides applied when a CLI option is given:
+# (argument, config section, key, function of the argument's value)
+CLI_OVERRIDES = (
+    ("min_freq", "frequency", "threshold_mode", lambda value: "manual"),
+    ("min_freq", "frequency", "min_frequency", lambda value: value),
+    ("ranking", "frequency", "ranking", lambda value: value),
+    ("curate", "llm_curation", "enabled", lambda value: True),
+    ("source_lang", "translation", "source_lang", lambda value: value),
+    ("jobs", "advanced", "jobs", lambda value: value),
+    ("no_cache", "parse_cache", "enabled", lambda value: False),
+    ("rebuild_cache", "parse_cache", "rebuild", lambda value: True),
+    ("no_cue_filter", "cue_filter", "enabled", lambda value: False),
+    ("dedup_cues", "duplicate_cues", "enabled", lambda value: True),
+    ("dedup_max_files", "duplicate_cues", "max_files", lambda value: value),
+    ("approximate", "approximate_counting", "enabled", lambda value: True),
+    ("save_counts", "saved_counts", "save_file", str),
+    ("merge_counts", "saved_counts", "merge_files", lambda paths: [str(path) for path in paths]),
+    ("known_deck", "known_words", "enabled", lambda value: True),
+    ("known_deck", "known_words", "decks", lambda value: value),
+    ("no_known_words", "known_words", "enabled", lambda value: False),
+)
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Analyze word frequencies in subtitle files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=USAGE_EXAMPLES,
     )
+    _add_input_arguments(parser)
+    _add_performance_arguments(parser)
+    _add_cue_arguments(parser)
+    _add_counting_arguments(parser)
+    _add_stopword_arguments(parser)
+    _add_language_arguments(parser)
+    return parser.parse_args()
+
 
+def _add_input_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add config and subtitle source options."""
     parser.add_argument(
         "--config", "-c", type=Path, help="Path to configuration YAML file"
     )
@@ -608,9 +1273,70 @@ Examples:
         "--subtitles-dir",
         "-s",
         type=Path,
-        help="Directory containing subtitle files (overrides config)",
+        help=(
+            "Directory of subtitle files and/or archives, or a single .zip/.tar/.gz "
+            "archive (overrides config)"
+        ),
+    )
+
+
+def _add_performance_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add worker, cache and watch options."""
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for parsing/tokenizing (0 = all CPUs, overrides config)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the per-file token cache for this run",
+    )
+
+    parser.add_argument(
+        "--rebuild-cache",
+        action="store_true",
+        help="Discard the per-file token cache and rebuild it from scratch",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and update reports when subtitle files are added or changed",
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        help="Seconds between directory polls in --watch mode (overrides config)",
+    )
+
+
+def _add_cue_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add cue filtering and duplicate cue options."""
+    parser.add_argument(
+        "--no-cue-filter",
+        action="store_true",
+        help="Keep cues matching cue_filter.patterns (e.g. Amara.org credits)",
+    )
+
+    parser.add_argument(
+        "--dedup-cues",
+        action="store_true",
+        help="Suppress cues repeated across many files (theme songs, credits)",
     )
 
+    parser.add_argument(
+        "--dedup-max-files",
+        type=int,
+        help="Suppress cues found in more than this many files (overrides config)",
+    )
+
+
+def _add_counting_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add threshold, ranking, counting and known-words options."""
     parser.add_argument(
         "--min-freq",
         "-f",
@@ -618,6 +1344,46 @@ Examples:
         help="Minimum frequency threshold (sets threshold_mode to manual)",
     )
 
+    parser.add_argument(
+        "--ranking",
+        choices=("frequency", "dispersion"),
+        help="Rank by raw frequency or by spread across files (overrides frequency.ranking)",
+    )
+
+    parser.add_argument(
+        "--approximate",
+        action="store_true",
+        help="Count in bounded memory; report counts are estimates (see approximate_counting)",
+    )
+
+    parser.add_argument(
+        "--save-counts",
+        type=Path,
+        help="Save filtered counts to this file for later --merge-counts (overrides config)",
+    )
+
+    parser.add_argument(
+        "--merge-counts",
+        type=Path,
+        nargs="+",
+        help="Add counts saved by earlier runs, e.g. other shows (overrides config)",
+    )
+
+    parser.add_argument(
+        "--known-deck",
+        action="append",
+        help="Skip words already in this Anki deck (repeatable, overrides known_words.decks)",
+    )
+
+    parser.add_argument(
+        "--no-known-words",
+        action="store_true",
+        help="Do not skip words already in Anki decks for this run",
+    )
+
+
+def _add_stopword_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add stopword list management options."""
     parser.add_argument(
         "--add-stopwords", type=str, help="Comma-separated list of stopwords to add"
     )
@@ -634,6 +1400,9 @@ Examples:
         help="List all current stopwords and exit",
     )
 
+
+def _add_language_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add curation and translation options."""
     parser.add_argument(
         "--translate",
         action="store_true",
@@ -649,7 +1418,7 @@ Examples:
     parser.add_argument(
         "--source-lang",
         default=None,
-        help="Source language for translation (default: from config.yaml or ES)",
+        help="Subtitle language, for tokenizing and translation (default: from config.yaml or ES)",
     )
 
     parser.add_argument(
@@ -658,7 +1427,74 @@ Examples:
         help="Target language for translation (default: from config.yaml or EN-US)",
     )
 
-    return parser.parse_args()
+
+def _apply_cli_overrides(config: Dict[str, Any], args: argparse.Namespace) -> None:
+    """
+    Override config values with the CLI options that were given.
+
+    Args:
+        config: Loaded configuration, updated in place
+        args: Parsed command-line arguments
+    """
+    for argument, section, key, convert in CLI_OVERRIDES:
+        value = getattr(args, argument)
+        if value is not None and value is not False:
+            config.setdefault(section, {})[key] = convert(value)
+
+
+def _manage_stopwords(analyzer: SubtitleFrequencyAnalyzer, args: argparse.Namespace) -> bool:
+    """
+    Run the --list/--add/--remove-stopwords commands.
+
+    Returns:
+        True if a stopword command ran (nothing else should run)
+    """
+    if args.list_stopwords:
+        stopwords = sorted(analyzer.stopword_manager.get_stopwords())
+        print(f"\nCurrent stopwords ({len(stopwords)}):")
+        for word in stopwords:
+            print(f"  - {word}")
+        return True
+
+    if args.add_stopwords:
+        words = [w.strip() for w in args.add_stopwords.split(",")]
+        analyzer.add_stopwords(words)
+        return True
+
+    if args.remove_stopwords:
+        words = [w.strip() for w in args.remove_stopwords.split(",")]
+        analyzer.remove_stopwords(words)
+        return True
+
+    return False
+
+
+def _translate_results(
+    analyzer: SubtitleFrequencyAnalyzer, args: argparse.Namespace, results: Dict[str, Any]
+) -> None:
+    """Translate the Anki word list if requested (via --translate flag or config)."""
+    translation_config = analyzer.config.get("translation", {})
+    if not (args.translate or translation_config.get("enabled", False)):
+        return
+    anki_words_file = results["reports"].get("anki")
+    if not anki_words_file:
+        return
+
+    # Use command-line args if provided, otherwise use config, otherwise use defaults
+    source_lang = args.source_lang or translation_config.get("source_lang", "ES")
+    target_lang = args.target_lang or translation_config.get("target_lang", "EN-US")
+    output_filename = translation_config.get("output_filename", "translated_words.txt")
+    translated_file = analyzer.report_generator.output_dir / output_filename
+
+    result = analyzer.translate_wordlist(
+        anki_words_file,
+        translated_file,
+        source_lang=source_lang,
+        target_lang=target_lang,
+    )
+    if result:
+        print(f"\n📚 Anki-ready file: {result}")
+        print("   Import to Anki: File → Import → Tab-separated")
 
 
 def main():
@@ -669,31 +1505,15 @@ def main():
         # Initialize analyzer
         analyzer = SubtitleFrequencyAnalyzer(config_path=args.config)
 
-        # Handle stopword management
-        if args.list_stopwords:
-            stopwords = sorted(analyzer.stopword_manager.get_stopwords())
-            print(f"\nCurrent stopwords ({len(stopwords)}):")
-            for word in stopwords:
-                print(f"  - {word}")
-            return 0
-
-        if args.add_stopwords:
-            words = [w.strip() for w in args.add_stopwords.split(",")]
-            analyzer.add_stopwords(words)
-            return 0
-
-        if args.remove_stopwords:
-            words = [w.strip() for w in args.remove_stopwords.split(",")]
-            analyzer.remove_stopwords(words)
+        if _manage_stopwords(analyzer, args):
             return 0
 
         # Override config with command-line arguments
-        if args.min_freq:
-            analyzer.config["frequency"]["threshold_mode"] = "manual"
-            analyzer.config["frequency"]["min_frequency"] = args.min_freq
-
-        if args.curate:
-            analyzer.config["llm_curation"]["enabled"] = True
+        _apply_cli_overrides(analyzer.config, args)
+        if args.source_lang:
+            analyzer.word_processor = analyzer._create_word_processor()
+        if args.no_cue_filter:
+            analyzer.parser.cue_filter = None
 
         # Run analysis
         results = analyzer.analyze(subtitles_dir=args.subtitles_dir)
@@ -706,34 +1526,13 @@ def main():
         print(f"  Frequency threshold used: {results['threshold']}")
         print(f"\n✨ Reports saved to: {analyzer.report_generator.output_dir}")
 
-        # Translate if requested (via --translate flag or config)
-        translation_config = analyzer.config.get("translation", {})
-        should_translate = args.translate or translation_config.get("enabled", False)
+        _translate_results(analyzer, args, results)
 
-        if should_translate:
-            anki_words_file = results["reports"].get("anki")
-            if anki_words_file:
-                # Use command-line args if provided, otherwise use config, otherwise use defaults
-                source_lang = args.source_lang or translation_config.get(
-                    "source_lang", "ES"
-                )
-                target_lang = args.target_lang or translation_config.get(
-                    "target_lang", "EN-US"
-                )
-                output_filename = translation_config.get(
-                    "output_filename", "translated_words.txt"
-                )
-                translated_file = analyzer.report_generator.output_dir / output_filename
-
-                result = analyzer.translate_wordlist(
-                    anki_words_file,
-                    translated_file,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                )
-                if result:
-                    print(f"\n📚 Anki-ready file: {result}")
-                    print("   Import to Anki: File → Import → Tab-separated")
+        if args.watch:
+            interval = args.watch_interval or analyzer.config.get("watch", {}).get(
+                "interval_seconds", 30
+            )
+            analyzer.watch(interval)
 
         return 0
 
@@ -745,6 +1544,5 @@ def main():
         traceback.print_exc()
         return 1
 
-
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,8 @@
+"""Make the subtitle_analyzer package and the scripts importable, as the scripts do."""
+
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1] / "src" / "ai_assisted_language_quizzer"
+sys.path.insert(0, str(PACKAGE_ROOT / "core"))
+sys.path.insert(1, str(PACKAGE_ROOT / "scripts"))
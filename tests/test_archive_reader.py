@@ -0,0 +1,21 @@
+"""Tests for ArchiveReader."""
+
+import io
+import tarfile
+
+from subtitle_analyzer import ArchiveReader
+
+
+def test_tar_members_sorted_and_read_one_at_a_time(tmp_path):
+    archive = tmp_path / "season.tar.gz"
+    with tarfile.open(archive, "w:gz") as tf:
+        for name in ("e02.srt", "notes.txt", "e01.srt"):
+            data = name.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    sources = list(ArchiveReader().iter_members(archive))
+
+    assert [source.name for source in sources] == ["season.tar.gz!e01.srt", "season.tar.gz!e02.srt"]
+    assert [source.data for source in sources] == [b"e01.srt", b"e02.srt"]
@@ -0,0 +1,55 @@
+"""Tests for CompactLexicon."""
+
+import random
+
+import pytest
+
+from subtitle_analyzer import CompactLexicon
+
+
+def random_words(count, seed):
+    rng = random.Random(seed)
+    letters = "abcdeñóü'-"
+    return {"".join(rng.choice(letters) for _ in range(rng.randint(1, 8))) for _ in range(count)}
+
+
+def test_membership_matches_a_set(tmp_path):
+    words = random_words(3000, seed=1) | {"casa", "casas", "casamiento", "cañón", "über"}
+    path = tmp_path / "words.lex"
+
+    assert CompactLexicon.build(list(words) + ["casa", ""], path) == len(words)
+
+    probes = words | random_words(3000, seed=2) | {"", "cas", "casasx", "canon", "uber", "cása"}
+    with CompactLexicon(path) as lexicon:
+        assert len(lexicon) == len(words)
+        for word in probes:
+            assert (word in lexicon) == (word in words), word
+        assert list(lexicon) == sorted(words, key=lambda word: word.encode("utf-8"))
+        assert 42 not in lexicon
+        assert None not in lexicon
+
+
+def test_empty_lexicon(tmp_path):
+    path = tmp_path / "empty.lex"
+    CompactLexicon.build([], path)
+
+    with CompactLexicon(path) as lexicon:
+        assert len(lexicon) == 0
+        assert "a" not in lexicon
+        assert "" not in lexicon
+        assert list(lexicon) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "words.lex"
+    path.write_bytes(b"casa\ncasas\n" * 4)
+
+    with pytest.raises(ValueError):
+        CompactLexicon(path)
+
+
+def test_read_word_list(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("# header\nCasa\n\n  Ñandú \n", encoding="utf-8")
+
+    assert CompactLexicon.read_word_list(path) == ["casa", "ñandú"]
@@ -0,0 +1,45 @@
+"""Tests for CountMinSketch error bounds."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from subtitle_analyzer import CountMinSketch
+
+
+def zipf_words(n, vocabulary, seed=0):
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    return rng.choices([f"palabra{i}" for i in range(vocabulary)], weights, k=n)
+
+
+def test_estimates_are_upper_bounds_within_the_error_bound():
+    words = zipf_words(20000, 3000)
+    truth = Counter(words)
+    sketch = CountMinSketch(width=2048, depth=4)
+    for word in words:
+        sketch.add(word)
+
+    bound = sketch.error_bound()
+    for word, count in truth.items():
+        estimate = sketch.estimate(word)
+        assert count <= estimate <= count + bound
+    assert sketch.total == len(words)
+
+
+def test_memory_does_not_grow_with_distinct_words():
+    sketch = CountMinSketch(width=512, depth=3)
+    size = sketch.memory_bytes()
+    for i in range(10000):
+        sketch.add(f"w{i}", 2)
+    assert sketch.memory_bytes() == size == 8 * 512 * 3
+
+
+def test_unseen_word_estimates_zero_in_empty_sketch():
+    assert CountMinSketch(width=16, depth=2).estimate("casa") == 0
+
+
+def test_rejects_empty_table():
+    with pytest.raises(ValueError):
+        CountMinSketch(width=0)
@@ -0,0 +1,18 @@
+"""Tests for CueTable storage of parsed cues."""
+
+from subtitle_analyzer import CueTable, SRTParser
+
+
+def test_out_of_range_index_is_skipped(tmp_path):
+    srt = tmp_path / "bad_index.srt"
+    srt.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\nhola\n\n"
+        "99999999999999999999\n00:00:03,000 --> 00:00:04,000\nadiós\n",
+        encoding="utf-8",
+    )
+    table = CueTable()
+    file_id = table.add_file(srt.name, SRTParser().iter_cues(srt))
+
+    cues = list(table.iter_cues(file_id))
+    assert [cue.index for cue in cues] == [1, 2]
+    assert [cue.lines for cue in cues] == [("hola",), ("adiós",)]
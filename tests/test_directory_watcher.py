@@ -0,0 +1,19 @@
+"""Tests for DirectoryWatcher."""
+
+import shutil
+
+from subtitle_analyzer import DirectoryWatcher, SRTParser
+
+
+def test_removed_directory_scans_as_empty(tmp_path):
+    root = tmp_path / "subs"
+    root.mkdir()
+    episode = root / "e01.srt"
+    episode.write_text("1\n00:00:01,000 --> 00:00:02,000\nhola\n", encoding="utf-8")
+    watcher = DirectoryWatcher(SRTParser(), root)
+    watcher.reset()
+
+    shutil.rmtree(root)
+
+    assert watcher.scan() == {}
+    assert watcher.poll() == ([], [episode])
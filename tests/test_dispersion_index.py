@@ -0,0 +1,58 @@
+"""Tests for DispersionIndex on a corpus small enough to compute by hand."""
+
+import math
+
+import pytest
+
+from subtitle_analyzer import DispersionIndex
+
+pytest.importorskip("numpy")
+
+
+def build(files, vocabulary_size):
+    index = DispersionIndex()
+    for counts in files:
+        index.add_file(list(counts), counts.values())
+    index.build(vocabulary_size)
+    return index
+
+
+# Word ids 0-2 over three files of 4, 4 and 8 tokens (shares 1/4, 1/4, 1/2);
+# id 3 never occurs.
+#   word 0: 2, 2, 4 -> same rate (1/2) everywhere          D = 1,   DP = 0
+#   word 1: 2, 0, 4 -> rates 1/2, 0, 1/2; sd/mean = 1/sqrt(2)
+#                      D = 1 - (1/sqrt(2)) / sqrt(2) = 1/2
+#                      DP = (|1/3 - 1/4| + 1/4 + |2/3 - 1/2|) / 2 / (1 - 1/4) = 1/3
+#   word 2: 0, 2, 0 -> sd/mean = sqrt(2), D = 0; DP = (1/4 + 3/4 + 1/2) / 2 / (3/4) = 1
+CORPUS = [{0: 2, 1: 2}, {0: 2, 2: 2}, {}, {0: 4, 1: 4}]
+
+
+def test_scores_match_hand_computed_values():
+    index = build(CORPUS, vocabulary_size=4)
+    scores = index.scores()
+
+    assert index.file_count == 3
+    assert scores["frequency"].tolist() == [8, 6, 2, 0]
+    assert scores["documents"].tolist() == [3, 2, 1, 0]
+    assert scores["juilland_d"].tolist() == pytest.approx([1, 0.5, 0, 0])
+    assert scores["gries_dp"].tolist() == pytest.approx([0, 1 / 3, 1, 1])
+    assert scores["tfidf"].tolist() == pytest.approx([0, 0.5 * math.log(1.5), 0.5 * math.log(3), 0])
+
+
+def test_rank_and_usage():
+    index = build(CORPUS, vocabulary_size=4)
+
+    assert index.usage("juilland").tolist() == pytest.approx([8, 3, 0, 0])
+    assert index.usage("gries").tolist() == pytest.approx([8, 4, 0, 0])
+    assert index.rank([3, 2, 1, 0]) == [0, 1, 3, 2]  # ties keep the given order
+    assert index.rank([2, 1, 0], measure="gries", limit=2) == [0, 1]
+    with pytest.raises(ValueError):
+        index.usage("zipf")
+
+
+def test_single_file_is_evenly_spread():
+    index = build([{0: 3, 1: 1}], vocabulary_size=3)
+    scores = index.scores()
+
+    assert scores["juilland_d"].tolist() == [1, 1, 0]
+    assert scores["gries_dp"].tolist() == [0, 0, 1]
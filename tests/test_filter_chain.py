@@ -0,0 +1,35 @@
+"""Tests for FilterChain pattern rules."""
+
+import pytest
+
+from subtitle_analyzer import FilterChain
+
+
+def test_backreference_pattern_matches_on_its_own():
+    chain = FilterChain()
+    chain.add_rule("stopwords", patterns=[r"x+", r"(ja)\1+"])
+    assert chain.rule_for("jajaja") == "stopwords"
+    assert chain.rule_for("jaja") == "stopwords"
+    assert chain.rule_for("jajo") is None
+
+
+def test_backreference_keeps_rule_priority():
+    chain = FilterChain()
+    chain.add_rule("stopwords", patterns=[r"(je)\1+"])
+    chain.add_rule("english", patterns=[r"j\w+"])
+    assert chain.rule_for("jejeje") == "stopwords"
+    assert chain.rule_for("jelly") == "english"
+
+
+def test_same_named_group_in_two_patterns():
+    chain = FilterChain()
+    chain.add_rule("stopwords", patterns=[r"(?P<laugh>ja)+"])
+    chain.add_rule("english", patterns=[r"(?P<laugh>ha)+"])
+    assert chain.rule_for("jaja") == "stopwords"
+    assert chain.rule_for("haha") == "english"
+
+
+def test_invalid_pattern_names_the_pattern():
+    chain = FilterChain()
+    with pytest.raises(ValueError, match=r"\(ja"):
+        chain.add_rule("stopwords", patterns=[r"(ja"])
@@ -0,0 +1,101 @@
+"""Tests for FrequencyAnalyzer counting, statistics and saved state."""
+
+import pytest
+
+from subtitle_analyzer import FrequencyAnalyzer
+
+
+def test_exact_statistics_have_no_estimate_keys():
+    analyzer = FrequencyAnalyzer()
+    analyzer.analyze_counts({"casa": 3, "perro": 1})
+
+    stats = analyzer.get_statistics()
+
+    assert "estimated" not in stats
+    assert "max_overestimate" not in stats
+    assert stats["most_common_word"] == ("casa", 3)
+
+
+def test_approximate_statistics_mark_estimates():
+    analyzer = FrequencyAnalyzer()
+    analyzer.analyze_approximate([{"casa": 3, "perro": 1}], top_k=1, sketch_width=64)
+
+    stats = analyzer.get_statistics()
+
+    assert stats["estimated"] is True
+    assert stats["max_overestimate"] >= 0
+
+
+def test_save_load_merge_subtract_round_trip(tmp_path):
+    show = FrequencyAnalyzer()
+    show.analyze_counts({"año": 4, "niño": 2, "über": 1, "casa": 3})
+    show.save(tmp_path / "show.frq")
+    other = FrequencyAnalyzer()
+    other.analyze_counts({"casa": 5, "perro": 1})
+
+    loaded = FrequencyAnalyzer.load(tmp_path / "show.frq")
+    assert loaded.word_frequencies == show.word_frequencies
+    assert (loaded.total_words, loaded.unique_words) == (10, 4)
+
+    loaded.merge(other)
+    assert loaded.word_frequencies["casa"] == 8
+    assert (loaded.total_words, loaded.unique_words) == (16, 5)
+
+    loaded.subtract(other)
+    assert loaded.word_frequencies == show.word_frequencies
+    assert (loaded.total_words, loaded.unique_words) == (10, 4)
+
+
+def test_empty_analyzer_round_trip(tmp_path):
+    FrequencyAnalyzer().save(tmp_path / "empty.frq")
+
+    loaded = FrequencyAnalyzer.load(tmp_path / "empty.frq")
+    loaded.merge(FrequencyAnalyzer())
+    loaded.subtract(FrequencyAnalyzer())
+
+    assert loaded.word_frequencies == {}
+    assert (loaded.total_words, loaded.unique_words) == (0, 0)
+    assert loaded.get_statistics()["total_words"] == 0
+
+
+def test_saved_estimates_stay_estimates(tmp_path):
+    approximate = FrequencyAnalyzer()
+    approximate.analyze_approximate([{"casa": 3, "perro": 1, "gato": 1}], top_k=2, sketch_width=64)
+    approximate.save(tmp_path / "approx.frq")
+
+    merged = FrequencyAnalyzer()
+    merged.analyze_counts({"casa": 1})
+    merged.merge(FrequencyAnalyzer.load(tmp_path / "approx.frq"))
+
+    assert merged.estimated
+    assert merged.max_overestimate == approximate.max_overestimate
+    assert merged.get_statistics()["estimated"] is True
+
+
+def test_update_adds_words_or_counts():
+    analyzer = FrequencyAnalyzer()
+    analyzer.update(["casa", "casa"])
+    analyzer.update({"casa": 1, "perro": 2})
+
+    assert analyzer.word_frequencies == {"casa": 3, "perro": 2}
+    assert (analyzer.total_words, analyzer.unique_words) == (5, 2)
+
+
+def test_subtract_never_goes_below_zero():
+    analyzer = FrequencyAnalyzer()
+    analyzer.analyze_counts({"casa": 2, "perro": 1})
+    shard = FrequencyAnalyzer()
+    shard.analyze_counts({"casa": 5, "gato": 1})
+
+    analyzer.subtract(shard)
+
+    assert analyzer.word_frequencies == {"perro": 1}
+    assert (analyzer.total_words, analyzer.unique_words) == (1, 1)
+
+
+def test_load_rejects_other_versions(tmp_path):
+    path = tmp_path / "old.frq"
+    path.write_bytes(FrequencyAnalyzer.MAGIC + (1).to_bytes(4, "little") + bytes(16))
+
+    with pytest.raises(ValueError, match="version"):
+        FrequencyAnalyzer.load(path)
@@ -0,0 +1,68 @@
+"""Tests for FrequencyIndex, checked against brute-force scans."""
+
+import random
+import statistics
+
+import pytest
+
+from subtitle_analyzer import FrequencyIndex
+
+
+def random_frequencies(seed, size):
+    rng = random.Random(seed)
+    return {f"w{i}": int(rng.paretovariate(1.2)) for i in range(size)}
+
+
+def brute_threshold(frequencies, target, min_threshold, max_threshold):
+    for threshold in range(min_threshold, max_threshold):
+        if sum(1 for value in frequencies.values() if value >= threshold) <= target:
+            return threshold
+    return None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_threshold_for_target_matches_scan(seed):
+    frequencies = random_frequencies(seed, 500)
+    index = FrequencyIndex(frequencies)
+
+    for target in (0, 1, 5, 20, 100, 499, 500, 1000):
+        for min_threshold, max_threshold in ((1, 100), (2, 100), (3, 10), (5, 5)):
+            assert index.threshold_for_target(target, min_threshold, max_threshold) == brute_threshold(
+                frequencies, target, min_threshold, max_threshold
+            ), (target, min_threshold, max_threshold)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_value_at_rank_matches_sorted_values(seed):
+    frequencies = random_frequencies(seed, 300)
+    index = FrequencyIndex(frequencies)
+    descending = sorted(frequencies.values(), reverse=True)
+
+    assert [index.value_at_rank(rank) for rank in range(len(descending))] == descending
+    assert index.median() == statistics.median(descending)
+    with pytest.raises(IndexError):
+        index.value_at_rank(len(descending))
+    with pytest.raises(IndexError):
+        index.value_at_rank(-1)
+
+
+def test_hand_computed_table():
+    index = FrequencyIndex({"a": 5, "b": 3, "c": 3, "d": 1})
+
+    assert index.histogram == {1: 1, 3: 2, 5: 1}
+    assert [index.count_at_least(t) for t in (0, 1, 2, 3, 4, 5, 6)] == [4, 4, 3, 3, 1, 1, 0]
+    assert [index.value_at_rank(rank) for rank in range(4)] == [5, 3, 3, 1]
+    assert index.threshold_for_target(1, min_threshold=1) == 4
+    assert index.threshold_for_target(3, min_threshold=1) == 2
+    assert index.threshold_for_target(0, min_threshold=1, max_threshold=6) is None
+    assert index.total_words == 12
+    assert index.median() == 3
+
+
+def test_empty_table():
+    index = FrequencyIndex({})
+
+    assert index.threshold_for_target(0) == 2
+    assert index.median() == 0
+    with pytest.raises(IndexError):
+        index.value_at_rank(0)
@@ -0,0 +1,76 @@
+"""Tests for KnownWordsIndex."""
+
+from subtitle_analyzer import KnownWordsIndex, WordProcessor
+
+
+class FakeConnector:
+    """In-memory stand-in for AnkiConnector that records notesInfo requests."""
+
+    def __init__(self, notes):
+        self.notes = notes  # note id -> (mod time, word field value)
+        self.info_requests = []
+
+    def find_notes(self, query):
+        return sorted(self.notes)
+
+    def notes_mod_time(self, note_ids):
+        return [{"noteId": note_id, "mod": self.notes[note_id][0]} for note_id in note_ids]
+
+    def notes_info(self, note_ids):
+        self.info_requests.append(list(note_ids))
+        return [
+            {
+                "noteId": note_id,
+                "fields": {
+                    "Back": {"value": "ignored", "order": 1},
+                    "Front": {"value": self.notes[note_id][1], "order": 0},
+                },
+            }
+            for note_id in note_ids
+        ]
+
+
+def test_refresh_counts_added_updated_removed_and_unchanged(tmp_path):
+    connector = FakeConnector({1: (10, "casa"), 2: (10, "perro"), 3: (10, "gato"), 4: (10, "sol")})
+    index = KnownWordsIndex(tmp_path / "known.json")
+
+    assert index.refresh(connector, "Español", chunk_size=3) == {"added": 4, "unchanged": 0}
+    assert connector.info_requests == [[1, 2, 3], [4]]
+
+    connector.notes[2] = (11, "<b>perros</b>&nbsp;[sound:perros.mp3]")
+    del connector.notes[3]
+    connector.notes[5] = (12, "luna")
+    connector.info_requests = []
+
+    stats = index.refresh(connector, "Español", chunk_size=3)
+
+    assert stats == {"added": 1, "updated": 1, "removed": 1, "unchanged": 2}
+    assert connector.info_requests == [[2, 5]]
+    assert index.get_count() == 4
+    assert index.words(WordProcessor()) == {"casa", "perros", "sol", "luna"}
+
+
+def test_unchanged_deck_fetches_no_notes(tmp_path):
+    connector = FakeConnector({1: (10, "casa"), 2: (10, "perro")})
+    index = KnownWordsIndex(tmp_path / "known.json")
+    index.refresh(connector, "Español")
+    index.save()
+    connector.info_requests = []
+
+    reloaded = KnownWordsIndex(tmp_path / "known.json")
+    stats = reloaded.refresh(connector, "Español")
+
+    assert stats == {"unchanged": 2}
+    assert connector.info_requests == []
+    assert reloaded.words(WordProcessor()) == {"casa", "perro"}
+
+
+def test_changing_the_word_field_refetches_every_note(tmp_path):
+    connector = FakeConnector({1: (10, "casa"), 2: (10, "perro")})
+    index = KnownWordsIndex(tmp_path / "known.json")
+    index.refresh(connector, "Español")
+
+    stats = index.refresh(connector, "Español", field="Back")
+
+    assert stats == {"added": 2, "unchanged": 0}
+    assert index.words(WordProcessor()) == {"ignored"}
@@ -0,0 +1,40 @@
+"""Tests that the NumPy frequency backend matches the Python one."""
+
+import random
+from array import array
+
+import pytest
+
+from subtitle_analyzer import FrequencyAnalyzer, ReportGenerator, Vocabulary
+
+pytest.importorskip("numpy")
+
+
+def run(backend, totals, ids, vocabulary, output_dir):
+    analyzer = FrequencyAnalyzer(backend=backend)
+    frequencies = analyzer.analyze_ids(totals, iter(ids), vocabulary)
+    return (
+        frequencies,
+        analyzer.get_statistics(),
+        analyzer.get_frequency_distribution(),
+        analyzer.calculate_smart_threshold(50),
+        analyzer.get_top_n(20),
+        ReportGenerator(output_dir, backend)._calculate_distribution(frequencies),
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_backends_give_identical_results(tmp_path, size):
+    rng = random.Random(size)
+    vocabulary = Vocabulary()
+    for word_id in range(size):
+        vocabulary.intern(f"palabra{word_id}")
+    totals = array("q", (int(rng.paretovariate(0.8)) for _ in range(size)))
+    ids = [word_id for word_id in range(size) if word_id % 3]  # filtered subset, in order
+
+    assert run("python", totals, ids, vocabulary, tmp_path) == run("numpy", totals, ids, vocabulary, tmp_path)
+
+
+def test_backends_agree_on_no_words(tmp_path):
+    vocabulary = Vocabulary()
+    assert run("python", array("q"), [], vocabulary, tmp_path) == run("numpy", array("q"), [], vocabulary, tmp_path)
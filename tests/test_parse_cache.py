@@ -0,0 +1,104 @@
+"""Tests for ParseCache."""
+
+from array import array
+from collections import Counter
+
+import pytest
+
+from subtitle_analyzer import ParseCache
+
+SETTINGS = {
+    "min_word_length": 2,
+    "keep_accents": True,
+    "lowercase": True,
+    "language": "ES",
+    "cue_filter": [r"^\[.*\]$"],
+    "sentences": [1500, 4],
+}
+
+
+def make_cache(tmp_path, **overrides):
+    return ParseCache(tmp_path / "cache", {**SETTINGS, **overrides})
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"language": "FR"},
+        {"cue_filter": []},
+        {"sentences": None},
+        {"sentences": [1000, 4]},
+        {"min_word_length": 3},
+    ],
+)
+def test_key_depends_on_settings(tmp_path, override):
+    data = b"1\n00:00:01,000 --> 00:00:02,000\nhola\n"
+
+    assert make_cache(tmp_path, **override).make_key(data) != make_cache(tmp_path).make_key(data)
+
+
+def test_key_depends_on_content_and_skipped_cues(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key(b"hola")
+
+    assert cache.make_key(b"hola") == key
+    assert cache.make_key(b"hola!") != key
+    assert cache.make_key(b"hola", [7]) != key
+    assert cache.make_key(b"hola", [7, 3]) == cache.make_key(b"hola", [3, 7])
+
+
+def test_changed_content_misses(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put(cache.make_key(b"old"), Counter(hola=2), {"hola": "hola hola"})
+
+    assert cache.get(cache.make_key(b"new")) is None
+
+
+def test_round_trip(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key(b"data")
+    cache.put(key, Counter(ñandú=2), {"ñandú": "el ñandú"}, {5: "la la"}, Counter(brackets=1))
+
+    entry = make_cache(tmp_path).get(key)
+
+    assert entry["counts"] == Counter(ñandú=2)
+    assert entry["contexts"] == {"ñandú": "el ñandú"}
+    assert entry["suppressed"] == {5: "la la"}
+    assert entry["removed"] == Counter(brackets=1)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ['{"counts": {"hola": 1}, "cont', "not json", '{"contexts": {}}', '{"counts": 5, "contexts": {}}', "[]"],
+)
+def test_corrupt_or_partial_entry_is_a_miss(tmp_path, contents):
+    cache = make_cache(tmp_path)
+    key = cache.make_key(b"data")
+    (cache.cache_dir / f"{key}.json").write_text(contents, encoding="utf-8")
+
+    assert cache.get(key) is None
+
+    cache.put(key, Counter(hola=1), {"hola": "hola"})
+    assert cache.get(key)["counts"] == Counter(hola=1)
+
+
+def test_cue_hashes_round_trip_and_truncated_file_misses(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key(b"data")
+    assert cache.get_hashes(key) is None
+
+    cache.put_hashes(key, array("Q", [1, 2**64 - 1]))
+    assert cache.get_hashes(key) == array("Q", [1, 2**64 - 1])
+
+    (cache.cache_dir / f"{key}.hashes").write_bytes(b"\x01" * 12)
+    assert cache.get_hashes(key) is None
+
+
+def test_rebuild_discards_entries(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key(b"data")
+    cache.put(key, Counter(hola=1), {})
+
+    rebuilt = ParseCache(tmp_path / "cache", SETTINGS, rebuild=True)
+
+    assert rebuilt.get(key) is None
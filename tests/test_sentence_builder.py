@@ -0,0 +1,45 @@
+"""Tests for SentenceBuilder."""
+
+import pytest
+
+from subtitle_analyzer import Cue, SentenceBuilder
+
+
+@pytest.mark.parametrize(
+    "previous, line, gap_ms, expected",
+    [
+        ("Te lo dije", "ayer por la tarde.", 0, True),
+        ("Te lo dije", "Ayer por la tarde.", 0, True),
+        ("Te lo dije.", "Ayer por la tarde.", 0, False),
+        ("Te lo dije...", "y luego se fue.", 0, True),
+        ("Vino el Sr.", "gómez a verme.", 0, True),
+        ("¿Vienes?", "<i>¡Claro!</i>", 0, False),
+        ("Dijo: «basta.»", "Y se fue.", 0, False),
+        ("<i>Ya voy.</i>", "Espera.", 0, False),
+        ("Te lo dije", "- ¿Qué?", 0, False),
+        ("Te lo dije", "— Nada.", 0, False),
+        ("Te lo dije", "ayer.", 1500, True),
+        ("Te lo dije", "ayer.", 1501, False),
+        ("Bien.", "123 ...", 0, False),
+    ],
+)
+def test_continues(previous, line, gap_ms, expected):
+    assert SentenceBuilder(max_gap_ms=1500)._continues(previous, line, gap_ms) is expected
+
+
+def test_iter_sentences_joins_continuation_cues_up_to_max_cues():
+    cues = [
+        Cue(1, 0, 900, ("Cuando llegué",)),
+        Cue(2, 1000, 1900, ("a la casa",)),
+        Cue(3, 2000, 2900, ("no había nadie.",)),
+        Cue(4, 3000, 3900, ("- ¿Nadie?", "- Nadie.")),
+    ]
+
+    sentences = list(SentenceBuilder(max_cues=2).iter_sentences(cues))
+
+    assert [(s.text, s.cue_start, s.cue_end) for s in sentences] == [
+        ("Cuando llegué a la casa", 0, 2),
+        ("no había nadie.", 2, 3),
+        ("- ¿Nadie?", 3, 4),
+        ("- Nadie.", 3, 4),
+    ]
@@ -0,0 +1,59 @@
+"""Tests for SpaceSaving heavy-hitter error bounds."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from subtitle_analyzer import FrequencyAnalyzer, SpaceSaving
+
+
+def zipf_words(n, vocabulary, seed=0):
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    return rng.choices([f"palabra{i}" for i in range(vocabulary)], weights, k=n)
+
+
+def test_counts_bracket_the_true_count():
+    words = zipf_words(20000, 3000)
+    truth = Counter(words)
+    summary = SpaceSaving(capacity=100)
+    for word in words:
+        summary.add(word)
+
+    bound = summary.error_bound()
+    assert len(summary.counts) == 100
+    for word, count, error in summary.items():
+        assert count - error <= truth[word] <= count
+        assert error <= bound
+    for word, count in truth.items():
+        if count > bound:
+            assert word in summary.counts
+
+
+def test_items_are_sorted_by_count():
+    summary = SpaceSaving(capacity=3)
+    for word, count in [("a", 1), ("b", 5), ("c", 3)]:
+        summary.add(word, count)
+    assert [word for word, _, _ in summary.items()] == ["b", "c", "a"]
+
+
+def test_rejects_zero_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(capacity=0)
+
+
+def test_approximate_analysis_stays_within_max_overestimate():
+    words = zipf_words(20000, 3000, seed=1)
+    truth = Counter(words)
+    batches = [Counter(words[start:start + 500]) for start in range(0, len(words), 500)]
+    analyzer = FrequencyAnalyzer()
+
+    estimates = analyzer.analyze_approximate(batches, top_k=200, sketch_width=1024, sketch_depth=4)
+
+    assert len(estimates) == 200
+    assert analyzer.total_words == len(words)
+    for word, estimate in estimates.items():
+        assert truth[word] <= estimate <= truth[word] + analyzer.max_overestimate
+    for word, _ in truth.most_common(20):
+        assert word in estimates
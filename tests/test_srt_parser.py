@@ -0,0 +1,50 @@
+"""Tests for SRTParser tokenization."""
+
+from subtitle_analyzer import CueDeduplicator, ParseCache, SRTParser, WordProcessor
+
+THEME = "la la theme song"
+
+
+def write_episodes(dirpath, count):
+    for i in range(count):
+        text = f"1\n00:00:01,000 --> 00:00:02,000\n{THEME}\n\n2\n00:00:03,000 --> 00:00:04,000\nepisode{i} dialogue\n"
+        (dirpath / f"e{i:02}.srt").write_text(text, encoding="utf-8")
+
+
+def tokenize(dirpath, cache):
+    parser = SRTParser()
+    parsed = parser.tokenize_directory(
+        dirpath, WordProcessor(), cache=cache, deduplicator=CueDeduplicator(max_files=2)
+    )
+    return parser, parsed
+
+
+def test_dedup_with_cache_skips_reparsing_unchanged_files(tmp_path, monkeypatch):
+    subtitles = tmp_path / "subs"
+    subtitles.mkdir()
+    write_episodes(subtitles, 4)
+    cache = ParseCache(tmp_path / "cache", {"min_word_length": 2})
+    _, first = tokenize(subtitles, cache)
+
+    parsed_names = []
+    iter_cue_records = SRTParser._iter_cue_records
+
+    def counting_iter_cue_records(self, name, lines):
+        parsed_names.append(name)
+        return iter_cue_records(self, name, lines)
+
+    monkeypatch.setattr(SRTParser, "_iter_cue_records", counting_iter_cue_records)
+    parser, second = tokenize(subtitles, cache)
+
+    assert parsed_names == []
+    assert {name: tokens.counts for name, tokens in second.items()} == {
+        name: tokens.counts for name, tokens in first.items()
+    }
+    assert sum(tokens.counts["theme"] for tokens in second.values()) == 1
+    assert parser.files_processed == sorted(first)
+
+    (subtitles / "e01.srt").write_text("1\n00:00:01,000 --> 00:00:02,000\nnew line\n", encoding="utf-8")
+    tokenize(subtitles, cache)
+
+    # The edited file is hashed and tokenized again; nothing else is
+    assert set(parsed_names) == {"e01.srt"}
@@ -0,0 +1,31 @@
+"""Tests for StopWordManager patterns."""
+
+import pytest
+
+from subtitle_analyzer import StopWordManager
+
+
+def test_backreference_after_other_patterns(tmp_path):
+    manager = StopWordManager(tmp_path / "none.txt", [r"\d+", r"(je)\1+"])
+    assert manager.is_stopword("jejeje")
+    assert not manager.is_stopword("jeje1")
+
+
+def test_no_patterns_by_default(tmp_path):
+    stopwords_file = tmp_path / "stopwords.txt"
+    stopwords_file.write_text("# header\nde\nla\n", encoding="utf-8")
+    manager = StopWordManager(stopwords_file)
+
+    assert manager.patterns == []
+    words = ["De", "casa", "jajaja", "mmm", "2do", "la"]
+    assert manager.filter_words(words) == ["casa", "jajaja", "mmm", "2do"]
+
+
+def test_patterns_are_opt_in(tmp_path):
+    assert not StopWordManager(tmp_path / "none.txt").is_stopword("jajaja")
+    assert StopWordManager(tmp_path / "none.txt", [r"(?:ja){2,}"]).is_stopword("jajaja")
+
+
+def test_invalid_pattern_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match=r"\[a-"):
+        StopWordManager(tmp_path / "none.txt", [r"[a-"])
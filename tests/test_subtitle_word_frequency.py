@@ -0,0 +1,124 @@
+"""Tests for the subtitle word frequency pipeline."""
+
+import yaml
+
+from subtitle_word_frequency import SubtitleFrequencyAnalyzer
+
+
+def write_srt(path, *texts):
+    """Write one cue per text, one second apart."""
+    cues = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\n{text}\n"
+        for i, text in enumerate(texts, start=1)
+    ]
+    path.write_text("\n".join(cues), encoding="utf-8")
+
+
+def make_analyzer(tmp_path, **sections):
+    """Analyzer over tmp_path/subs writing to tmp_path/out, without the English filter."""
+    (tmp_path / "subs").mkdir(exist_ok=True)
+    stopwords_file = tmp_path / "stopwords.txt"
+    stopwords_file.write_text("de\nla\n", encoding="utf-8")
+    config = {
+        "paths": {
+            "subtitles_directory": str(tmp_path / "subs"),
+            "output_directory": str(tmp_path / "out"),
+            "stopwords_file": str(stopwords_file),
+        },
+        "english_filter": {"enabled": False},
+        "frequency": {"threshold_mode": "manual", "min_frequency": 1},
+        "output": {"generate_markdown": False, "generate_anki_list": False},
+        "advanced": {"verbose": False},
+        **sections,
+    }
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    return SubtitleFrequencyAnalyzer(config_path)
+
+
+def test_config_without_stopword_patterns_counts_every_word(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    write_srt(tmp_path / "subs" / "e01.srt", "jajaja la casa", "mmm de la casa")
+
+    results = analyzer.analyze()
+
+    assert results["frequencies"] == {"casa": 2, "jajaja": 1, "mmm": 1}
+
+
+def test_watch_update_matches_a_fresh_run(tmp_path):
+    subs = tmp_path / "subs"
+    analyzer = make_analyzer(tmp_path)
+    write_srt(subs / "e01.srt", "la casa roja", "casa perro")
+    write_srt(subs / "e02.srt", "gato gato perro")
+    analyzer.analyze()
+
+    write_srt(subs / "e01.srt", "la casa azul", "de la casa")
+    (subs / "e02.srt").unlink()
+    write_srt(subs / "e03.srt", "perro azul")
+    analyzer._apply_file_changes([subs / "e01.srt", subs / "e03.srt"], [subs / "e02.srt"])
+
+    fresh = make_analyzer(tmp_path).analyze()
+    assert analyzer.frequency_analyzer.word_frequencies == fresh["frequencies"]
+    assert analyzer._removed_words["stopwords"] == 3
+
+
+def test_watch_update_drops_contexts_of_removed_files(tmp_path):
+    subs = tmp_path / "subs"
+    analyzer = make_analyzer(tmp_path, sentences={"enabled": False})
+    write_srt(subs / "e01.srt", "la casa roja")
+    write_srt(subs / "e02.srt", "el gato negro")
+    analyzer.analyze()
+    assert analyzer._sentence_context["gato"] == "el gato negro"
+
+    write_srt(subs / "e01.srt", "la casa azul")
+    (subs / "e02.srt").unlink()
+    analyzer._apply_file_changes([subs / "e01.srt"], [subs / "e02.srt"])
+
+    assert analyzer._sentence_context == {"la": "la casa azul", "casa": "la casa azul", "azul": "la casa azul"}
+
+
+def test_approximate_counts_each_file_before_the_next_is_parsed(tmp_path, monkeypatch):
+    subs = tmp_path / "subs"
+    analyzer = make_analyzer(
+        tmp_path,
+        approximate_counting={"enabled": True, "top_k": 2, "sketch_width": 256},
+        parse_cache={"enabled": False},
+        sentences={"enabled": False},
+    )
+    write_srt(subs / "e01.srt", "casa casa perro")
+    write_srt(subs / "e02.srt", "casa gato de")
+    write_srt(subs / "e03.srt", "luna sol casa")
+    parsed, fed = [], []
+    tokenize_source = analyzer.parser.tokenize_source
+    add_approximate = analyzer.frequency_analyzer.add_approximate
+    monkeypatch.setattr(
+        analyzer.parser, "tokenize_source",
+        lambda *args, **kwargs: parsed.append(1) or tokenize_source(*args, **kwargs),
+    )
+    monkeypatch.setattr(
+        analyzer.frequency_analyzer, "add_approximate",
+        lambda counts: fed.append(len(parsed)) or add_approximate(counts),
+    )
+
+    results = analyzer.analyze()
+
+    assert fed == [1, 2, 3]
+    assert results["frequencies"]["casa"] == 4
+    assert all(not file_tokens.counts for file_tokens in analyzer._parsed_data.values())
+    assert set(analyzer._sentence_context) <= set(results["frequencies"])
+    assert analyzer._extracted_words == 9
+    assert analyzer._removed_words["stopwords"] == 1
+
+
+def test_parse_cache_key_follows_language_cue_filter_and_sentences(tmp_path):
+    def cache_key(**sections):
+        analyzer = make_analyzer(tmp_path, **sections)
+        return analyzer._create_parse_cache().make_key(b"hola")
+
+    default = cache_key()
+
+    assert cache_key() == default
+    assert cache_key(translation={"source_lang": "FR"}) != default
+    assert cache_key(cue_filter={"enabled": False}) != default
+    assert cache_key(sentences={"enabled": False}) != default
+    assert cache_key(sentences={"max_gap_ms": 500}) != default
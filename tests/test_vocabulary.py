@@ -0,0 +1,30 @@
+"""Tests for Vocabulary id interning and id-indexed totals."""
+
+from array import array
+
+from subtitle_analyzer import Vocabulary
+
+
+def test_add_counts_interns_in_first_seen_order():
+    vocabulary = Vocabulary()
+    totals = array("q")
+
+    ids = vocabulary.add_counts(totals, {"casa": 2, "perro": 1})
+    more = vocabulary.add_counts(totals, {"perro": 3, "gato": 1})
+
+    assert list(ids) == [0, 1]
+    assert list(more) == [1, 2]
+    assert [vocabulary.word(word_id) for word_id in range(len(vocabulary))] == ["casa", "perro", "gato"]
+    assert list(totals) == [2, 4, 1]
+
+
+def test_subtracting_counts_leaves_ids_in_place():
+    vocabulary = Vocabulary()
+    totals = array("q")
+    vocabulary.add_counts(totals, {"casa": 2, "perro": 1})
+
+    vocabulary.add_counts(totals, {"casa": 2}, sign=-1)
+
+    assert list(totals) == [0, 1]
+    assert vocabulary.get("casa") == 0
+    assert vocabulary.get("gato") is None
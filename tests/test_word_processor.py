@@ -0,0 +1,139 @@
+"""Tests for WordProcessor, checked against the original stepwise tokenizer."""
+
+import pickle
+import random
+import re
+import unicodedata
+
+import pytest
+
+from subtitle_analyzer import WordProcessor
+
+LINES = [
+    "¿Qué pasó, Sr. Gómez? ¡No lo sé!",
+    "- Ñandú, pingüino y ACCIÓN...",
+    "<i>l'amour, bien-être -- 'hola' -adiós-</i>",
+    "123 abc_1 __ _a_ 4x4 año-2000",
+    "İstanbul ΣΑΣ Σίσυφος ǅemal ﬁne",
+    "café CAFÉ café Über straße",
+    "mmm... ¿eh? ¡¡¡AAAH!!!",
+]
+CHARS = "äößèìòÈλ²aáZ-'_ 1.,¿?İéÑḉΣǅ́ΑΒ"
+
+
+def sample_lines():
+    rng = random.Random(7)
+    generated = ["".join(rng.choice(CHARS) for _ in range(rng.randint(1, 12))) for _ in range(2000)]
+    return LINES + generated
+
+
+def baseline_process_text(text, min_word_length=2, keep_accents=True, lowercase=True):
+    """process_text() as it was before the fused path, caches and profiles."""
+    processed = []
+    for word in re.findall(r"\b[\w\-\']+\b", text):
+        word = word.strip()
+        if lowercase:
+            word = word.lower()
+        word = re.sub(r"^[^\w]+|[^\w]+$", "", word, flags=re.UNICODE)
+        if not keep_accents:
+            nfd = unicodedata.normalize("NFD", word)
+            word = unicodedata.normalize(
+                "NFC", "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+            )
+        if len(word) >= min_word_length and re.search(r"[a-záéíóúñüA-ZÁÉÍÓÚÑÜ]", word):
+            processed.append(word)
+    return processed
+
+
+SETTINGS = [
+    (min_word_length, keep_accents, lowercase)
+    for min_word_length in (1, 2, 3)
+    for keep_accents in (True, False)
+    for lowercase in (True, False)
+]
+
+
+@pytest.mark.parametrize("min_word_length, keep_accents, lowercase", SETTINGS)
+def test_cached_processor_matches_baseline(min_word_length, keep_accents, lowercase):
+    processor = WordProcessor(
+        min_word_length, keep_accents, lowercase, word_cache_size=64, line_cache_size=64
+    )
+
+    for _ in range(2):
+        for line in sample_lines():
+            assert processor.process_text(line) == baseline_process_text(
+                line, min_word_length, keep_accents, lowercase
+            ), line
+
+
+def test_line_cache_returns_fresh_lists_and_counts_hits():
+    processor = WordProcessor(keep_accents=False, word_cache_size=8, line_cache_size=8)
+
+    first = processor.process_text("Sí, señor")
+    first.append("mutated")
+
+    assert processor.process_text("Sí, señor") == ["si", "senor"]
+    stats = processor.cache_stats()
+    assert stats["line_hits"] == 1
+    assert stats["line_misses"] == 1
+
+
+def test_pickled_processor_starts_with_empty_caches():
+    processor = WordProcessor(word_cache_size=8, line_cache_size=8)
+    processor.process_text("hola hola")
+
+    copy = pickle.loads(pickle.dumps(processor))
+
+    assert sum(copy.cache_stats().values()) == 0
+    assert copy.process_text("hola hola") == ["hola", "hola"]
+
+
+def test_accent_table_matches_nfd_stripping():
+    processor = WordProcessor(keep_accents=False)
+    rng = random.Random(3)
+    texts = [chr(code) for code in range(0x250)]
+    texts += ["".join(rng.choice(CHARS + "ñÅǽ") for _ in range(8)) for _ in range(2000)]
+
+    for text in texts:
+        assert processor._remove_accents(text) == processor._remove_accents_nfd(text), text
+
+
+@pytest.mark.parametrize("min_word_length", [1, 2, 3])
+def test_uncached_accent_stripping_matches_baseline(min_word_length):
+    processor = WordProcessor(min_word_length, keep_accents=False)
+
+    for line in sample_lines():
+        assert processor.process_text(line) == baseline_process_text(
+            line, min_word_length, keep_accents=False
+        ), line
+
+
+@pytest.mark.parametrize("language", ["es", "ES", "es-MX"])
+def test_spanish_profile_matches_baseline(language):
+    processor = WordProcessor(language=language)
+
+    for line in sample_lines():
+        assert processor.process_text(line) == baseline_process_text(line), line
+
+
+@pytest.mark.parametrize(
+    "language, line, expected",
+    [
+        ("es", "öß èè çç λόγος", []),
+        ("de", "öß èè çç λόγος", ["öß"]),
+        ("it", "öß èè çç λόγος", ["èè"]),
+        ("it", "perché è così", ["perché", "così"]),
+        ("fr", "öß èè çç λόγος", ["öß", "èè", "çç", "λόγος"]),
+    ],
+)
+def test_language_profiles(language, line, expected):
+    assert WordProcessor(language=language).process_text(line) == expected
+
+
+@pytest.mark.parametrize("language", ["es", "de", "it", "fr"])
+@pytest.mark.parametrize("min_word_length, keep_accents, lowercase", SETTINGS)
+def test_fused_path_matches_stepwise(language, min_word_length, keep_accents, lowercase):
+    processor = WordProcessor(min_word_length, keep_accents, lowercase, language=language)
+
+    for line in sample_lines():
+        assert processor.process_text(line) == processor.process_text_stepwise(line), line